@@ -1,5 +1,7 @@
 --!strict
 
+local Json = require(script.Parent.Parent:WaitForChild("telemetry"):WaitForChild("json"))
+
 local Optimiser = {}
 Optimiser.__index = Optimiser
 
@@ -133,73 +135,6 @@ local function ensureDirectory(path: string?): boolean
     return false
 end
 
-local function encodeJSONString(value: string): string
-    value = value:gsub("\\", "\\\\")
-    value = value:gsub('"', '\\"')
-    value = value:gsub("\b", "\\b")
-    value = value:gsub("\f", "\\f")
-    value = value:gsub("\n", "\\n")
-    value = value:gsub("\r", "\\r")
-    value = value:gsub("\t", "\\t")
-    return '"' .. value .. '"'
-end
-
-local function isArray(value: { [any]: any }): (boolean, number)
-    local count = 0
-    local maxIndex = 0
-    for key in pairs(value) do
-        if type(key) ~= "number" then
-            return false, 0
-        end
-        if key > maxIndex then
-            maxIndex = key
-        end
-        count += 1
-    end
-    if maxIndex == 0 then
-        return true, 0
-    end
-    return maxIndex == count, maxIndex
-end
-
-local function encodeJSON(value: any): string
-    local valueType = type(value)
-    if valueType == "string" then
-        return encodeJSONString(value)
-    elseif valueType == "number" then
-        if value ~= value or value == math.huge or value == -math.huge then
-            return "null"
-        end
-        return tostring(value)
-    elseif valueType == "boolean" then
-        return tostring(value)
-    elseif value == nil then
-        return "null"
-    elseif valueType == "table" then
-        local asArray, length = isArray(value)
-        if asArray then
-            local entries = table.create(length)
-            for index = 1, length do
-                entries[index] = encodeJSON(value[index])
-            end
-            return "[" .. table.concat(entries, ",") .. "]"
-        end
-
-        local entries = {}
-        for key, entryValue in pairs(value) do
-            local keyType = type(key)
-            if keyType == "string" or keyType == "number" then
-                local entry = encodeJSONString(tostring(key)) .. ":" .. encodeJSON(entryValue)
-                entries[#entries + 1] = entry
-            end
-        end
-        table.sort(entries)
-        return "{" .. table.concat(entries, ",") .. "}"
-    end
-
-    return "null"
-end
-
 local function defaultWriter(path: string, contents: string): (boolean, string?)
     local ok, handle = pcall(io.open, path, "w")
     if not ok or not handle then
@@ -211,6 +146,15 @@ local function defaultWriter(path: string, contents: string): (boolean, string?)
     return true, nil
 end
 
+-- The default writer streams straight to disk; custom writers receive the
+-- fully encoded document.
+local function writeJSON(writer, path: string, value: any): (boolean, string?)
+    if writer == defaultWriter then
+        return Json.writeFile(path, value)
+    end
+    return writer(path, Json.encode(value))
+end
+
 local function clamp(bounds, value: number): number
     if type(bounds) ~= "table" then
         return value
@@ -552,15 +496,12 @@ function Optimiser:flushArtifacts(options: FlushOptions?): (boolean, { [string]:
         recommendations = self:getRecommendations(),
     }
 
-    local traceContents = encodeJSON(tracePayload)
-    local recommendationsContents = encodeJSON(recommendationPayload)
-
-    local ok, err = writer(paths.traces, traceContents)
+    local ok, err = writeJSON(writer, paths.traces, tracePayload)
     if not ok then
         return false, nil, err
     end
 
-    ok, err = writer(paths.recommendations, recommendationsContents)
+    ok, err = writeJSON(writer, paths.recommendations, recommendationPayload)
     if not ok then
         return false, nil, err
     end
@@ -4,6 +4,26 @@
 local DEFAULT_FIXED_STEP = 1 / 240
 local ZERO = Vector3.new()
 
+-- Contact broad-phase grid. Cell coordinates are offset and packed into a single
+-- number key; CELL_STRIDE^3 stays below 2^53 so keys remain exact.
+local BROADPHASE_MIN_CELL = 4
+local CELL_OFFSET = 65536
+local CELL_STRIDE = CELL_OFFSET * 2
+
+local DEFAULT_TELEMETRY_CAPACITY = 4096
+local TELEMETRY_LAYOUTS = {
+    steps = true,
+    columnar = true,
+}
+local TELEMETRY_DECIMATION = {
+    every = true,
+    contact = true,
+    adaptive = true,
+}
+local TELEMETRY_ROW_FIELDS = { "entity", "px", "py", "pz", "vx", "vy", "vz", "contact" }
+local DEFAULT_ADAPTIVE_VELOCITY_DELTA = 1
+local DEFAULT_ADAPTIVE_MAX_INTERVAL = 30
+
 local Trajectory = require(script.Parent:WaitForChild("trajectory"))
 
 local function isFiniteNumber(value)
@@ -262,6 +282,28 @@ function Agent:step(dt)
     self:_sampleState(dt)
 end
 
+-- Moves the agent along its current velocity for `span` seconds without
+-- sampling, used when the world skips idle steps analytically.
+function Agent:_drift(span)
+    local instance = self.instance
+    if not instance then
+        return
+    end
+
+    local velocity = instance.AssemblyLinearVelocity
+    if typeof(velocity) ~= "Vector3" or velocity.Magnitude <= 0 then
+        return
+    end
+
+    local newPosition = instance.Position + velocity * span
+    instance.Position = newPosition
+    if velocity.Magnitude > 1e-3 then
+        instance.CFrame = CFrame.new(newPosition, newPosition + velocity.Unit)
+    else
+        instance.CFrame = CFrame.new(newPosition)
+    end
+end
+
 local Projectile = {}
 Projectile.__index = Projectile
 
@@ -525,6 +567,200 @@ function Projectile:applyContactResolution(agent, normal, correction, dt)
     end
 end
 
+local function createTelemetryRows(capacity, withContact)
+    return {
+        count = 0,
+        entity = table.create(capacity),
+        px = table.create(capacity),
+        py = table.create(capacity),
+        pz = table.create(capacity),
+        vx = table.create(capacity),
+        vy = table.create(capacity),
+        vz = table.create(capacity),
+        contact = if withContact then table.create(capacity) else nil,
+    }
+end
+
+-- Struct-of-arrays telemetry: one number array per field, with each step
+-- pointing at its first agent/projectile row. Entity names are registered once
+-- and rows store their 1-based index into `agents`/`projectiles`.
+local function createTelemetryColumns(capacity)
+    return {
+        first = 1,
+        t = table.create(capacity),
+        agentStart = table.create(capacity),
+        projectileStart = table.create(capacity),
+        agents = {},
+        projectiles = {},
+        agentRows = createTelemetryRows(capacity, false),
+        projectileRows = createTelemetryRows(capacity, true),
+        agentLookup = {},
+        projectileLookup = {},
+        entitySlots = setmetatable({}, { __mode = "k" }),
+    }
+end
+
+local function resetTelemetry(telemetry)
+    telemetry.first = 1
+    telemetry.steps = {}
+    telemetry.columns = if telemetry.layout == "columnar" then createTelemetryColumns(telemetry.capacity) else nil
+    telemetry.sinceRecord = math.huge
+    telemetry.contactActive = false
+    telemetry.lastVelocity = setmetatable({}, { __mode = "k" })
+    telemetry.decimated = 0
+    telemetry.evicted = 0
+    telemetry.spillAt = telemetry.maxSteps
+    return telemetry
+end
+
+local function createTelemetry(options)
+    options = if typeof(options) == "table" then options else {}
+
+    local layout = options.layout or "columnar"
+    if not TELEMETRY_LAYOUTS[layout] then
+        error(string.format("World: unknown telemetry layout %q", tostring(layout)), 3)
+    end
+
+    local decimation = options.decimation
+    if decimation ~= nil and not TELEMETRY_DECIMATION[decimation] then
+        error(string.format("World: unknown telemetry decimation %q", tostring(decimation)), 3)
+    end
+
+    local maxSteps = options.maxSteps
+    if maxSteps ~= nil then
+        if typeof(maxSteps) ~= "number" or maxSteps < 1 then
+            error("World: telemetry.maxSteps must be a positive number", 3)
+        end
+        maxSteps = math.floor(maxSteps)
+    end
+
+    local spill = options.spill
+    if spill ~= nil and typeof(spill) ~= "function" then
+        error("World: telemetry.spill must be a function", 3)
+    end
+
+    local capacity = options.capacity
+    if typeof(capacity) ~= "number" or capacity < 1 then
+        capacity = DEFAULT_TELEMETRY_CAPACITY
+    end
+    capacity = math.floor(capacity)
+    if maxSteps then
+        -- The ring holds at most 2 * maxSteps steps between compactions.
+        capacity = math.min(capacity, maxSteps * 2)
+    end
+
+    return resetTelemetry({
+        layout = layout,
+        capacity = capacity,
+        maxSteps = maxSteps,
+        decimation = decimation,
+        every = math.max(math.floor(tonumber(options.every) or 1), 1),
+        velocityThreshold = tonumber(options.velocityThreshold) or DEFAULT_ADAPTIVE_VELOCITY_DELTA,
+        maxInterval = math.max(math.floor(tonumber(options.maxInterval) or DEFAULT_ADAPTIVE_MAX_INTERVAL), 1),
+        spill = spill,
+        -- Spill failures survive clearTelemetry so a run can report them after flushing.
+        spillFailures = 0,
+        dropped = 0,
+    })
+end
+
+-- Returns a view over rows 1..lastRow without copying; only valid until the
+-- next compaction, so spill callbacks must consume it synchronously.
+local function viewTelemetryRows(rows, lastRow)
+    local view = table.clone(rows)
+    view.count = lastRow
+    return view
+end
+
+local function sliceTelemetryRows(rows, firstRow, lastRow)
+    local count = math.max(lastRow - firstRow + 1, 0)
+    local slice = createTelemetryRows(count, rows.contact ~= nil)
+    for _, field in ipairs(TELEMETRY_ROW_FIELDS) do
+        if rows[field] then
+            table.move(rows[field], firstRow, lastRow, 1, slice[field])
+        end
+    end
+    slice.count = count
+    return slice
+end
+
+-- Steps before `columns.first` have been evicted from the ring.
+local function evictedTelemetryColumns(columns)
+    local last = columns.first - 1
+    return {
+        first = 1,
+        t = table.move(columns.t, 1, last, 1, table.create(last)),
+        agentStart = table.move(columns.agentStart, 1, last, 1, table.create(last)),
+        projectileStart = table.move(columns.projectileStart, 1, last, 1, table.create(last)),
+        agents = columns.agents,
+        projectiles = columns.projectiles,
+        agentRows = viewTelemetryRows(columns.agentRows, columns.agentStart[columns.first] - 1),
+        projectileRows = viewTelemetryRows(columns.projectileRows, columns.projectileStart[columns.first] - 1),
+    }
+end
+
+local function compactTelemetryColumns(columns, capacity)
+    local first = columns.first
+    local last = #columns.t
+    local size = math.max(capacity, last - first + 1)
+    local agentBase = columns.agentStart[first] - 1
+    local projectileBase = columns.projectileStart[first] - 1
+
+    local compacted = {
+        first = 1,
+        t = table.move(columns.t, first, last, 1, table.create(size)),
+        agentStart = table.create(size),
+        projectileStart = table.create(size),
+        agents = columns.agents,
+        projectiles = columns.projectiles,
+        agentRows = sliceTelemetryRows(columns.agentRows, agentBase + 1, columns.agentRows.count),
+        projectileRows = sliceTelemetryRows(columns.projectileRows, projectileBase + 1, columns.projectileRows.count),
+        agentLookup = columns.agentLookup,
+        projectileLookup = columns.projectileLookup,
+        entitySlots = columns.entitySlots,
+    }
+
+    for step = first, last do
+        compacted.agentStart[step - first + 1] = columns.agentStart[step] - agentBase
+        compacted.projectileStart[step - first + 1] = columns.projectileStart[step] - projectileBase
+    end
+
+    return compacted
+end
+
+local function telemetryEntityIndex(columns, names, lookup, entity, name)
+    local index = columns.entitySlots[entity]
+    if index then
+        return index
+    end
+
+    local key = tostring(name or "")
+    index = lookup[key]
+    if not index then
+        index = #names + 1
+        names[index] = key
+        lookup[key] = index
+    end
+    columns.entitySlots[entity] = index
+    return index
+end
+
+local function vectorComponents(vector)
+    if typeof(vector) ~= "Vector3" then
+        return 0, 0, 0
+    end
+    return vector.X, vector.Y, vector.Z
+end
+
+local function appendTelemetryRow(rows, entity, position, velocity)
+    local row = rows.count + 1
+    rows.count = row
+    rows.entity[row] = entity
+    rows.px[row], rows.py[row], rows.pz[row] = vectorComponents(position)
+    rows.vx[row], rows.vy[row], rows.vz[row] = vectorComponents(velocity)
+    return row
+end
+
 local World = {}
 World.__index = World
 
@@ -541,6 +777,9 @@ function World.new(options)
     config.oscillationSpamCooldown = config.oscillationSpamCooldown or 0.15
     config.flightFloorHeight = config.flightFloorHeight or 0
     config.flightSkyThreshold = config.flightSkyThreshold or (config.flightFloorHeight + 18)
+    if config.contactBroadphase == nil then
+        config.contactBroadphase = true
+    end
     if typeof(config.defaultTrajectory) == "table" then
         config.defaultTrajectory = copyDictionary(config.defaultTrajectory)
     end
@@ -556,9 +795,12 @@ function World.new(options)
         projectiles = {},
         volumes = {},
         projectileIndex = {},
-        telemetry = {
-            steps = {},
+        broadphase = {
+            cellSize = 0,
+            cells = {},
+            bounds = {},
         },
+        telemetry = createTelemetry(options.telemetry),
     }
 
     return setmetatable(world, World)
@@ -688,7 +930,7 @@ function World:_resolveSafeRadius(agent)
     return base
 end
 
-function World:_resolveContacts(dt)
+function World:_resolveContactsBruteForce(dt)
     for _, projectile in ipairs(self.projectiles) do
         local instance = projectile.instance
         if instance then
@@ -736,6 +978,214 @@ function World:_resolveContacts(dt)
     end
 end
 
+local function cellCoordinate(value, cellSize)
+    local index = math.floor(value / cellSize)
+    if index < -CELL_OFFSET then
+        index = -CELL_OFFSET
+    elseif index >= CELL_OFFSET then
+        index = CELL_OFFSET - 1
+    end
+    return index + CELL_OFFSET
+end
+
+local function cellKey(x, y, z)
+    return (x * CELL_STRIDE + y) * CELL_STRIDE + z
+end
+
+local function removeFromCell(cells, key, agent)
+    local cell = cells[key]
+    if not cell then
+        return
+    end
+    for index = #cell, 1, -1 do
+        if cell[index] == agent then
+            cell[index] = cell[#cell]
+            cell[#cell] = nil
+            break
+        end
+    end
+    if #cell == 0 then
+        cells[key] = nil
+    end
+end
+
+local function forEachCell(bounds, callback)
+    for x = bounds[1], bounds[4] do
+        for y = bounds[2], bounds[5] do
+            for z = bounds[3], bounds[6] do
+                callback(cellKey(x, y, z))
+            end
+        end
+    end
+end
+
+-- Resolves each agent's latency position and safe radius once per step; the
+-- narrow phase used to recompute both (including the FieldVolume scan) per pair.
+function World:_collectContactAgents()
+    local entries = {}
+    local maxRadius = 0
+    for index, agent in ipairs(self.agents) do
+        if agent.instance then
+            local safeRadius = self:_resolveSafeRadius(agent)
+            entries[agent] = {
+                index = index,
+                position = agent:getLatencyPosition(),
+                safeRadius = safeRadius,
+            }
+            if safeRadius > maxRadius then
+                maxRadius = safeRadius
+            end
+        end
+    end
+    return entries, maxRadius
+end
+
+-- Keeps a uniform grid of agent query spheres. Agents are only re-bucketed when
+-- the cells their sphere overlaps change, and the grid is rebuilt from scratch
+-- only when the cell size (the largest query radius) changes.
+function World:_updateBroadphase(entries, overrideRadius, cellSize)
+    local broadphase = self.broadphase
+    local cells = broadphase.cells
+    local bounds = broadphase.bounds
+
+    if broadphase.cellSize ~= cellSize then
+        broadphase.cellSize = cellSize
+        table.clear(cells)
+        table.clear(bounds)
+    end
+
+    for agent, previous in pairs(bounds) do
+        if not entries[agent] then
+            forEachCell(previous, function(key)
+                removeFromCell(cells, key, agent)
+            end)
+            bounds[agent] = nil
+        end
+    end
+
+    for agent, entry in pairs(entries) do
+        local radius = math.max(entry.safeRadius, overrideRadius)
+        local previous = bounds[agent]
+        if radius <= 0 then
+            if previous then
+                forEachCell(previous, function(key)
+                    removeFromCell(cells, key, agent)
+                end)
+                bounds[agent] = nil
+            end
+        else
+            local position = entry.position
+            local minX = cellCoordinate(position.X - radius, cellSize)
+            local minY = cellCoordinate(position.Y - radius, cellSize)
+            local minZ = cellCoordinate(position.Z - radius, cellSize)
+            local maxX = cellCoordinate(position.X + radius, cellSize)
+            local maxY = cellCoordinate(position.Y + radius, cellSize)
+            local maxZ = cellCoordinate(position.Z + radius, cellSize)
+
+            local unchanged = previous
+                and previous[1] == minX
+                and previous[2] == minY
+                and previous[3] == minZ
+                and previous[4] == maxX
+                and previous[5] == maxY
+                and previous[6] == maxZ
+
+            if not unchanged then
+                if previous then
+                    forEachCell(previous, function(key)
+                        removeFromCell(cells, key, agent)
+                    end)
+                end
+                local current = { minX, minY, minZ, maxX, maxY, maxZ }
+                bounds[agent] = current
+                forEachCell(current, function(key)
+                    local cell = cells[key]
+                    if not cell then
+                        cell = {}
+                        cells[key] = cell
+                    end
+                    cell[#cell + 1] = agent
+                end)
+            end
+        end
+    end
+end
+
+function World:_resolveContacts(dt)
+    if self.config.contactBroadphase == false then
+        self:_resolveContactsBruteForce(dt)
+        return
+    end
+
+    local entries, maxRadius = self:_collectContactAgents()
+
+    local overrideRadius = 0
+    for _, projectile in ipairs(self.projectiles) do
+        local safeRadius = projectile.safeRadius
+        if safeRadius ~= nil and safeRadius > overrideRadius then
+            overrideRadius = safeRadius
+        end
+    end
+
+    local cellSize = math.max(maxRadius, overrideRadius, BROADPHASE_MIN_CELL)
+    self:_updateBroadphase(entries, overrideRadius, cellSize)
+    local cells = self.broadphase.cells
+
+    for _, projectile in ipairs(self.projectiles) do
+        local instance = projectile.instance
+        if instance then
+            local ballPosition = instance.Position
+            local candidates = cells[cellKey(
+                cellCoordinate(ballPosition.X, cellSize),
+                cellCoordinate(ballPosition.Y, cellSize),
+                cellCoordinate(ballPosition.Z, cellSize)
+            )]
+
+            -- Agents are tested in registration order with the first hit winning,
+            -- so keep the lowest-index agent in range.
+            local hitAgent, hitEntry, hitDelta, hitDistance, hitRadius
+            if candidates then
+                for _, agent in ipairs(candidates) do
+                    local entry = entries[agent]
+                    if entry and (not hitEntry or entry.index < hitEntry.index) then
+                        local safeRadius = projectile.safeRadius
+                        if safeRadius == nil then
+                            safeRadius = entry.safeRadius
+                        end
+                        local delta = ballPosition - entry.position
+                        local distance = delta.Magnitude
+                        if safeRadius > 0 and distance < safeRadius then
+                            hitAgent = agent
+                            hitEntry = entry
+                            hitDelta = delta
+                            hitDistance = distance
+                            hitRadius = safeRadius
+                        end
+                    end
+                end
+            end
+
+            if hitAgent then
+                local contactNormal
+                if hitDistance > 1e-6 then
+                    contactNormal = hitDelta.Unit
+                else
+                    contactNormal = Vector3.new(0, 0, 1)
+                end
+                projectile:applyContactResolution(hitAgent, contactNormal, hitRadius - hitDistance, dt)
+
+                projectile.contactLatency += dt
+                if projectile.contactLatency >= projectile.latency then
+                    projectile.contactArmed = true
+                end
+            else
+                projectile.contactLatency = 0
+                projectile.contactArmed = false
+            end
+        end
+    end
+end
+
 function World:_stepFixed(dt)
     for _, agent in ipairs(self.agents) do
         agent:step(dt)
@@ -746,12 +1196,214 @@ function World:_stepFixed(dt)
     end
 
     self:_resolveContacts(dt)
+    self:_recordTelemetry()
+end
 
-    table.insert(self.telemetry.steps, {
-        t = self.now,
-        agents = self:getAgentSamples(),
-        projectiles = self:getProjectileSamples(),
-    })
+local function velocityChanged(lastVelocity, entity, velocity, threshold)
+    local previous = lastVelocity[entity]
+    return previous == nil or (velocity - previous).Magnitude > threshold
+end
+
+function World:_shouldRecordTelemetry()
+    local telemetry = self.telemetry
+    local decimation = telemetry.decimation
+    if decimation == nil then
+        return true
+    end
+
+    telemetry.sinceRecord += 1
+
+    if decimation == "every" then
+        return telemetry.sinceRecord >= telemetry.every
+    end
+
+    if decimation == "contact" then
+        -- Keep every touching step plus the first step after contact ends.
+        local active = false
+        for _, projectile in ipairs(self.projectiles) do
+            if projectile.instance and (projectile.contactLatency > 0 or projectile.contactArmed) then
+                active = true
+                break
+            end
+        end
+        local record = active or telemetry.contactActive
+        telemetry.contactActive = active
+        return record
+    end
+
+    if telemetry.sinceRecord >= telemetry.maxInterval then
+        return true
+    end
+
+    local lastVelocity = telemetry.lastVelocity
+    local threshold = telemetry.velocityThreshold
+    for _, agent in ipairs(self.agents) do
+        local instance = agent.instance
+        if instance and velocityChanged(lastVelocity, agent, instance.AssemblyLinearVelocity or ZERO, threshold) then
+            return true
+        end
+    end
+    for _, projectile in ipairs(self.projectiles) do
+        local instance = projectile.instance
+        if
+            instance
+            and velocityChanged(lastVelocity, projectile, instance.AssemblyLinearVelocity or ZERO, threshold)
+        then
+            return true
+        end
+    end
+
+    return false
+end
+
+function World:_rememberVelocities()
+    local lastVelocity = self.telemetry.lastVelocity
+    for _, agent in ipairs(self.agents) do
+        if agent.instance then
+            lastVelocity[agent] = agent.instance.AssemblyLinearVelocity or ZERO
+        end
+    end
+    for _, projectile in ipairs(self.projectiles) do
+        if projectile.instance then
+            lastVelocity[projectile] = projectile.instance.AssemblyLinearVelocity or ZERO
+        end
+    end
+end
+
+-- Drops the oldest recorded step once the ring is full. Evicted steps are only
+-- released (and spilled) in batches of maxSteps so eviction stays amortised O(1).
+-- A spill that reports failure leaves up to maxSteps evicted steps in place; they
+-- are offered again, with the next batch, after another maxSteps evictions. Older
+-- steps are dropped (and counted) so a dead sink can't grow the ring past
+-- 3 * maxSteps steps.
+local function spillTelemetry(telemetry, chunk)
+    local spill = telemetry.spill
+    if not spill then
+        return true
+    end
+    local ok, err = spill(chunk)
+    if ok == false then
+        telemetry.spillFailures += 1
+        telemetry.lastSpillError = tostring(err or "spill failed")
+        return false
+    end
+    return true
+end
+
+function World:_trimTelemetry()
+    local telemetry = self.telemetry
+    local maxSteps = telemetry.maxSteps
+    local columns = telemetry.columns
+
+    if columns then
+        if #columns.t - columns.first + 1 <= maxSteps then
+            return
+        end
+        columns.first += 1
+        telemetry.evicted += 1
+        if columns.first > telemetry.spillAt then
+            if spillTelemetry(telemetry, { columns = evictedTelemetryColumns(columns) }) then
+                telemetry.columns = compactTelemetryColumns(columns, telemetry.capacity)
+                telemetry.spillAt = maxSteps
+                return
+            end
+            local dropped = columns.first - 1 - maxSteps
+            if dropped > 0 then
+                columns.first = dropped + 1
+                local kept = compactTelemetryColumns(columns, telemetry.capacity)
+                kept.first = maxSteps + 1
+                telemetry.columns = kept
+                telemetry.dropped += dropped
+            end
+            telemetry.spillAt = 2 * maxSteps
+        end
+        return
+    end
+
+    local steps = telemetry.steps
+    if #steps - telemetry.first + 1 <= maxSteps then
+        return
+    end
+    telemetry.first += 1
+    telemetry.evicted += 1
+    if telemetry.first > telemetry.spillAt then
+        local first = telemetry.first
+        if spillTelemetry(telemetry, { steps = table.move(steps, 1, first - 1, 1, table.create(first - 1)) }) then
+            telemetry.steps = table.move(steps, first, #steps, 1, table.create(telemetry.capacity))
+            telemetry.first = 1
+            telemetry.spillAt = maxSteps
+            return
+        end
+        local dropped = first - 1 - maxSteps
+        if dropped > 0 then
+            telemetry.steps = table.move(steps, dropped + 1, #steps, 1, table.create(telemetry.capacity))
+            telemetry.first = maxSteps + 1
+            telemetry.dropped += dropped
+        end
+        telemetry.spillAt = 2 * maxSteps
+    end
+end
+
+function World:_recordTelemetry()
+    local telemetry = self.telemetry
+    if not self:_shouldRecordTelemetry() then
+        telemetry.decimated += 1
+        return
+    end
+
+    telemetry.sinceRecord = 0
+    if telemetry.decimation == "adaptive" then
+        self:_rememberVelocities()
+    end
+
+    self:_appendTelemetry()
+
+    if telemetry.maxSteps then
+        self:_trimTelemetry()
+    end
+end
+
+function World:_appendTelemetry()
+    local telemetry = self.telemetry
+    local columns = telemetry.columns
+    if not columns then
+        table.insert(telemetry.steps, {
+            t = self.now,
+            agents = self:getAgentSamples(),
+            projectiles = self:getProjectileSamples(),
+        })
+        return
+    end
+
+    local step = #columns.t + 1
+    columns.t[step] = self.now
+
+    local agentRows = columns.agentRows
+    columns.agentStart[step] = agentRows.count + 1
+    for _, agent in ipairs(self.agents) do
+        local instance = agent.instance
+        if instance then
+            local index = telemetryEntityIndex(columns, columns.agents, columns.agentLookup, agent, agent.name)
+            appendTelemetryRow(agentRows, index, agent:getLatencyPosition(), instance.AssemblyLinearVelocity or ZERO)
+        end
+    end
+
+    local projectileRows = columns.projectileRows
+    columns.projectileStart[step] = projectileRows.count + 1
+    for _, projectile in ipairs(self.projectiles) do
+        local instance = projectile.instance
+        if instance then
+            local index =
+                telemetryEntityIndex(columns, columns.projectiles, columns.projectileLookup, projectile, instance.Name)
+            local row = appendTelemetryRow(
+                projectileRows,
+                index,
+                instance.Position,
+                instance.AssemblyLinearVelocity or ZERO
+            )
+            projectileRows.contact[row] = if projectile.contactArmed then 1 else 0
+        end
+    end
 end
 
 function World:step(dt)
@@ -773,6 +1425,52 @@ function World:step(dt)
     return steps
 end
 
+-- Advances an idle world (no projectiles) by `duration`. Agents keep constant
+-- velocity between steps, so all but the last few fixed steps are collapsed
+-- into one drift; the tail is stepped normally so latency histories and
+-- telemetry end in the same state a stepped run would reach. Skipped steps do
+-- not produce telemetry rows. Falls back to `step` while projectiles exist.
+function World:fastForward(duration)
+    if not isFiniteNumber(duration) or duration <= 0 then
+        return 0
+    end
+    if #self.projectiles > 0 then
+        return self:step(duration)
+    end
+
+    self.accumulator += duration
+    local fixedStep = self.fixedStep
+    local steps = math.floor(self.accumulator / fixedStep)
+    if steps <= 0 then
+        return 0
+    end
+    self.accumulator -= steps * fixedStep
+
+    local tail = 1
+    for _, agent in ipairs(self.agents) do
+        if agent.latency > 0 then
+            tail = math.max(tail, math.ceil(agent.latency / fixedStep) + 2)
+        end
+    end
+    tail = math.min(tail, steps)
+
+    local skipped = steps - tail
+    if skipped > 0 then
+        local span = skipped * fixedStep
+        self.now += span
+        for _, agent in ipairs(self.agents) do
+            agent:_drift(span)
+        end
+    end
+
+    for _ = 1, tail do
+        self.now += fixedStep
+        self:_stepFixed(fixedStep)
+    end
+
+    return steps
+end
+
 function World:getProjectileSamples()
     local samples = {}
     for _, projectile in ipairs(self.projectiles) do
@@ -844,13 +1542,64 @@ local function serializeVector(vector)
     return { x = vector.X, y = vector.Y, z = vector.Z }
 end
 
+local function serializeRow(rows, row)
+    return { x = rows.px[row], y = rows.py[row], z = rows.pz[row] },
+        { x = rows.vx[row], y = rows.vy[row], z = rows.vz[row] }
+end
+
+function World:getTelemetryColumns()
+    return self.telemetry.columns
+end
+
 function World:exportTelemetry()
     local export = {
         now = self.now,
         steps = {},
     }
 
-    for _, step in ipairs(self.telemetry.steps) do
+    local columns = self.telemetry.columns
+    if columns then
+        local agentRows = columns.agentRows
+        local projectileRows = columns.projectileRows
+        local first = columns.first
+
+        for step = first, #columns.t do
+            local snapshot = {
+                t = columns.t[step],
+                agents = {},
+                projectiles = {},
+            }
+
+            local agentLast = (columns.agentStart[step + 1] or agentRows.count + 1) - 1
+            for row = columns.agentStart[step], agentLast do
+                local position, velocity = serializeRow(agentRows, row)
+                snapshot.agents[#snapshot.agents + 1] = {
+                    name = columns.agents[agentRows.entity[row]],
+                    position = position,
+                    velocity = velocity,
+                }
+            end
+
+            local projectileLast = (columns.projectileStart[step + 1] or projectileRows.count + 1) - 1
+            for row = columns.projectileStart[step], projectileLast do
+                local position, velocity = serializeRow(projectileRows, row)
+                snapshot.projectiles[#snapshot.projectiles + 1] = {
+                    name = columns.projectiles[projectileRows.entity[row]],
+                    position = position,
+                    velocity = velocity,
+                    contact = projectileRows.contact[row] == 1,
+                }
+            end
+
+            export.steps[step - first + 1] = snapshot
+        end
+
+        return export
+    end
+
+    local steps = self.telemetry.steps
+    for index = self.telemetry.first, #steps do
+        local step = steps[index]
         local snapshot = {
             t = step.t,
             agents = {},
@@ -881,14 +1630,209 @@ function World:exportTelemetry()
 end
 
 function World:clearTelemetry()
-    self.telemetry.steps = {}
+    resetTelemetry(self.telemetry)
+end
+
+function World:flushTelemetry()
+    local telemetry = self.telemetry
+    if telemetry.spill then
+        -- Evicted steps awaiting the next batch are written out along with the
+        -- retained window. If that fails nothing is cleared.
+        local columns = telemetry.columns
+        local ok = true
+        if columns then
+            if #columns.t > 0 then
+                local pending = table.clone(columns)
+                pending.first = 1
+                ok = spillTelemetry(telemetry, { columns = pending })
+            end
+        elseif #telemetry.steps > 0 then
+            ok = spillTelemetry(telemetry, { steps = telemetry.steps })
+        end
+        if not ok then
+            return false, telemetry.lastSpillError
+        end
+    end
+    self:clearTelemetry()
+    return true
+end
+
+local function cloneWeakKeys(source)
+    local copy = setmetatable({}, { __mode = "k" })
+    for key, value in pairs(source) do
+        copy[key] = value
+    end
+    return copy
+end
+
+local function cloneTelemetryRows(rows)
+    local copy = table.clone(rows)
+    for _, field in ipairs(TELEMETRY_ROW_FIELDS) do
+        if rows[field] then
+            copy[field] = table.clone(rows[field])
+        end
+    end
+    return copy
+end
+
+-- Recorded steps are copied rather than shared so a restored world can append
+-- to its telemetry without disturbing the snapshot. Steps already handed to
+-- `spill` stay written out.
+local function cloneTelemetry(telemetry)
+    local copy = table.clone(telemetry)
+    copy.steps = table.clone(telemetry.steps)
+    copy.lastVelocity = cloneWeakKeys(telemetry.lastVelocity)
+
+    local columns = telemetry.columns
+    if columns then
+        copy.columns = {
+            first = columns.first,
+            t = table.clone(columns.t),
+            agentStart = table.clone(columns.agentStart),
+            projectileStart = table.clone(columns.projectileStart),
+            agents = table.clone(columns.agents),
+            projectiles = table.clone(columns.projectiles),
+            agentRows = cloneTelemetryRows(columns.agentRows),
+            projectileRows = cloneTelemetryRows(columns.projectileRows),
+            agentLookup = table.clone(columns.agentLookup),
+            projectileLookup = table.clone(columns.projectileLookup),
+            entitySlots = cloneWeakKeys(columns.entitySlots),
+        }
+    end
+    return copy
+end
+
+local function captureInstance(instance)
+    if not instance then
+        return nil
+    end
+    return {
+        position = instance.Position,
+        velocity = instance.AssemblyLinearVelocity,
+        cframe = instance.CFrame,
+        attributes = if typeof(instance._attributes) == "table" then table.clone(instance._attributes) else nil,
+    }
+end
+
+local function applyInstance(instance, saved)
+    if not (instance and saved) then
+        return
+    end
+    instance.Position = saved.position
+    instance.AssemblyLinearVelocity = saved.velocity
+    instance.CFrame = saved.cframe
+    if saved.attributes then
+        instance._attributes = table.clone(saved.attributes)
+    end
+end
+
+-- Captures the clock, agent and projectile state (including ball instance
+-- kinematics) and recorded telemetry. Projectiles and instances are kept by
+-- reference, so the snapshot restores in the process that took it.
+function World:snapshot()
+    local agents = {}
+    for index, agent in ipairs(self.agents) do
+        agents[index] = {
+            agent = agent,
+            history = table.clone(agent.history),
+            accumulator = agent.accumulator,
+            telemetryCount = #agent.telemetry,
+            instance = captureInstance(agent.instance),
+        }
+    end
+
+    local projectiles = {}
+    for index, projectile in ipairs(self.projectiles) do
+        local fields = table.clone(projectile)
+        fields.telemetry = nil
+        projectiles[index] = {
+            projectile = projectile,
+            fields = fields,
+            trajectory = if projectile.trajectory then table.clone(projectile.trajectory) else nil,
+            telemetryCount = #projectile.telemetry,
+            instance = captureInstance(projectile.instance),
+        }
+    end
+
+    return {
+        now = self.now,
+        accumulator = self.accumulator,
+        agents = agents,
+        projectiles = projectiles,
+        telemetry = cloneTelemetry(self.telemetry),
+    }
+end
+
+-- Rewinds the world to `snapshot`. Projectiles spawned since are removed and
+-- projectiles removed since are re-registered with the balls folder. Agents
+-- added after the snapshot are left in place.
+function World:restore(snapshot)
+    local keep = {}
+    for _, saved in ipairs(snapshot.projectiles) do
+        keep[saved.projectile] = true
+    end
+    for index = #self.projectiles, 1, -1 do
+        local projectile = self.projectiles[index]
+        if not keep[projectile] then
+            self:removeProjectile(projectile.instance)
+        end
+    end
+
+    local projectiles = table.create(#snapshot.projectiles)
+    for index, saved in ipairs(snapshot.projectiles) do
+        local projectile = saved.projectile
+        local telemetry = projectile.telemetry
+        for key in pairs(projectile) do
+            projectile[key] = nil
+        end
+        for key, value in pairs(saved.fields) do
+            projectile[key] = value
+        end
+        for row = #telemetry, saved.telemetryCount + 1, -1 do
+            telemetry[row] = nil
+        end
+        projectile.telemetry = telemetry
+        if saved.trajectory then
+            projectile.trajectory = table.clone(saved.trajectory)
+        end
+        applyInstance(projectile.instance, saved.instance)
+
+        projectiles[index] = projectile
+        if not self.projectileIndex[projectile.instance] then
+            self.projectileIndex[projectile.instance] = projectile
+            self:_registerInstance(projectile.instance)
+        end
+    end
+    self.projectiles = projectiles
+
+    for _, saved in ipairs(snapshot.agents) do
+        local agent = saved.agent
+        agent.history = table.clone(saved.history)
+        agent.accumulator = saved.accumulator
+        for row = #agent.telemetry, saved.telemetryCount + 1, -1 do
+            agent.telemetry[row] = nil
+        end
+        applyInstance(agent.instance, saved.instance)
+    end
+
+    self.now = snapshot.now
+    self.accumulator = snapshot.accumulator
+    self.telemetry = cloneTelemetry(snapshot.telemetry)
+
+    -- The grid is rebuilt from agent positions on the next contact pass.
+    local broadphase = self.broadphase
+    broadphase.cellSize = 0
+    table.clear(broadphase.cells)
+    table.clear(broadphase.bounds)
 end
 
 function World:destroy()
     self:clearProjectiles()
-    self.telemetry.steps = {}
+    self:clearTelemetry()
     table.clear(self.agents)
     table.clear(self.volumes)
+    table.clear(self.broadphase.cells)
+    table.clear(self.broadphase.bounds)
 end
 
 return World
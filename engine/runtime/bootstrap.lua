@@ -7,13 +7,13 @@ local function createVirtualRequire(sourceMap)
     local cache = {}
 
     local function virtualRequire(path)
-        local source = sourceMap[path]
-        assert(source, "Missing source map entry for " .. tostring(path))
-
         if cache[path] ~= nil then
             return cache[path]
         end
 
+        local source = sourceMap[path]
+        assert(source, "Missing source map entry for " .. tostring(path))
+
         local chunk, err = loadstring(source, "=" .. path)
         assert(chunk, err)
 
@@ -41,6 +41,35 @@ end
 
 Bootstrap.createVirtualRequire = createVirtualRequire
 
+-- Wraps a chunked source map index so module sources are only loaded (and kept
+-- in memory) once something indexes them. `loadChunk(chunkName, path)` must
+-- return the module source string.
+local function createLazySourceMap(index, loadChunk)
+    assert(type(index) == "table", "createLazySourceMap requires an index table")
+    assert(type(loadChunk) == "function", "createLazySourceMap requires a chunk loader")
+
+    local modules = index.modules or index
+
+    return setmetatable({}, {
+        __index = function(map, path)
+            local entry = modules[path]
+            if entry == nil then
+                return nil
+            end
+
+            local source = loadChunk(entry.chunk, path)
+            if type(source) ~= "string" then
+                error(string.format("Source map chunk %s for %s did not return a string", tostring(entry.chunk), tostring(path)), 0)
+            end
+
+            rawset(map, path, source)
+            return source
+        end,
+    })
+end
+
+Bootstrap.createLazySourceMap = createLazySourceMap
+
 function Bootstrap.load(options)
     options = options or {}
 
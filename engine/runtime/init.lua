@@ -66,8 +66,78 @@ local function sampleGc(profile)
     end
 end
 
-local function createProfile()
+-- Fixed-size uniform sample of an unbounded stream (Algorithm R). The
+-- replacement slot comes from a per-reservoir Park-Miller generator so profiles
+-- are reproducible across runs.
+local DEFAULT_RESERVOIR_SIZE = 1024
+local RESERVOIR_MODULUS = 2147483647
+
+local function createReservoir(capacity)
+    return {
+        capacity = capacity,
+        values = table.create(capacity),
+        seen = 0,
+        state = 48271,
+    }
+end
+
+local function reservoirAdd(reservoir, value)
+    local seen = reservoir.seen + 1
+    reservoir.seen = seen
+    if seen <= reservoir.capacity then
+        reservoir.values[seen] = value
+        return
+    end
+
+    local state = reservoir.state * 48271 % RESERVOIR_MODULUS
+    reservoir.state = state
+    local slot = math.floor(state / RESERVOIR_MODULUS * seen) + 1
+    if slot <= reservoir.capacity then
+        reservoir.values[slot] = value
+    end
+end
+
+-- Linear-interpolated quantiles, matching `percentile` in tests/run_harness.py.
+local function summariseReservoir(reservoir)
+    local ordered = table.clone(reservoir.values)
+    table.sort(ordered)
+    local count = #ordered
+
+    local function quantile(fraction)
+        if count == 0 then
+            return nil
+        end
+        local rank = (count - 1) * fraction
+        local lower = math.floor(rank)
+        local upper = math.min(lower + 1, count - 1)
+        local low = ordered[lower + 1]
+        return low + (ordered[upper + 1] - low) * (rank - lower)
+    end
+
+    return {
+        observed = reservoir.seen,
+        samples = count,
+        p50 = quantile(0.5),
+        p95 = quantile(0.95),
+        p99 = quantile(0.99),
+    }
+end
+
+local PROFILING_LEVELS = {
+    off = true,
+    sampled = true,
+    full = true,
+}
+local DEFAULT_SAMPLE_EVERY = 32
+
+local function createProfile(settings)
+    settings = settings or {}
+    local reservoirSize = settings.reservoirSize or DEFAULT_RESERVOIR_SIZE
     local profile = {
+        level = settings.level or "full",
+        sampleEvery = if settings.level == "sampled" then settings.sampleEvery or DEFAULT_SAMPLE_EVERY else 1,
+        untilSample = 1,
+        sampledWaits = 0,
         totalAdvance = 0,
         waitCount = 0,
         minStep = nil,
@@ -87,6 +157,10 @@ local function createProfile()
         totalLateness = 0,
         maxLateness = nil,
         minLateness = nil,
+        fastForwardCount = 0,
+        fastForwardTime = 0,
+        waitRuntimes = createReservoir(reservoirSize),
+        latenessValues = createReservoir(reservoirSize),
     }
 
     sampleGc(profile)
@@ -155,26 +229,132 @@ local function heapBubbleDown(heap, index)
     end
 end
 
-function Scheduler.new(step)
+-- Hierarchical timing wheel: WHEEL_LEVELS rings of WHEEL_SLOTS buckets, each
+-- level WHEEL_SLOTS times coarser than the one below. Events are bucketed by
+-- tick (floor(time / resolution)); once the cursor reaches an event's tick it
+-- moves into `queue`, a small heap that still orders by (time, sequence). Since
+-- ticks are monotonic in time, everything left in the wheel is strictly later
+-- than everything in the heap.
+local DEFAULT_WHEEL_RESOLUTION = 1 / 240
+local WHEEL_SLOTS = 256
+local WHEEL_LEVELS = 4
+local EVENT_POOL_LIMIT = 8192
+
+local function createWheel(resolution)
+    local levels = {}
+    local counts = {}
+    for level = 1, WHEEL_LEVELS do
+        local slots = {}
+        for index = 1, WHEEL_SLOTS do
+            slots[index] = {}
+        end
+        levels[level] = slots
+        counts[level] = 0
+    end
+    -- counts[WHEEL_LEVELS + 1] tracks events beyond the top ring's horizon.
+    counts[WHEEL_LEVELS + 1] = 0
+
+    return {
+        resolution = resolution,
+        cursor = 0,
+        count = 0,
+        counts = counts,
+        levels = levels,
+        overflow = {},
+    }
+end
+
+local function wheelInsert(wheel, event)
+    local tick = event.tick
+    local delta = tick - wheel.cursor
+    local span = 1
+    wheel.count += 1
+    for level = 1, WHEEL_LEVELS do
+        local nextSpan = span * WHEEL_SLOTS
+        if delta < nextSpan then
+            local slot = wheel.levels[level][math.floor(tick / span) % WHEEL_SLOTS + 1]
+            slot[#slot + 1] = event
+            wheel.counts[level] += 1
+            return
+        end
+        span = nextSpan
+    end
+
+    local overflow = wheel.overflow
+    overflow[#overflow + 1] = event
+    wheel.counts[WHEEL_LEVELS + 1] += 1
+end
+
+function Scheduler.new(step, options)
+    options = options or {}
+    local mode = options.mode or "heap"
+    if mode ~= "heap" and mode ~= "wheel" then
+        error(string.format("Scheduler.new: unknown mode '%s'", tostring(mode)), 2)
+    end
+
     local self = setmetatable({
         now = 0,
         step = step or 1,
+        mode = mode,
         queue = {},
         _sequence = 0,
+        _eventPool = {},
     }, Scheduler)
 
-    self._profile = createProfile()
+    if mode == "wheel" then
+        local resolution = sanitiseNumber(options.resolution) or DEFAULT_WHEEL_RESOLUTION
+        if resolution <= 0 then
+            error("Scheduler.new: wheel resolution must be positive", 2)
+        end
+        self._wheel = createWheel(resolution)
+    end
+
+    local level = options.profiling or "full"
+    if not PROFILING_LEVELS[level] then
+        error(string.format("Scheduler.new: unknown profiling level '%s'", tostring(level)), 2)
+    end
+    local sampleEvery = sanitiseNumber(options.sampleEvery)
+    local reservoirSize = sanitiseNumber(options.reservoirSize)
+    if sampleEvery ~= nil and sampleEvery < 1 then
+        error("Scheduler.new: sampleEvery must be at least 1", 2)
+    end
+    self._profiling = {
+        level = level,
+        sampleEvery = if sampleEvery then math.floor(sampleEvery) else nil,
+        reservoirSize = if reservoirSize then math.max(math.floor(reservoirSize), 1) else nil,
+    }
+
+    if level ~= "off" then
+        self._profile = createProfile(self._profiling)
+    end
 
     return self
 end
 
+-- Returns true when this wait should pay for host clock reads and a GC sample.
+-- "full" profiles time every wait; "sampled" times one wait in `sampleEvery`.
+local function claimTimedSample(profile)
+    local remaining = profile.untilSample - 1
+    if remaining > 0 then
+        profile.untilSample = remaining
+        return false
+    end
+    profile.untilSample = profile.sampleEvery
+    profile.sampledWaits += 1
+    return true
+end
+
 function Scheduler:clock()
     return self.now
 end
 
-function Scheduler:_runDueEvents(profile)
+function Scheduler:_runDueEvents(profile, timed)
     local executed = 0
-    local hostStart = monotonicTime()
+    local hostStart = if timed then monotonicTime() else nil
+    local wheel = self._wheel
+    if wheel then
+        self:_advanceWheel(math.floor(self.now / wheel.resolution))
+    end
     while true do
         local nextEvent = self.queue[1]
         if not nextEvent or nextEvent.time > self.now then
@@ -192,6 +372,7 @@ function Scheduler:_runDueEvents(profile)
 
             profile.totalLateness += lateness
             profile.latenessSamples += 1
+            reservoirAdd(profile.latenessValues, lateness)
 
             if not profile.minLateness or lateness < profile.minLateness then
                 profile.minLateness = lateness
@@ -206,10 +387,12 @@ function Scheduler:_runDueEvents(profile)
             end
         end
 
-        event.callback()
+        local callback = event.callback
+        self:_releaseEvent(event)
+        callback()
         executed += 1
     end
-    if profile and hostStart then
+    if hostStart then
         local hostEnd = monotonicTime()
         if hostEnd then
             profile.hostEventRuntime += math.max(hostEnd - hostStart, 0)
@@ -221,7 +404,8 @@ end
 function Scheduler:wait(duration)
     duration = duration or self.step
     local profile = self._profile
-    local hostStart = monotonicTime()
+    local timed = profile ~= nil and claimTimedSample(profile)
+    local hostStart = if timed then monotonicTime() else nil
 
     self.now += duration
 
@@ -237,7 +421,7 @@ function Scheduler:wait(duration)
             profile.maxStep = duration
         end
 
-        local depth = #self.queue
+        local depth = self:_queueDepth()
         profile.queueSamples += 1
         profile.totalQueueDepth += depth
         if depth > profile.maxQueueDepth then
@@ -245,7 +429,7 @@ function Scheduler:wait(duration)
         end
     end
 
-    local executed = self:_runDueEvents(profile)
+    local executed = self:_runDueEvents(profile, timed)
 
     if profile then
         profile.eventsTriggered += executed
@@ -256,46 +440,301 @@ function Scheduler:wait(duration)
             end
         end
 
-        local hostEnd = monotonicTime()
-        if hostStart and hostEnd then
-            profile.hostWaitRuntime += math.max(hostEnd - hostStart, 0)
-        end
+        if timed then
+            local hostEnd = monotonicTime()
+            if hostStart and hostEnd then
+                local runtime = math.max(hostEnd - hostStart, 0)
+                profile.hostWaitRuntime += runtime
+                reservoirAdd(profile.waitRuntimes, runtime)
+            end
 
-        sampleGc(profile)
+            sampleGc(profile)
+        end
     end
 
     return duration
 end
 
+-- Earliest pending event time no later than `horizon`, or nil. In wheel mode
+-- the cursor is moved up to the horizon so every candidate sits in the heap;
+-- that is safe because anything scheduled at or before the cursor afterwards
+-- goes straight into the heap too.
+function Scheduler:_peekEventTime(horizon)
+    local wheel = self._wheel
+    if wheel then
+        self:_advanceWheel(math.floor(horizon / wheel.resolution))
+    end
+    local nextEvent = self.queue[1]
+    if nextEvent and nextEvent.time <= horizon then
+        return nextEvent.time
+    end
+    return nil
+end
+
+-- Jumps the clock across an idle span in one call instead of `wait`ing through
+-- it. Without `step` the clock moves to the next queued event (or `duration`,
+-- whichever is sooner) and runs whatever is due. With `step` the jump is a
+-- whole number of steps that stops short of the step which would reach the
+-- next event, so the caller's regular `wait` still delivers it on the same
+-- cadence. Skipped time counts towards `totalSimulated` but not towards the
+-- per-wait step statistics. Returns the simulated time skipped.
+function Scheduler:fastForward(duration, step)
+    if type(duration) ~= "number" or duration <= 0 then
+        return 0
+    end
+
+    local nextTime = self:_peekEventTime(self.now + duration)
+    local span
+    if step and step > 0 then
+        local steps = math.floor(duration / step + 1e-9)
+        if nextTime then
+            steps = math.min(steps, math.ceil((nextTime - self.now) / step - 1e-9) - 1)
+        end
+        span = math.max(steps, 0) * step
+    else
+        span = if nextTime then math.max(nextTime - self.now, 0) else duration
+    end
+
+    if span <= 0 then
+        return 0
+    end
+
+    local profile = self._profile
+    local timed = profile ~= nil and profile.level == "full"
+    local hostStart = if timed then monotonicTime() else nil
+    self.now += span
+
+    local executed = 0
+    if not step then
+        executed = self:_runDueEvents(profile, timed)
+    end
+
+    if profile then
+        profile.totalAdvance += span
+        profile.fastForwardCount += 1
+        profile.fastForwardTime += span
+        profile.eventsTriggered += executed
+
+        if timed then
+            local hostEnd = monotonicTime()
+            if hostStart and hostEnd then
+                profile.hostWaitRuntime += math.max(hostEnd - hostStart, 0)
+            end
+
+            sampleGc(profile)
+        end
+    end
+
+    return span
+end
+
 function Scheduler:schedule(delay, callback)
     self._sequence += 1
-    local event = {
-        time = self.now + delay,
-        callback = callback,
-        sequence = self._sequence,
-    }
+    local event = self:_acquireEvent()
+    event.time = self.now + delay
+    event.callback = callback
+    event.sequence = self._sequence
     self:_pushEvent(event)
     local profile = self._profile
     if profile then
         profile.scheduledEvents += 1
-        local depth = #self.queue
+        local depth = self:_queueDepth()
         if depth > profile.maxQueueDepth then
             profile.maxQueueDepth = depth
         end
     end
 end
 
+-- Captures the clock and every pending event. Callbacks are kept by reference,
+-- so a snapshot can only be restored in the process that took it. Profiling
+-- counters are not part of the snapshot.
+function Scheduler:snapshot()
+    local events = {}
+    local function collect(list)
+        for _, event in ipairs(list) do
+            events[#events + 1] = {
+                time = event.time,
+                sequence = event.sequence,
+                callback = event.callback,
+            }
+        end
+    end
+
+    collect(self.queue)
+    local wheel = self._wheel
+    if wheel then
+        for _, slots in ipairs(wheel.levels) do
+            for _, slot in ipairs(slots) do
+                collect(slot)
+            end
+        end
+        collect(wheel.overflow)
+    end
+    table.sort(events, compareEvents)
+
+    return {
+        now = self.now,
+        sequence = self._sequence,
+        events = events,
+    }
+end
+
+function Scheduler:restore(snapshot)
+    for _, event in ipairs(self.queue) do
+        self:_releaseEvent(event)
+    end
+    self.queue = {}
+
+    self.now = snapshot.now
+    self._sequence = snapshot.sequence
+
+    local wheel = self._wheel
+    if wheel then
+        -- Recycle the old wheel's pending records like the heap's above.
+        for _, slots in ipairs(wheel.levels) do
+            for _, slot in ipairs(slots) do
+                for _, event in ipairs(slot) do
+                    self:_releaseEvent(event)
+                end
+            end
+        end
+        for _, event in ipairs(wheel.overflow) do
+            self:_releaseEvent(event)
+        end
+        self._wheel = createWheel(wheel.resolution)
+        self._wheel.cursor = math.floor(self.now / wheel.resolution)
+    end
+
+    for _, saved in ipairs(snapshot.events) do
+        local event = self:_acquireEvent()
+        event.time = saved.time
+        event.sequence = saved.sequence
+        event.callback = saved.callback
+        self:_pushEvent(event)
+    end
+end
+
 function Scheduler:resetProfiling()
-    self._profile = createProfile()
+    if self._profiling.level == "off" then
+        self._profile = nil
+    else
+        self._profile = createProfile(self._profiling)
+    end
     return self._profile
 end
 
+function Scheduler:_acquireEvent()
+    local pool = self._eventPool
+    local size = #pool
+    if size == 0 then
+        return {}
+    end
+    local event = pool[size]
+    pool[size] = nil
+    return event
+end
+
+function Scheduler:_releaseEvent(event)
+    event.callback = nil
+    local pool = self._eventPool
+    if #pool < EVENT_POOL_LIMIT then
+        pool[#pool + 1] = event
+    end
+end
+
+function Scheduler:_queueDepth()
+    local wheel = self._wheel
+    if wheel then
+        return #self.queue + wheel.count
+    end
+    return #self.queue
+end
+
 function Scheduler:_pushEvent(event)
+    local wheel = self._wheel
+    if wheel then
+        local tick = math.floor(event.time / wheel.resolution)
+        event.tick = tick
+        if tick > wheel.cursor then
+            wheelInsert(wheel, event)
+            return
+        end
+    end
+
     local queue = self.queue
     queue[#queue + 1] = event
     heapBubbleUp(queue, #queue)
 end
 
+function Scheduler:_cascadeSlot(slot, level)
+    local wheel = self._wheel
+    local size = #slot
+    wheel.count -= size
+    wheel.counts[level] -= size
+    for index = 1, size do
+        local event = slot[index]
+        slot[index] = nil
+        if event.tick > wheel.cursor then
+            wheelInsert(wheel, event)
+        else
+            local queue = self.queue
+            queue[#queue + 1] = event
+            heapBubbleUp(queue, #queue)
+        end
+    end
+end
+
+function Scheduler:_advanceWheel(targetTick)
+    local wheel = self._wheel
+    local levels = wheel.levels
+    local counts = wheel.counts
+    while wheel.cursor < targetTick do
+        if wheel.count == 0 then
+            wheel.cursor = targetTick
+            break
+        end
+
+        -- Empty lower rings cannot produce anything before the next boundary
+        -- where a coarser ring cascades, so jump straight to it.
+        local skipSpan = 1
+        local emptyLevel = 1
+        while emptyLevel <= WHEEL_LEVELS and counts[emptyLevel] == 0 do
+            skipSpan *= WHEEL_SLOTS
+            emptyLevel += 1
+        end
+        if skipSpan > 1 then
+            local boundary = (math.floor(wheel.cursor / skipSpan) + 1) * skipSpan
+            if boundary > targetTick then
+                wheel.cursor = targetTick
+                break
+            end
+            wheel.cursor = boundary - 1
+        end
+
+        local cursor = wheel.cursor + 1
+        wheel.cursor = cursor
+
+        local span = WHEEL_SLOTS
+        local level = 2
+        while level <= WHEEL_LEVELS and cursor % span == 0 do
+            local index = math.floor(cursor / span) % WHEEL_SLOTS
+            self:_cascadeSlot(levels[level][index + 1], level)
+            if index ~= 0 then
+                break
+            end
+            span *= WHEEL_SLOTS
+            level += 1
+        end
+        if level > WHEEL_LEVELS and #wheel.overflow > 0 then
+            local overflow = wheel.overflow
+            wheel.overflow = {}
+            self:_cascadeSlot(overflow, WHEEL_LEVELS + 1)
+        end
+
+        self:_cascadeSlot(levels[1][cursor % WHEEL_SLOTS + 1], 1)
+    end
+end
+
 function Scheduler:_popEvent()
     local queue = self.queue
     local size = #queue
@@ -335,7 +774,7 @@ local function summariseGc(gc)
 end
 
 function Scheduler:getProfilingData()
-    local profile = self._profile or createProfile()
+    local profile = self._profile or createProfile(self._profiling)
     local nowHost = monotonicTime()
     local elapsed
     if profile.hostStart and nowHost then
@@ -344,7 +783,7 @@ function Scheduler:getProfilingData()
 
     local averageStep = 0
     if profile.waitCount > 0 then
-        averageStep = profile.totalAdvance / profile.waitCount
+        averageStep = (profile.totalAdvance - profile.fastForwardTime) / profile.waitCount
     end
 
     local averageQueueDepth = 0
@@ -373,14 +812,33 @@ function Scheduler:getProfilingData()
 
     local minLateness = sanitiseNumber(profile.minLateness)
     local maxLateness = sanitiseNumber(profile.maxLateness)
+    local latenessQuantiles = summariseReservoir(profile.latenessValues)
+    local waitQuantiles = summariseReservoir(profile.waitRuntimes)
+
+    -- Sampled profiles only time one wait in `sampleEvery`; scale the host
+    -- totals up so they stay comparable with full profiles.
+    local hostScale = 1
+    if profile.level == "sampled" and profile.sampledWaits > 0 then
+        hostScale = profile.waitCount / profile.sampledWaits
+    end
 
     return {
+        mode = self.mode,
+        profiling = {
+            level = if self._profile then profile.level else "off",
+            sampleEvery = profile.sampleEvery,
+            sampledWaits = profile.sampledWaits,
+        },
         stepCount = profile.waitCount,
         totalSimulated = profile.totalAdvance,
         minStep = minStep,
         maxStep = maxStep,
         averageStep = averageStep,
         scheduledEvents = profile.scheduledEvents,
+        fastForward = {
+            count = profile.fastForwardCount,
+            simulated = profile.fastForwardTime,
+        },
         queue = {
             samples = profile.queueSamples,
             totalDepth = profile.totalQueueDepth,
@@ -397,8 +855,9 @@ function Scheduler:getProfilingData()
         host = {
             startedAt = profile.hostStart,
             elapsed = elapsed,
-            waitRuntime = profile.hostWaitRuntime,
-            eventRuntime = profile.hostEventRuntime,
+            waitRuntime = profile.hostWaitRuntime * hostScale,
+            eventRuntime = profile.hostEventRuntime * hostScale,
+            waitLatency = waitQuantiles,
         },
         lateness = {
             samples = profile.latenessSamples,
@@ -407,6 +866,9 @@ function Scheduler:getProfilingData()
             average = averageLateness,
             min = minLateness,
             max = maxLateness,
+            p50 = latenessQuantiles.p50,
+            p95 = latenessQuantiles.p95,
+            p99 = latenessQuantiles.p99,
         },
         utilisation = utilisation,
         generatedAt = monotonicTime(),
@@ -965,6 +1427,33 @@ local function findTestHarness(instance)
     return nil
 end
 
+local function safeFindFirstChild(container, childName)
+    if container == nil then
+        return nil
+    end
+
+    local findFirstChild = container.FindFirstChild
+    if typeof(findFirstChild) == "function" then
+        local ok, child = pcall(findFirstChild, container, childName)
+        if ok then
+            return child
+        end
+    end
+
+    return nil
+end
+
+local bootstrapModule = safeWaitForChild(script, "bootstrap")
+if not bootstrapModule then
+    bootstrapModule = safeWaitForChild(script and script.Parent, "bootstrap")
+end
+if not bootstrapModule then
+    error("runtime bootstrap module missing", 0)
+end
+
+local Bootstrap = require(bootstrapModule)
+Runtime.bootstrap = Bootstrap
+
 local TestHarness = findTestHarness(script)
 local SourceMap
 if TestHarness then
@@ -982,7 +1471,34 @@ if TestHarness then
         return nil
     end
 
-    SourceMap = resolveSourceMap(safeWaitForChild(TestHarness, "AutoParrySourceMap"))
+    -- Prefer the chunked layout: only the compact index is required up front and
+    -- each module's source is pulled in on its first virtual require.
+    local function resolveChunkedSourceMap(folder)
+        local indexModule = safeFindFirstChild(folder, "index")
+        if indexModule == nil then
+            return nil
+        end
+
+        local ok, index = pcall(require, indexModule)
+        if not ok or type(index) ~= "table" then
+            warn("[runtime] failed to require AutoParrySourceMapChunks index", index)
+            return nil
+        end
+
+        return Bootstrap.createLazySourceMap(index, function(chunkName, path)
+            local chunkModule = safeFindFirstChild(folder, chunkName)
+            if chunkModule == nil then
+                error(string.format("Missing source map chunk %s for %s", tostring(chunkName), tostring(path)), 0)
+            end
+            return require(chunkModule)
+        end)
+    end
+
+    SourceMap = resolveChunkedSourceMap(safeFindFirstChild(TestHarness, "AutoParrySourceMapChunks"))
+
+    if not SourceMap then
+        SourceMap = resolveSourceMap(safeWaitForChild(TestHarness, "AutoParrySourceMap"))
+    end
 
     if not SourceMap then
         SourceMap = resolveSourceMap(TestHarness.AutoParrySourceMap)
@@ -991,17 +1507,6 @@ end
 
 Runtime.SourceMap = SourceMap
 
-local bootstrapModule = safeWaitForChild(script, "bootstrap")
-if not bootstrapModule then
-    bootstrapModule = safeWaitForChild(script and script.Parent, "bootstrap")
-end
-if not bootstrapModule then
-    error("runtime bootstrap module missing", 0)
-end
-
-local Bootstrap = require(bootstrapModule)
-Runtime.bootstrap = Bootstrap
-
 function Runtime.loadAutoParry(options)
     options = options or {}
     if not options.scheduler then
@@ -1022,7 +1527,7 @@ function Runtime.newEngine(options)
     options = options or {}
     local scheduler = options.scheduler
     if not scheduler then
-        scheduler = Scheduler.new(options.step)
+        scheduler = Scheduler.new(options.step, options.schedulerOptions)
     end
 
     local serviceOptions = {}
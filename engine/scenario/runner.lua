@@ -359,6 +359,8 @@ local function combineSchedulerProfiles(results: {any})
         stepCount = 0,
         scheduledEvents = 0,
         eventsTriggered = 0,
+        fastForwardCount = 0,
+        fastForwardTime = 0,
         queueSamples = 0,
         totalQueueDepth = 0,
         maxQueueDepth = 0,
@@ -371,6 +373,8 @@ local function combineSchedulerProfiles(results: {any})
         latenessTotal = 0,
         latenessMin = nil,
         latenessMax = nil,
+        latenessP95 = nil,
+        latenessP99 = nil,
         gc = {
             samples = 0,
             minKb = nil,
@@ -392,6 +396,10 @@ local function combineSchedulerProfiles(results: {any})
             local events = scheduler.events or {}
             aggregate.eventsTriggered += events.triggered or 0
 
+            local fastForward = scheduler.fastForward or {}
+            aggregate.fastForwardCount += fastForward.count or 0
+            aggregate.fastForwardTime += fastForward.simulated or 0
+
             local queue = scheduler.queue or {}
             aggregate.queueSamples += queue.samples or 0
             aggregate.totalQueueDepth += queue.totalDepth or 0
@@ -422,6 +430,17 @@ local function combineSchedulerProfiles(results: {any})
                     aggregate.latenessMax = lateness.max
                 end
             end
+            -- Quantiles cannot be merged exactly, so report the worst scenario.
+            if type(lateness.p95) == "number" then
+                if not aggregate.latenessP95 or lateness.p95 > aggregate.latenessP95 then
+                    aggregate.latenessP95 = lateness.p95
+                end
+            end
+            if type(lateness.p99) == "number" then
+                if not aggregate.latenessP99 or lateness.p99 > aggregate.latenessP99 then
+                    aggregate.latenessP99 = lateness.p99
+                end
+            end
 
             local gc = scheduler.gc or {}
             if gc.samples then
@@ -449,7 +468,7 @@ local function combineSchedulerProfiles(results: {any})
 
     local averageStep = 0
     if aggregate.stepCount > 0 then
-        averageStep = aggregate.totalSimulated / aggregate.stepCount
+        averageStep = (aggregate.totalSimulated - aggregate.fastForwardTime) / aggregate.stepCount
     end
 
     local averageQueueDepth = 0
@@ -479,6 +498,10 @@ local function combineSchedulerProfiles(results: {any})
         averageStep = averageStep,
         scheduledEvents = aggregate.scheduledEvents,
         eventsTriggered = aggregate.eventsTriggered,
+        fastForward = {
+            count = aggregate.fastForwardCount,
+            simulated = aggregate.fastForwardTime,
+        },
         queue = {
             samples = aggregate.queueSamples,
             averageDepth = averageQueueDepth,
@@ -495,6 +518,8 @@ local function combineSchedulerProfiles(results: {any})
             average = latenessAverage,
             min = aggregate.latenessMin,
             max = aggregate.latenessMax,
+            worstP95 = aggregate.latenessP95,
+            worstP99 = aggregate.latenessP99,
         },
         gc = {
             samples = aggregate.gc.samples,
@@ -728,55 +753,160 @@ local function runTimelineEvent(context: any, event: {[string]: any}, log: {any}
     end
 end
 
-function Runner.runScenario(planEntry: {module: ModuleScript, plan: {[string]: any}}): {[string]: any}
-    local plan = planEntry.plan
-    local metadata = plan.metadata or {}
-    local warnings: {string} = {}
+local SCENARIO_STEP = 1 / 240
+local SCENARIO_TAIL = 0.25
 
-    local context = Context.createContext({})
-    local scheduler = context.scheduler
-    local autoparry = context.autoparry
+local function vectorDigest(vector: any): {number}?
+    if typeof(vector) ~= "Vector3" then
+        return nil
+    end
+    return { vector.X, vector.Y, vector.Z }
+end
 
-    if autoparry and typeof(autoparry.resetConfig) == "function" then
-        local ok, err = pcall(autoparry.resetConfig)
-        if not ok then
-            table.insert(warnings, string.format("resetConfig failed: %s", tostring(err)))
+-- Serialisable summary of the engine state, recorded at checkpoint times and
+-- compared between runs by `Runner.compareCheckpoints`.
+local function digestContext(context: any): {[string]: any}
+    local pending = context.scheduler:snapshot()
+    local digest: {[string]: any} = {
+        time = pending.now,
+        scheduler = {
+            pending = #pending.events,
+            nextEvent = if pending.events[1] then pending.events[1].time else nil,
+        },
+        parries = #(context.parryLog or {}),
+        remoteEvents = #(context.remoteLog or {}),
+    }
+
+    local world = context.world
+    if world then
+        local agents = {}
+        for _, agent in ipairs(world.agents) do
+            local instance = agent.instance
+            if instance then
+                agents[#agents + 1] = {
+                    name = agent.name,
+                    position = vectorDigest(instance.Position),
+                    velocity = vectorDigest(instance.AssemblyLinearVelocity),
+                }
+            end
         end
-    end
 
-    if plan.config and plan.config.autoparry and autoparry and typeof(autoparry.configure) == "function" then
-        local ok, err = pcall(autoparry.configure, plan.config.autoparry)
-        if not ok then
-            table.insert(warnings, string.format("configure failed: %s", tostring(err)))
+        local projectiles = {}
+        for _, projectile in ipairs(world.projectiles) do
+            local instance = projectile.instance
+            if instance then
+                projectiles[#projectiles + 1] = {
+                    name = instance.Name,
+                    position = vectorDigest(instance.Position),
+                    velocity = vectorDigest(instance.AssemblyLinearVelocity),
+                    contact = projectile.contactArmed == true,
+                }
+            end
         end
+
+        digest.world = { agents = agents, projectiles = projectiles }
     end
 
-    if plan.intelligence then
-        table.insert(warnings, "Scenario intelligence configuration is not currently applied in runner")
+    local autoparry = context.autoparry
+    if autoparry and typeof(autoparry.captureTelemetryCheckpoint) == "function" then
+        local ok, telemetry = pcall(autoparry.captureTelemetryCheckpoint)
+        if ok and typeof(telemetry) == "table" then
+            digest.autoparry = {
+                sequence = telemetry.sequence,
+                activationLatency = telemetry.activationLatency,
+                counters = sanitiseValue(telemetry.metrics and telemetry.metrics.counters),
+            }
+        end
     end
 
-    if typeof(context.resetPerformanceMetrics) == "function" then
-        context:resetPerformanceMetrics()
+    return digest
+end
+
+local ScenarioSession = {}
+ScenarioSession.__index = ScenarioSession
+
+-- Runs timeline events and steps the engine until the clock reaches `time`,
+-- or to the end of the scenario (including the settling tail) when `time` is
+-- nil. Stops between fixed steps, so resuming replays the same step sequence
+-- as an uninterrupted run. Returns true once the scenario has finished.
+function ScenarioSession:advanceTo(time: number?): boolean
+    local context = self.context
+    local events = self.plan.events or {}
+
+    while not self.finished do
+        local event = events[self.eventIndex]
+        if self.pending == nil then
+            if event then
+                self.target = math.max(event.time or 0, self.previousTime)
+                self.pending = self.target - context.scheduler:clock()
+            else
+                self.pending = SCENARIO_TAIL
+            end
+        end
+
+        if self.pending > 0 then
+            self.pending = context:advance(self.pending, { step = SCENARIO_STEP, stopAt = time })
+            if self.pending > 0 then
+                return false
+            end
+        end
+
+        if event then
+            runTimelineEvent(context, event, self.eventsLog, self.metrics, self.warnings)
+            self.previousTime = self.target
+            self.eventIndex += 1
+            self.pending = nil
+        else
+            self.finished = true
+        end
     end
 
-    local eventsLog: {any} = {}
-    local metrics: {[string]: number} = {
-        parries = 0,
-        remoteEvents = 0,
+    return true
+end
+
+function ScenarioSession:digest(): {[string]: any}
+    return digestContext(self.context)
+end
+
+-- Checkpoints hold scheduler callbacks and ball instances by reference, so
+-- they restore only within the session that captured them.
+function ScenarioSession:checkpoint(): {[string]: any}
+    return {
+        context = self.context:checkpoint(),
+        eventIndex = self.eventIndex,
+        previousTime = self.previousTime,
+        target = self.target,
+        pending = self.pending,
+        finished = self.finished,
+        eventsLog = #self.eventsLog,
+        warnings = #self.warnings,
+        metrics = table.clone(self.metrics),
     }
+end
 
-    local previousTime = scheduler:clock()
-    for _, event in ipairs(plan.events or {}) do
-        local targetTime = math.max(event.time or 0, previousTime)
-        local delta = targetTime - scheduler:clock()
-        if delta > 0 then
-            context:advance(delta, { step = 1 / 240 })
-        end
-        runTimelineEvent(context, event, eventsLog, metrics, warnings)
-        previousTime = targetTime
+function ScenarioSession:restore(checkpoint: {[string]: any})
+    self.context:restore(checkpoint.context)
+    self.eventIndex = checkpoint.eventIndex
+    self.previousTime = checkpoint.previousTime
+    self.target = checkpoint.target
+    self.pending = checkpoint.pending
+    self.finished = checkpoint.finished
+    self.metrics = table.clone(checkpoint.metrics)
+    for index = #self.eventsLog, checkpoint.eventsLog + 1, -1 do
+        self.eventsLog[index] = nil
     end
+    for index = #self.warnings, checkpoint.warnings + 1, -1 do
+        self.warnings[index] = nil
+    end
+end
 
-    context:advance(0.25, { step = 1 / 240 })
+-- Builds the scenario result from the current state and tears the context
+-- down. The session cannot be advanced afterwards.
+function ScenarioSession:finish(): {[string]: any}
+    local context = self.context
+    local scheduler = context.scheduler
+    local metadata = self.plan.metadata or {}
+    local metrics = self.metrics
 
     local parryLog = sanitiseParryLog(context.parryLog or {})
     local remoteLog = sanitiseRemoteLog(context.remoteLog or {})
@@ -795,7 +925,7 @@ function Runner.runScenario(planEntry: {module: ModuleScript, plan: {[string]: a
         projectiles = sanitiseValue(context.world:getProjectileSamples())
     end
 
-    local snapshots = captureSnapshots(context, warnings)
+    local snapshots = captureSnapshots(context, self.warnings)
 
     local autoparrySnapshot = snapshots.autoparry
     local autoparryExport
@@ -868,23 +998,23 @@ function Runner.runScenario(planEntry: {module: ModuleScript, plan: {[string]: a
     end
 
     local result = {
-        id = metadata.id or planEntry.module.Name,
-        label = metadata.label or planEntry.module.Name,
+        id = metadata.id or self.planEntry.module.Name,
+        label = metadata.label or self.planEntry.module.Name,
         tags = metadata.tags or {},
         description = metadata.description,
         history = metadata.history or {},
         duration = duration,
         metrics = metrics,
-        events = sanitiseEvents(eventsLog),
+        events = sanitiseEvents(self.eventsLog),
         parryLog = parryLog,
         remoteLog = remoteLog,
         virtualInput = virtualInput,
         telemetry = telemetry,
         projectiles = projectiles,
-        warnings = warnings,
+        warnings = self.warnings,
         snapshots = snapshots,
         autoparry = autoparryExport,
-        module = planEntry.module.Name,
+        module = self.planEntry.module.Name,
         performance = performance,
     }
 
@@ -896,6 +1026,137 @@ function Runner.runScenario(planEntry: {module: ModuleScript, plan: {[string]: a
     return result
 end
 
+function Runner.startScenario(planEntry: {module: ModuleScript, plan: {[string]: any}}): any
+    local plan = planEntry.plan
+    local warnings: {string} = {}
+
+    local config = plan.config or {}
+    local context = Context.createContext({
+        schedulerOptions = config.scheduler,
+        telemetryOptions = config.telemetry,
+        fastForward = config.fastForward == true,
+    })
+    local scheduler = context.scheduler
+    local autoparry = context.autoparry
+
+    if autoparry and typeof(autoparry.resetConfig) == "function" then
+        local ok, err = pcall(autoparry.resetConfig)
+        if not ok then
+            table.insert(warnings, string.format("resetConfig failed: %s", tostring(err)))
+        end
+    end
+
+    if plan.config and plan.config.autoparry and autoparry and typeof(autoparry.configure) == "function" then
+        local ok, err = pcall(autoparry.configure, plan.config.autoparry)
+        if not ok then
+            table.insert(warnings, string.format("configure failed: %s", tostring(err)))
+        end
+    end
+
+    if plan.intelligence then
+        table.insert(warnings, "Scenario intelligence configuration is not currently applied in runner")
+    end
+
+    if typeof(context.resetPerformanceMetrics) == "function" then
+        context:resetPerformanceMetrics()
+    end
+
+    local session = {
+        planEntry = planEntry,
+        plan = plan,
+        context = context,
+        warnings = warnings,
+        eventsLog = {},
+        metrics = {
+            parries = 0,
+            remoteEvents = 0,
+        },
+        eventIndex = 1,
+        previousTime = scheduler:clock(),
+        target = nil,
+        pending = nil,
+        finished = false,
+    }
+
+    return setmetatable(session, ScenarioSession)
+end
+
+-- `options.checkpoints` lists simulated times at which a state digest is
+-- recorded into `result.checkpoints`; `options.stopAt` ends the run early (the
+-- result then carries `stoppedAt`).
+function Runner.runScenario(
+    planEntry: {module: ModuleScript, plan: {[string]: any}},
+    options: {[string]: any}?
+): {[string]: any}
+    options = options or {}
+    local stopAt = options.stopAt
+    local session = Runner.startScenario(planEntry)
+
+    local checkpoints
+    if typeof(options.checkpoints) == "table" then
+        checkpoints = {}
+        local times = table.clone(options.checkpoints)
+        table.sort(times)
+        for _, time in ipairs(times) do
+            if (stopAt and time > stopAt) or session:advanceTo(time) then
+                break
+            end
+            checkpoints[#checkpoints + 1] = session:digest()
+        end
+    end
+
+    local finished = session:advanceTo(stopAt)
+    local result = session:finish()
+    result.checkpoints = checkpoints
+    if not finished then
+        result.stoppedAt = stopAt
+    end
+    return result
+end
+
+-- Compares two checkpoint digest lists recorded at the same times. Returns the
+-- index of the first checkpoint whose numbers differ by more than `tolerance`
+-- (or whose other values differ) together with the differing field paths, or
+-- nil when the runs agree.
+function Runner.compareCheckpoints(left: {any}, right: {any}, tolerance: number?): (number?, {string}?)
+    local epsilon = tolerance or 1e-6
+
+    local function diff(a: any, b: any, path: string, out: {string})
+        if type(a) == "number" and type(b) == "number" then
+            if math.abs(a - b) > epsilon then
+                out[#out + 1] = path
+            end
+        elseif type(a) == "table" and type(b) == "table" then
+            local keys = {}
+            for key in pairs(a) do
+                keys[#keys + 1] = key
+            end
+            for key in pairs(b) do
+                if a[key] == nil then
+                    keys[#keys + 1] = key
+                end
+            end
+            table.sort(keys, function(x, y)
+                return tostring(x) < tostring(y)
+            end)
+            for _, key in ipairs(keys) do
+                diff(a[key], b[key], if path == "" then tostring(key) else path .. "." .. tostring(key), out)
+            end
+        elseif a ~= b then
+            out[#out + 1] = path
+        end
+    end
+
+    for index = 1, math.max(#left, #right) do
+        local fields = {}
+        diff(left[index], right[index], "", fields)
+        if #fields > 0 then
+            return index, fields
+        end
+    end
+    return nil, nil
+end
+
 function Runner.runAll(options: { [string]: any }?): {any}
     options = options or {}
     local moduleFilter = options.moduleFilter
@@ -923,12 +1184,33 @@ function Runner.runAll(options: { [string]: any }?): {any}
 
     local results = {}
     for _, entry in ipairs(plans) do
-        results[#results + 1] = Runner.runScenario(entry)
+        results[#results + 1] = Runner.runScenario(entry, options.scenarioOptions)
     end
 
     return results
 end
 
+-- Combines result batches from independent runs (e.g. the harness's Lune
+-- workers, each handed a subset of modules) back into the order `runAll`
+-- produces, so the payload builders below emit the same artifacts either way.
+function Runner.mergeResults(batches: {{any}}): {any}
+    local merged = {}
+    for _, batch in ipairs(batches) do
+        for _, entry in ipairs(batch) do
+            merged[#merged + 1] = entry
+        end
+    end
+    table.sort(merged, function(a, b)
+        local left = string.lower(tostring(a.module or a.id))
+        local right = string.lower(tostring(b.module or b.id))
+        if left == right then
+            return tostring(a.id) < tostring(b.id)
+        end
+        return left < right
+    end)
+    return merged
+end
+
 function Runner.buildSimulationPayload(results: {any}): {[string]: any}
     return {
         run = computeScenarioSummary(results),
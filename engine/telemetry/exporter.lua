@@ -1,10 +1,18 @@
 --!strict
 
+local Json = require(script.Parent:WaitForChild("json"))
+
 local Exporter = {}
 Exporter.__index = Exporter
 
 Exporter.VERSION = 1
 Exporter.TRACE_VERSION = 1
+Exporter.BINARY_TRACE_VERSION = 1
+Exporter.BINARY_TRACE_MAGIC = "APTB"
+
+local DEFAULT_TIME_QUANTUM = 1e-6
+local DEFAULT_POSITION_QUANTUM = 1 / 1024
+local DEFAULT_VELOCITY_QUANTUM = 1 / 1024
 
 export type TelemetryEvent = { [string]: any }
 export type TelemetrySnapshot = {
@@ -52,8 +60,45 @@ export type TracePayload = {
     metadata: { [string]: any }?,
 }
 
+export type TraceRows = {
+    count: number,
+    entity: { number },
+    px: { number },
+    py: { number },
+    pz: { number },
+    vx: { number },
+    vy: { number },
+    vz: { number },
+    contact: { number }?,
+}
+
+export type TraceColumns = {
+    first: number?,
+    t: { number },
+    agentStart: { number },
+    projectileStart: { number },
+    agents: { string },
+    projectiles: { string },
+    agentRows: TraceRows,
+    projectileRows: TraceRows,
+}
+
+export type BinaryTraceOptions = {
+    timeQuantum: number?,
+    positionQuantum: number?,
+    velocityQuantum: number?,
+}
+
 export type Writer = (path: string, contents: string) -> (boolean, string?)
 
+export type SpillOptions = {
+    path: string?,
+    runId: string?,
+    artifactRoot: string?,
+    writer: Writer?,
+    traceMetadata: { [string]: any }?,
+}
+
 export type ExportOptions = {
     runId: string?,
     artifactRoot: string?,
@@ -66,8 +111,11 @@ export type ExportOptions = {
     parryLog: { ParryLogEntry }?,
     events: { TelemetryEvent }?,
     steps: { TraceStep }?,
+    columns: TraceColumns?,
     trace: TracePayload?,
     traceMetadata: { [string]: any }?,
+    traceFormat: ("json" | "binary")?,
+    binary: BinaryTraceOptions?,
 }
 
 local function now(): number
@@ -265,56 +313,6 @@ local function cloneTable<T>(source: T): T
     return copy
 end
 
-local function encodeJSONString(value: string): string
-    value = value:gsub("\\", "\\\\")
-    value = value:gsub('"', '\\"')
-    value = value:gsub("\b", "\\b")
-    value = value:gsub("\f", "\\f")
-    value = value:gsub("\n", "\\n")
-    value = value:gsub("\r", "\\r")
-    value = value:gsub("\t", "\\t")
-    return '"' .. value .. '"'
-end
-
-local function encodeJSON(value: any): string
-    local valueType = type(value)
-
-    if valueType == "string" then
-        return encodeJSONString(value)
-    elseif valueType == "number" then
-        if value ~= value or value == math.huge or value == -math.huge then
-            return "null"
-        end
-        return tostring(value)
-    elseif valueType == "boolean" then
-        return tostring(value)
-    elseif value == nil then
-        return "null"
-    elseif valueType == "table" then
-        local asArray, length = isArray(value)
-        if asArray then
-            local entries = table.create(length)
-            for index = 1, length do
-                entries[index] = encodeJSON(value[index])
-            end
-            return "[" .. table.concat(entries, ",") .. "]"
-        end
-
-        local entries = {}
-        for key, entryValue in pairs(value) do
-            local keyType = type(key)
-            if keyType == "string" or keyType == "number" then
-                local encodedKey = encodeJSONString(tostring(key))
-                entries[#entries + 1] = encodedKey .. ":" .. encodeJSON(entryValue)
-            end
-        end
-        table.sort(entries)
-        return "{" .. table.concat(entries, ",") .. "}"
-    end
-
-    return "null"
-end
-
 local function ensureDirectory(path: string?): boolean
     if type(path) ~= "string" or path == "" then
         return false
@@ -353,7 +351,7 @@ local function ensureDirectory(path: string?): boolean
 end
 
 local function defaultWriter(path: string, contents: string): (boolean, string?)
-    local ok, handle = pcall(io.open, path, "w")
+    local ok, handle = pcall(io.open, path, "wb")
     if not ok or not handle then
         return false, "unable to open file for writing"
     end
@@ -363,6 +361,26 @@ local function defaultWriter(path: string, contents: string): (boolean, string?)
     return true, nil
 end
 
+-- The default writer streams straight to disk; custom writers receive the
+-- fully encoded document.
+local function writeJSON(writer: Writer, path: string, value: any): (boolean, string?)
+    if writer == defaultWriter then
+        return Json.writeFile(path, value)
+    end
+    return writer(path, Json.encode(value))
+end
+
+local function appendWriter(path: string, contents: string): (boolean, string?)
+    local ok, handle = pcall(io.open, path, "a")
+    if not ok or not handle then
+        return false, "unable to open file for appending"
+    end
+
+    handle:write(contents)
+    handle:close()
+    return true, nil
+end
+
 local function vectorComponents(value: any): (number, number, number)
     if typeof(value) == "Vector3" then
         return value.X, value.Y, value.Z
@@ -435,6 +453,50 @@ local function sanitizeRuleRecords(registry, rules): { any }
     return entries
 end
 
+local function columnEntries(rows: TraceRows, first: number, last: number): { any }
+    local entries = table.create(math.max(last - first + 1, 0))
+    local contact = rows.contact
+    for row = first, last do
+        local entry = {
+            rows.entity[row],
+            rows.px[row],
+            rows.py[row],
+            rows.pz[row],
+            rows.vx[row],
+            rows.vy[row],
+            rows.vz[row],
+        }
+        if contact then
+            entry[8] = contact[row]
+        end
+        entries[#entries + 1] = entry
+    end
+    return entries
+end
+
+-- Columnar recordings already carry registered entity indices and plain
+-- numbers, so the trace tuples are read straight out of the arrays.
+local function buildColumnarSteps(columns: TraceColumns): { any }
+    local times = columns.t
+    local first = columns.first or 1
+    local agentRows = columns.agentRows
+    local projectileRows = columns.projectileRows
+    local steps = table.create(math.max(#times - first + 1, 0))
+
+    for step = first, #times do
+        local agentLast = (columns.agentStart[step + 1] or agentRows.count + 1) - 1
+        local projectileLast = (columns.projectileStart[step + 1] or projectileRows.count + 1) - 1
+        steps[step - first + 1] = {
+            times[step],
+            columnEntries(agentRows, columns.agentStart[step], agentLast),
+            columnEntries(projectileRows, columns.projectileStart[step], projectileLast),
+            {},
+        }
+    end
+
+    return steps
+end
+
 function Exporter.sanitizeValue(value: any): any
     return sanitizeValue(value)
 end
@@ -495,6 +557,28 @@ function Exporter.buildTrace(options: ExportOptions?): TracePayload
         return cloned
     end
 
+    if options.columns then
+        local columns = options.columns
+        local trace: TracePayload = {
+            version = Exporter.TRACE_VERSION,
+            steps = buildColumnarSteps(columns),
+        }
+
+        if #columns.agents > 0 then
+            trace.agents = table.clone(columns.agents)
+        end
+
+        if #columns.projectiles > 0 then
+            trace.projectiles = table.clone(columns.projectiles)
+        end
+
+        if options.traceMetadata then
+            trace.metadata = sanitizeValue(options.traceMetadata)
+        end
+
+        return trace
+    end
+
     local steps = {}
     local agentRegistry = createRegistry()
     local projectileRegistry = createRegistry()
@@ -565,23 +649,380 @@ function Exporter.buildTrace(options: ExportOptions?): TracePayload
     return trace
 end
 
+-- Binary traces ("APTB") store the same content as the JSON trace in a
+-- columnar layout. All integers are LEB128 varints; signed values are zigzag
+-- encoded. Times, positions and velocities are quantised to fixed point and
+-- stored as deltas from the previous step (times) or from the same entity's
+-- previous row (kinematics), so steady motion costs a byte or two per field.
+--
+--   magic "APTB", u8 version, f64 time/position/velocity quanta
+--   varint stepCount, agentRowCount, projectileRowCount
+--   string lists: agents, projectiles, rules (varint count, then length-prefixed)
+--   length-prefixed JSON metadata (empty when absent)
+--   length-prefixed sections: time deltas, agent counts per step, agent rows
+--   (entity, dpx, dpy, dpz, dvx, dvy, dvz), projectile counts per step,
+--   projectile rows (entity * 2 + contact, dpx, dpy, dpz, dvx, dvy, dvz)
+--   length-prefixed JSON array of per-step rule entries (empty when absent)
+
+local function createByteWriter(size: number)
+    return {
+        bytes = buffer.create(math.max(size, 16)),
+        cursor = 0,
+    }
+end
+
+local function reserveBytes(writer, count: number)
+    local needed = writer.cursor + count
+    local capacity = buffer.len(writer.bytes)
+    if needed <= capacity then
+        return
+    end
+    while capacity < needed do
+        capacity *= 2
+    end
+    local grown = buffer.create(capacity)
+    buffer.copy(grown, 0, writer.bytes, 0, writer.cursor)
+    writer.bytes = grown
+end
+
+local function writeVarint(writer, value: number)
+    reserveBytes(writer, 10)
+    local bytes = writer.bytes
+    local cursor = writer.cursor
+    while value >= 128 do
+        buffer.writeu8(bytes, cursor, value % 128 + 128)
+        cursor += 1
+        value = math.floor(value / 128)
+    end
+    buffer.writeu8(bytes, cursor, value)
+    writer.cursor = cursor + 1
+end
+
+local function writeSigned(writer, value: number)
+    if value >= 0 then
+        writeVarint(writer, value * 2)
+    else
+        writeVarint(writer, -value * 2 - 1)
+    end
+end
+
+local function writeBytes(writer, contents: string)
+    writeVarint(writer, #contents)
+    reserveBytes(writer, #contents)
+    buffer.writestring(writer.bytes, writer.cursor, contents)
+    writer.cursor += #contents
+end
+
+local function writerContents(writer): string
+    return buffer.readstring(writer.bytes, 0, writer.cursor)
+end
+
+local function quantise(value: any, quantum: number): number
+    local number = tonumber(value) or 0
+    if number ~= number or number == math.huge or number == -math.huge then
+        return 0
+    end
+    return math.floor(number / quantum + 0.5)
+end
+
+local function writeKinematics(rows, previous: { number }, entry: { any }, slot: number, quanta: { number })
+    local base = (slot - 1) * 6
+    for component = 1, 6 do
+        local value = quantise(entry[component + 1], quanta[component])
+        writeSigned(rows, value - (previous[base + component] or 0))
+        previous[base + component] = value
+    end
+end
+
+function Exporter.encodeBinaryTrace(trace: TracePayload, options: BinaryTraceOptions?): string
+    local binaryOptions: BinaryTraceOptions = options or {}
+    local timeQuantum = binaryOptions.timeQuantum or DEFAULT_TIME_QUANTUM
+    local positionQuantum = binaryOptions.positionQuantum or DEFAULT_POSITION_QUANTUM
+    local velocityQuantum = binaryOptions.velocityQuantum or DEFAULT_VELOCITY_QUANTUM
+    local quanta = {
+        positionQuantum,
+        positionQuantum,
+        positionQuantum,
+        velocityQuantum,
+        velocityQuantum,
+        velocityQuantum,
+    }
+
+    local steps = trace.steps or {}
+    local times = createByteWriter(#steps * 2)
+    local agentCounts = createByteWriter(#steps)
+    local agentRows = createByteWriter(#steps * 8)
+    local projectileCounts = createByteWriter(#steps)
+    local projectileRows = createByteWriter(#steps * 8)
+    local agentPrevious = {}
+    local projectilePrevious = {}
+    local agentRowCount = 0
+    local projectileRowCount = 0
+    local rules = {}
+    local hasRules = false
+    local previousTime = 0
+
+    for index, step in ipairs(steps) do
+        local stepTime = quantise(step[1], timeQuantum)
+        writeSigned(times, stepTime - previousTime)
+        previousTime = stepTime
+
+        local agents = step[2] or {}
+        writeVarint(agentCounts, #agents)
+        for _, entry in ipairs(agents) do
+            local entity = entry[1]
+            writeVarint(agentRows, entity)
+            writeKinematics(agentRows, agentPrevious, entry, entity, quanta)
+        end
+        agentRowCount += #agents
+
+        local projectiles = step[3] or {}
+        writeVarint(projectileCounts, #projectiles)
+        for _, entry in ipairs(projectiles) do
+            local entity = entry[1]
+            writeVarint(projectileRows, entity * 2 + (if entry[8] == 1 then 1 else 0))
+            writeKinematics(projectileRows, projectilePrevious, entry, entity, quanta)
+        end
+        projectileRowCount += #projectiles
+
+        local stepRules = step[4] or {}
+        rules[index] = stepRules
+        if #stepRules > 0 then
+            hasRules = true
+        end
+    end
+
+    local output = createByteWriter(
+        64 + times.cursor + agentCounts.cursor + agentRows.cursor + projectileCounts.cursor + projectileRows.cursor
+    )
+    reserveBytes(output, 29)
+    buffer.writestring(output.bytes, 0, Exporter.BINARY_TRACE_MAGIC)
+    buffer.writeu8(output.bytes, 4, Exporter.BINARY_TRACE_VERSION)
+    buffer.writef64(output.bytes, 5, timeQuantum)
+    buffer.writef64(output.bytes, 13, positionQuantum)
+    buffer.writef64(output.bytes, 21, velocityQuantum)
+    output.cursor = 29
+
+    writeVarint(output, #steps)
+    writeVarint(output, agentRowCount)
+    writeVarint(output, projectileRowCount)
+
+    for _, names in ipairs({ trace.agents or {}, trace.projectiles or {}, trace.rules or {} }) do
+        writeVarint(output, #names)
+        for _, name in ipairs(names) do
+            writeBytes(output, tostring(name))
+        end
+    end
+
+    writeBytes(output, if trace.metadata then Json.encode(trace.metadata) else "")
+
+    for _, section in ipairs({ times, agentCounts, agentRows, projectileCounts, projectileRows }) do
+        writeBytes(output, writerContents(section))
+    end
+
+    writeBytes(output, if hasRules then Json.encode(rules) else "")
+
+    return writerContents(output)
+end
+
+local function createByteReader(contents: string)
+    return {
+        bytes = buffer.fromstring(contents),
+        cursor = 0,
+    }
+end
+
+local function readVarint(reader): number
+    local bytes = reader.bytes
+    local cursor = reader.cursor
+    local value = 0
+    local scale = 1
+    while true do
+        local byte = buffer.readu8(bytes, cursor)
+        cursor += 1
+        value += (byte % 128) * scale
+        if byte < 128 then
+            break
+        end
+        scale *= 128
+    end
+    reader.cursor = cursor
+    return value
+end
+
+local function readSigned(reader): number
+    local value = readVarint(reader)
+    if value % 2 == 0 then
+        return value / 2
+    end
+    return -(value + 1) / 2
+end
+
+local function readBytes(reader): string
+    local length = readVarint(reader)
+    local contents = buffer.readstring(reader.bytes, reader.cursor, length)
+    reader.cursor += length
+    return contents
+end
+
+local function readKinematics(reader, previous: { number }, entry: { any }, slot: number, quanta: { number })
+    local base = (slot - 1) * 6
+    for component = 1, 6 do
+        local value = (previous[base + component] or 0) + readSigned(reader)
+        previous[base + component] = value
+        entry[component + 1] = value * quanta[component]
+    end
+end
+
+-- Inverse of encodeBinaryTrace up to quantisation. Used by specs; offline
+-- analysis should go through tests/tools/read_binary_trace.py instead.
+function Exporter.decodeBinaryTrace(contents: string, decodeJSON: ((string) -> any)?): TracePayload
+    if string.sub(contents, 1, 4) ~= Exporter.BINARY_TRACE_MAGIC then
+        error("Exporter: not a binary trace", 2)
+    end
+
+    local reader = createByteReader(contents)
+    local version = buffer.readu8(reader.bytes, 4)
+    if version ~= Exporter.BINARY_TRACE_VERSION then
+        error(string.format("Exporter: unsupported binary trace version %d", version), 2)
+    end
+
+    local timeQuantum = buffer.readf64(reader.bytes, 5)
+    local positionQuantum = buffer.readf64(reader.bytes, 13)
+    local velocityQuantum = buffer.readf64(reader.bytes, 21)
+    local quanta = {
+        positionQuantum,
+        positionQuantum,
+        positionQuantum,
+        velocityQuantum,
+        velocityQuantum,
+        velocityQuantum,
+    }
+    reader.cursor = 29
+
+    local stepCount = readVarint(reader)
+    readVarint(reader)
+    readVarint(reader)
+
+    local registries = {}
+    for index = 1, 3 do
+        local count = readVarint(reader)
+        local names = table.create(count)
+        for nameIndex = 1, count do
+            names[nameIndex] = readBytes(reader)
+        end
+        registries[index] = names
+    end
+
+    local metadata = readBytes(reader)
+    local sections = {}
+    for index = 1, 5 do
+        local length = readVarint(reader)
+        sections[index] = { bytes = reader.bytes, cursor = reader.cursor }
+        reader.cursor += length
+    end
+    local encodedRules = readBytes(reader)
+    local rules = if decodeJSON and encodedRules ~= "" then decodeJSON(encodedRules) else nil
+
+    local times, agentCounts, agentRows, projectileCounts, projectileRows = table.unpack(sections)
+    local agentPrevious = {}
+    local projectilePrevious = {}
+    local steps = table.create(stepCount)
+    local stepTime = 0
+
+    for index = 1, stepCount do
+        stepTime += readSigned(times)
+
+        local agentCount = readVarint(agentCounts)
+        local agents = table.create(agentCount)
+        for row = 1, agentCount do
+            local entity = readVarint(agentRows)
+            local entry = { entity }
+            readKinematics(agentRows, agentPrevious, entry, entity, quanta)
+            agents[row] = entry
+        end
+
+        local projectileCount = readVarint(projectileCounts)
+        local projectiles = table.create(projectileCount)
+        for row = 1, projectileCount do
+            local packed = readVarint(projectileRows)
+            local entity = math.floor(packed / 2)
+            local entry = { entity }
+            readKinematics(projectileRows, projectilePrevious, entry, entity, quanta)
+            entry[8] = packed % 2
+            projectiles[row] = entry
+        end
+
+        steps[index] = { stepTime * timeQuantum, agents, projectiles, if rules then rules[index] else {} }
+    end
+
+    local trace: TracePayload = {
+        version = Exporter.TRACE_VERSION,
+        steps = steps,
+    }
+
+    local agents, projectiles, ruleNames = table.unpack(registries)
+    if #agents > 0 then
+        trace.agents = agents
+    end
+    if #projectiles > 0 then
+        trace.projectiles = projectiles
+    end
+    if #ruleNames > 0 then
+        trace.rules = ruleNames
+    end
+    if decodeJSON and metadata ~= "" then
+        trace.metadata = decodeJSON(metadata)
+    end
+
+    return trace
+end
+
 function Exporter.encode(value: any): string
-    return encodeJSON(value)
+    return Json.encode(value)
 end
 
 function Exporter.encodePayload(payload: TelemetryPayload): string
-    return encodeJSON(payload)
+    return Json.encode(payload)
 end
 
 function Exporter.encodeTrace(trace: TracePayload): string
-    return encodeJSON(trace)
+    return Json.encode(trace)
 end
 
-local function determinePaths(root: string, runId: string)
+-- Returns a sink for World telemetry spills: every chunk handed to it (an
+-- ExportOptions table carrying `steps` or `columns`) is written as one trace
+-- object per line, so long runs stream to disk instead of accumulating.
+function Exporter.createTraceSpill(options: SpillOptions?): (ExportOptions) -> (boolean, string?)
+    local spillOptions: SpillOptions = options or {}
+
+    local path = spillOptions.path
+    if path == nil then
+        local root = spillOptions.artifactRoot or "tests/artifacts/engine/telemetry"
+        path = string.format("%s/%s-trace.jsonl", root, spillOptions.runId or "telemetry")
+        if spillOptions.writer == nil then
+            ensureDirectory(root)
+        end
+    end
+
+    local writer = spillOptions.writer or appendWriter
+    local chunk = 0
+
+    return function(chunkOptions: ExportOptions): (boolean, string?)
+        chunk += 1
+        local trace = Exporter.buildTrace(chunkOptions)
+        local metadata = cloneTable(spillOptions.traceMetadata or {})
+        metadata.chunk = chunk
+        trace.metadata = sanitizeValue(metadata)
+        return writer(path :: string, Json.encode(trace) .. "\n")
+    end
+end
+
+local function determinePaths(root: string, runId: string, traceFormat: string)
     local base = string.format("%s/%s", root, runId)
     return {
         payload = base .. "-observability.json",
-        trace = base .. "-trace.json",
+        trace = base .. (if traceFormat == "binary" then "-trace.bin" else "-trace.json"),
     }
 end
 
@@ -609,17 +1050,23 @@ function Exporter.writeArtifacts(options: ExportOptions?): (boolean, { [string]:
 
     local trace = Exporter.buildTrace(options)
 
-    local payloadContents = encodeJSON(payload)
-    local traceContents = encodeJSON(trace)
+    local traceFormat = options.traceFormat or "json"
+    if traceFormat ~= "json" and traceFormat ~= "binary" then
+        return false, nil, "unknown trace format"
+    end
 
-    local paths = determinePaths(root, runId)
+    local paths = determinePaths(root, runId, traceFormat)
 
-    local ok, err = writer(paths.payload, payloadContents)
+    local ok, err = writeJSON(writer, paths.payload, payload)
     if not ok then
         return false, nil, err
     end
 
-    ok, err = writer(paths.trace, traceContents)
+    if traceFormat == "binary" then
+        ok, err = writer(paths.trace, Exporter.encodeBinaryTrace(trace, options.binary))
+    else
+        ok, err = writeJSON(writer, paths.trace, trace)
+    end
     if not ok then
         return false, nil, err
     end
@@ -0,0 +1,179 @@
+--!strict
+
+-- Shared JSON encoder for engine artifacts. Values are appended to a flat
+-- chunk list instead of concatenating nested strings, each table's shape is
+-- classified once per encode, and `encodeTo` hands completed chunks to a sink so
+-- large payloads can be written without building the whole document in memory.
+-- Output matches the previous per-module encoders: object keys are sorted and
+-- non-finite numbers become `null`.
+
+local Json = {}
+
+export type Sink = (chunk: string) -> ()
+
+local FLUSH_PARTS = 4096
+
+local ESCAPES = {
+    ["\\"] = "\\\\",
+    ['"'] = '\\"',
+    ["\b"] = "\\b",
+    ["\f"] = "\\f",
+    ["\n"] = "\\n",
+    ["\r"] = "\\r",
+    ["\t"] = "\\t",
+}
+
+type Encoder = {
+    parts: { string },
+    count: number,
+    sink: Sink?,
+    shapes: { [any]: any },
+}
+
+local function quote(value: string): string
+    if string.find(value, '[%c"\\]') == nil then
+        return '"' .. value .. '"'
+    end
+    return '"' .. string.gsub(value, '[\\"\b\f\n\r\t]', ESCAPES) .. '"'
+end
+
+local function push(encoder: Encoder, text: string)
+    local count = encoder.count + 1
+    encoder.parts[count] = text
+    encoder.count = count
+
+    local sink = encoder.sink
+    if sink and count >= FLUSH_PARTS then
+        sink(table.concat(encoder.parts, "", 1, count))
+        table.clear(encoder.parts)
+        encoder.count = 0
+    end
+end
+
+-- Arrays are tables whose keys are all numbers with the largest equal to the
+-- key count (the historical `isArray` rule); the shape is the length. Objects
+-- resolve to their quoted keys in sorted order plus a lookup back to the key.
+local function shapeOf(encoder: Encoder, value: { [any]: any }): any
+    local shape = encoder.shapes[value]
+    if shape ~= nil then
+        return shape
+    end
+
+    local count = 0
+    local maxIndex = 0
+    local numeric = true
+    for key in pairs(value) do
+        if type(key) ~= "number" then
+            numeric = false
+            break
+        end
+        if key > maxIndex then
+            maxIndex = key
+        end
+        count += 1
+    end
+
+    if numeric and maxIndex == count then
+        shape = count
+    else
+        local quoted = {}
+        local lookup = {}
+        for key in pairs(value) do
+            local keyType = type(key)
+            if keyType == "string" or keyType == "number" then
+                local encodedKey = quote(tostring(key))
+                if lookup[encodedKey] == nil then
+                    quoted[#quoted + 1] = encodedKey
+                    lookup[encodedKey] = key
+                end
+            end
+        end
+        table.sort(quoted)
+        shape = { keys = quoted, lookup = lookup }
+    end
+
+    encoder.shapes[value] = shape
+    return shape
+end
+
+local function writeValue(encoder: Encoder, value: any)
+    local valueType = type(value)
+
+    if valueType == "string" then
+        push(encoder, quote(value))
+    elseif valueType == "number" then
+        if value ~= value or value == math.huge or value == -math.huge then
+            push(encoder, "null")
+        else
+            push(encoder, tostring(value))
+        end
+    elseif valueType == "boolean" then
+        push(encoder, if value then "true" else "false")
+    elseif valueType == "table" then
+        local shape = shapeOf(encoder, value)
+        if type(shape) == "number" then
+            push(encoder, "[")
+            for index = 1, shape do
+                if index > 1 then
+                    push(encoder, ",")
+                end
+                writeValue(encoder, value[index])
+            end
+            push(encoder, "]")
+        else
+            push(encoder, "{")
+            local lookup = shape.lookup
+            for index, encodedKey in ipairs(shape.keys) do
+                push(encoder, if index > 1 then "," .. encodedKey .. ":" else encodedKey .. ":")
+                writeValue(encoder, value[lookup[encodedKey]])
+            end
+            push(encoder, "}")
+        end
+    else
+        push(encoder, "null")
+    end
+end
+
+local function createEncoder(sink: Sink?): Encoder
+    return {
+        parts = table.create(if sink then FLUSH_PARTS else 64),
+        count = 0,
+        sink = sink,
+        shapes = setmetatable({}, { __mode = "k" }) :: any,
+    }
+end
+
+function Json.encode(value: any): string
+    local encoder = createEncoder(nil)
+    writeValue(encoder, value)
+    return table.concat(encoder.parts, "", 1, encoder.count)
+end
+
+-- Streams the encoded document to `sink` in chunks of roughly FLUSH_PARTS
+-- tokens. The concatenation of all chunks equals `Json.encode(value)`.
+function Json.encodeTo(value: any, sink: Sink)
+    local encoder = createEncoder(sink)
+    writeValue(encoder, value)
+    if encoder.count > 0 then
+        sink(table.concat(encoder.parts, "", 1, encoder.count))
+    end
+end
+
+function Json.writeFile(path: string, value: any): (boolean, string?)
+    local ok, handle = pcall(io.open, path, "wb")
+    if not ok or not handle then
+        return false, "unable to open file for writing"
+    end
+
+    local written, err = pcall(Json.encodeTo, value, function(chunk)
+        handle:write(chunk)
+    end)
+    handle:close()
+
+    if not written then
+        return false, tostring(err)
+    end
+    return true, nil
+end
+
+return Json
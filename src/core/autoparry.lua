@@ -11,6 +11,8 @@ local Require = rawget(_G, "ARequire")
 local Util = Require and Require("src/shared/util.lua") or require(script.Parent.Parent.shared.util)
 
 local Signal = Util.Signal
+local RingBuffer = Util.RingBuffer
+local StreamingQuantile = Util.StreamingQuantile
 local Verification = Require and Require("src/core/verification.lua") or require(script.Parent.verification)
 local ImmortalModule = Require and Require("src/core/immortal.lua") or require(script.Parent.immortal)
 
@@ -20,19 +22,15 @@ local BallKinematics
 
 local emitTelemetryEvent
 local telemetryDispatcher: ((string, { [string]: any }?) -> any)? = nil
-local pendingTelemetryEvents = {}
 local MAX_PENDING_TELEMETRY_EVENTS = 128
+local pendingTelemetryEvents = RingBuffer.new(MAX_PENDING_TELEMETRY_EVENTS)
 local MIN_TRANSIENT_RETRY_COOLDOWN = 1 / 60
 
 local function queueTelemetryEvent(eventType: string, payload: { [string]: any }?)
-    pendingTelemetryEvents[#pendingTelemetryEvents + 1] = {
+    pendingTelemetryEvents:push({
         eventType = eventType,
         payload = payload,
-    }
-
-    if #pendingTelemetryEvents > MAX_PENDING_TELEMETRY_EVENTS then
-        table.remove(pendingTelemetryEvents, 1)
-    end
+    })
 end
 
 local function flushPendingTelemetryEvents()
@@ -40,12 +38,12 @@ local function flushPendingTelemetryEvents()
         return
     end
 
-    if #pendingTelemetryEvents == 0 then
+    if pendingTelemetryEvents:len() == 0 then
         return
     end
 
-    local queued = pendingTelemetryEvents
-    pendingTelemetryEvents = {}
+    local queued = pendingTelemetryEvents:toArray()
+    pendingTelemetryEvents:clear()
 
     for _, entry in ipairs(queued) do
         telemetryDispatcher(entry.eventType, entry.payload)
@@ -255,6 +253,11 @@ local Constants = {
     ACTIVATION_LATENCY_ALPHA = 0.2,
     VR_SIGN_EPSILON = 1e-3,
     OSCILLATION_HISTORY_SECONDS = 0.6,
+    -- Ring-buffer capacities for the time-trimmed sample windows. They only
+    -- bound memory; the windows are still trimmed by age.
+    OSCILLATION_HISTORY_CAPACITY = 512,
+    TARGETING_PULSE_CAPACITY = 512,
+    TELEMETRY_HISTORY_LIMIT = 200,
     TARGETING_GRACE_SECONDS = 0.2,
     TARGETING_SAFE_DROP_GRACE = 0.035,
     TARGETING_SAFE_RETARGET_DELAY = 0.02,
@@ -265,6 +268,22 @@ local Constants = {
     SIMULATION_MAX_STEPS = 72,
     SIMULATION_RESOLUTION = 1 / 180,
     BALLISTIC_CACHE_MAX_AGE = 0.05,
+    -- Entries matched by quantised key stay reusable for longer than the
+    -- tolerance-based fallback, which compares against the last inputs only.
+    BALLISTIC_CACHE_KEYED_MAX_AGE = 0.25,
+    BALLISTIC_CACHE_ENTRIES = 8,
+    BALLISTIC_CACHE_KEY_FIELDS = {
+        "safe",
+        "distance",
+        "vr",
+        "ar",
+        "jr",
+        "curvature",
+        "curvatureRate",
+        "speed",
+        "horizon",
+        "maxHorizon",
+    },
     BALLISTIC_CACHE_TOLERANCE = {
         safe = 0.03,
         distance = 0.045,
@@ -427,6 +446,8 @@ local TARGET_SELECTION_TIME_WEIGHT = 0.9
 local TARGET_SELECTION_THREAT_WEIGHT = 1.05
 local TARGET_SELECTION_URGENCY_WEIGHT = 1.2
 local PERFORMANCE_SAMPLE_INTERVAL = 0.2
+local TELEMETRY_SWEEP_INTERVAL = 0.5
+local LATENCY_PRUNE_INTERVAL = 0.25
 local PERFORMANCE_PING_BASELINE = 0.05
 local PERFORMANCE_PING_OPTIMAL = 0.035
 local PERFORMANCE_PING_PANIC = 0.18
@@ -584,8 +605,7 @@ local Context = {
         characterRemoving = nil :: RBXScriptConnection?,
     },
     telemetry = {
-        historyLimit = 200,
-        history = {} :: { { [string]: any } },
+        history = RingBuffer.new(Constants.TELEMETRY_HISTORY_LIMIT),
         sequence = 0,
     },
     hooks = {
@@ -690,7 +710,10 @@ function Helpers.summariseAggregate(source)
     }
 end
 
-function Helpers.newQuantileEstimator(targetQuantile, maxSamples)
+-- `mode` selects the backing store: "exact" (default) keeps the last
+-- `maxSamples` values sorted, "streaming" keeps a constant-size P-squared
+-- sketch over a window of roughly `maxSamples` values.
+function Helpers.newQuantileEstimator(targetQuantile, maxSamples, mode)
     local quantile = targetQuantile
     if not Helpers.isFiniteNumber(quantile) then
         quantile = 0.5
@@ -706,6 +729,15 @@ function Helpers.newQuantileEstimator(targetQuantile, maxSamples)
         capacity = 3
     end
 
+    if mode == "streaming" then
+        return {
+            mode = "streaming",
+            quantile = quantile,
+            maxSamples = capacity,
+            sketch = StreamingQuantile.new(quantile, capacity),
+        }
+    end
+
     return {
         quantile = quantile,
         maxSamples = capacity,
@@ -761,6 +793,14 @@ function Helpers.updateQuantileEstimator(estimator, value)
         return
     end
 
+    if estimator.mode == "streaming" then
+        if typeof(estimator.sketch) ~= "table" then
+            estimator.sketch = StreamingQuantile.new(estimator.quantile or 0.5, estimator.maxSamples or 256)
+        end
+        StreamingQuantile.push(estimator.sketch, value)
+        return
+    end
+
     local samples = estimator.samples
     if typeof(samples) ~= "table" then
         samples = {}
@@ -801,6 +841,13 @@ function Helpers.summariseQuantileEstimator(estimator)
         return { count = 0 }
     end
 
+    if estimator.mode == "streaming" then
+        if typeof(estimator.sketch) ~= "table" then
+            return { count = 0 }
+        end
+        return StreamingQuantile.summarise(estimator.sketch)
+    end
+
     local samples = estimator.samples
     if typeof(samples) ~= "table" or #samples == 0 then
         return { count = 0 }
@@ -893,6 +940,12 @@ function Helpers.significantDelta(previous, current, absoluteTolerance, relative
     return true
 end
 
+local ballisticCacheStats = {
+    hits = 0,
+    misses = 0,
+    evictions = 0,
+}
+
 function Helpers.ensureBallisticCache(telemetry)
     if typeof(telemetry) ~= "table" then
         return nil
@@ -901,19 +954,26 @@ function Helpers.ensureBallisticCache(telemetry)
     local cache = telemetry.ballisticCache
     if typeof(cache) ~= "table" then
         cache = {
-            inputs = {},
-            result = {},
-            timestamp = 0,
+            entries = {},
+            byKey = {},
+            components = {},
+            mru = nil,
+            clock = 0,
             reuseCount = 0,
+            hitStreak = 0,
         }
         telemetry.ballisticCache = cache
     else
-        if typeof(cache.inputs) ~= "table" then
-            cache.inputs = {}
+        if typeof(cache.entries) ~= "table" then
+            cache.entries = {}
+        end
+        if typeof(cache.byKey) ~= "table" then
+            cache.byKey = {}
         end
-        if typeof(cache.result) ~= "table" then
-            cache.result = {}
+        if typeof(cache.components) ~= "table" then
+            cache.components = {}
         end
+        cache.clock = cache.clock or 0
         cache.reuseCount = cache.reuseCount or 0
         cache.hitStreak = cache.hitStreak or 0
     end
@@ -921,7 +981,11 @@ function Helpers.ensureBallisticCache(telemetry)
     return cache
 end
 
-function Helpers.quantizeBallisticInputs(inputs)
+-- Quantises the ballistic inputs on the BALLISTIC_CACHE_QUANTIZE grid and
+-- mixes the integers into a numeric key. When `components` is given it is
+-- filled with the quantised values so a cache hit can be verified against
+-- hash collisions. Returns nil if any input is missing or non-finite.
+function Helpers.quantizeBallisticInputs(inputs, components)
     if typeof(inputs) ~= "table" then
         return nil
     end
@@ -931,84 +995,176 @@ function Helpers.quantizeBallisticInputs(inputs)
         return nil
     end
 
-    local components = {}
-    for key, step in pairs(quantize) do
-        local value = inputs[key]
-        if Helpers.isFiniteNumber(value) and Helpers.isFiniteNumber(step) and step > 0 then
-            local quantized = math.floor(value / step + 0.5)
-            components[#components + 1] = string.format("%s:%d", key, quantized)
-        elseif value ~= nil then
-            components[#components + 1] = string.format("%s:%s", key, tostring(value))
+    local key = 0
+    for index, field in ipairs(Constants.BALLISTIC_CACHE_KEY_FIELDS) do
+        local value = inputs[field]
+        local step = quantize[field]
+        if not Helpers.isFiniteNumber(value) or not Helpers.isFiniteNumber(step) or step <= 0 then
+            return nil
+        end
+
+        local quantized = math.floor(value / step + 0.5)
+        if components then
+            components[index] = quantized
         end
+        -- Lehmer-style mixing modulo a 31-bit prime keeps every intermediate
+        -- product exactly representable as a double.
+        key = (key * 48271 + quantized) % 2147483647
     end
 
-    table.sort(components)
-    if #components == 0 then
-        return nil
+    return key
+end
+
+function Helpers.ballisticComponentsMatch(left, right)
+    for index = 1, #Constants.BALLISTIC_CACHE_KEY_FIELDS do
+        if left[index] ~= right[index] then
+            return false
+        end
+    end
+    return true
+end
+
+function Helpers.isBallisticEntryFresh(entry, now, maxAge)
+    if not Helpers.isFiniteNumber(now) or not Helpers.isFiniteNumber(entry.timestamp) or not maxAge or maxAge <= 0 then
+        return true
     end
+    return now - entry.timestamp <= maxAge
+end
 
-    return table.concat(components, "|")
+function Helpers.recordBallisticCacheHit(cache, entry)
+    entry.lastUsed = cache.clock
+    cache.mru = entry
+    ballisticCacheStats.hits += 1
 end
 
+-- Returns `refresh, quantizedKey, entry`. On a hit `entry` holds the cached
+-- simulation; on a miss the caller simulates and stores the result with
+-- Helpers.storeBallisticCacheEntry.
 function Helpers.shouldRefreshBallisticCache(cache, inputs, now)
-    local quantizedKey = Helpers.quantizeBallisticInputs(inputs)
-
-    if typeof(cache) ~= "table" or typeof(cache.inputs) ~= "table" then
-        return true, quantizedKey
+    if typeof(cache) ~= "table" or typeof(cache.entries) ~= "table" then
+        return true, Helpers.quantizeBallisticInputs(inputs), nil
     end
 
-    local tolerance = Constants.BALLISTIC_CACHE_TOLERANCE or {}
-    local relative = Constants.BALLISTIC_CACHE_RELATIVE or {}
+    local components = cache.components
+    local quantizedKey = Helpers.quantizeBallisticInputs(inputs, components)
+    cache.clock += 1
 
-    local timestamp = cache.timestamp
-    local maxAge = Constants.BALLISTIC_CACHE_MAX_AGE or 0
-    if Helpers.isFiniteNumber(now) and Helpers.isFiniteNumber(timestamp) and maxAge > 0 then
-        if now - timestamp > maxAge then
-            return true, quantizedKey
+    if quantizedKey then
+        local entry = cache.byKey[quantizedKey]
+        if
+            entry
+            and Helpers.ballisticComponentsMatch(entry.components, components)
+            and Helpers.isBallisticEntryFresh(entry, now, Constants.BALLISTIC_CACHE_KEYED_MAX_AGE)
+        then
+            cache.hitStreak += 1
+            Helpers.recordBallisticCacheHit(cache, entry)
+            return false, quantizedKey, entry
         end
     end
 
-    if quantizedKey and cache.quantizedKey == quantizedKey then
-        cache.hitStreak = (cache.hitStreak or 0) + 1
-        return false, quantizedKey
+    local entry = cache.mru
+    if not entry or not Helpers.isBallisticEntryFresh(entry, now, Constants.BALLISTIC_CACHE_MAX_AGE) then
+        return true, quantizedKey, nil
     end
 
-    local previous = cache.inputs
+    local tolerance = Constants.BALLISTIC_CACHE_TOLERANCE or {}
+    local relative = Constants.BALLISTIC_CACHE_RELATIVE or {}
+    local previous = entry.inputs
 
     if Helpers.significantDelta(previous.safe, inputs.safe, tolerance.safe, relative.safe) then
-        return true, quantizedKey
+        return true, quantizedKey, nil
     end
     if Helpers.significantDelta(previous.distance, inputs.distance, tolerance.distance, relative.distance) then
-        return true, quantizedKey
+        return true, quantizedKey, nil
     end
     if Helpers.significantDelta(previous.vr, inputs.vr, tolerance.vr, relative.vr) then
-        return true, quantizedKey
+        return true, quantizedKey, nil
     end
     if Helpers.significantDelta(previous.ar, inputs.ar, tolerance.ar, relative.ar) then
-        return true, quantizedKey
+        return true, quantizedKey, nil
     end
     if Helpers.significantDelta(previous.jr, inputs.jr, tolerance.jr, relative.jr) then
-        return true, quantizedKey
+        return true, quantizedKey, nil
     end
     if Helpers.significantDelta(previous.curvature, inputs.curvature, tolerance.curvature, relative.curvature) then
-        return true, quantizedKey
+        return true, quantizedKey, nil
     end
     if Helpers.significantDelta(previous.curvatureRate, inputs.curvatureRate, tolerance.curvatureRate, relative.curvatureRate) then
-        return true, quantizedKey
+        return true, quantizedKey, nil
     end
     if Helpers.significantDelta(previous.speed, inputs.speed, tolerance.speed, relative.speed) then
-        return true, quantizedKey
+        return true, quantizedKey, nil
     end
     if Helpers.significantDelta(previous.horizon, inputs.horizon, tolerance.horizon, relative.horizon) then
-        return true, quantizedKey
+        return true, quantizedKey, nil
     end
     if Helpers.significantDelta(previous.maxHorizon, inputs.maxHorizon, tolerance.maxHorizon, relative.maxHorizon) then
-        return true, quantizedKey
+        return true, quantizedKey, nil
     end
 
     cache.hitStreak = 0
+    Helpers.recordBallisticCacheHit(cache, entry)
 
-    return false, quantizedKey
+    return false, quantizedKey, entry
+end
+
+-- Claims the entry for `quantizedKey`, evicting the least recently used one
+-- when the cache is full, and records `inputs` against it. The quantised
+-- components come from the preceding shouldRefreshBallisticCache call. The
+-- returned entry's `result` table can be handed to the simulation as `reuse`.
+function Helpers.storeBallisticCacheEntry(cache, quantizedKey, inputs, now)
+    local entries = cache.entries
+    local byKey = cache.byKey
+
+    local entry = quantizedKey and byKey[quantizedKey] or nil
+    if not entry then
+        local capacity = math.max(Constants.BALLISTIC_CACHE_ENTRIES or 1, 1)
+        if #entries < capacity then
+            entry = { inputs = {}, components = {}, result = {} }
+            entries[#entries + 1] = entry
+        else
+            entry = entries[1]
+            for index = 2, #entries do
+                local candidate = entries[index]
+                if candidate.lastUsed < entry.lastUsed then
+                    entry = candidate
+                end
+            end
+            if entry.key ~= nil and byKey[entry.key] == entry then
+                byKey[entry.key] = nil
+            end
+            ballisticCacheStats.evictions += 1
+        end
+    end
+
+    local entryInputs = entry.inputs
+    Helpers.clearTable(entryInputs)
+    for key, value in pairs(inputs) do
+        entryInputs[key] = value
+    end
+
+    if quantizedKey then
+        table.move(cache.components, 1, #Constants.BALLISTIC_CACHE_KEY_FIELDS, 1, entry.components)
+        byKey[quantizedKey] = entry
+    end
+
+    entry.key = quantizedKey
+    entry.timestamp = now
+    entry.lastUsed = cache.clock
+    cache.mru = entry
+    ballisticCacheStats.misses += 1
+
+    return entry
+end
+
+function Helpers.getBallisticCacheStats()
+    local lookups = ballisticCacheStats.hits + ballisticCacheStats.misses
+    return {
+        hits = ballisticCacheStats.hits,
+        misses = ballisticCacheStats.misses,
+        evictions = ballisticCacheStats.evictions,
+        hitRate = if lookups > 0 then ballisticCacheStats.hits / lookups else 0,
+    }
 end
 
 function Helpers.emaScalar(previous: number?, sample: number, alpha: number)
@@ -2355,8 +2511,8 @@ function TelemetryAnalytics.resetMetrics(resetCount)
             transitions = 0,
         },
         quantiles = {
-            commitLatency = Helpers.newQuantileEstimator(0.99, 512),
-            scheduleLookahead = Helpers.newQuantileEstimator(Defaults.SMART_TUNING.lookaheadQuantile or 0.1, 512),
+            commitLatency = Helpers.newQuantileEstimator(0.99, 2048, "streaming"),
+            scheduleLookahead = Helpers.newQuantileEstimator(Defaults.SMART_TUNING.lookaheadQuantile or 0.1, 2048, "streaming"),
         },
         inFlight = {},
         performance = {
@@ -4117,9 +4273,9 @@ type TelemetryState = {
     filteredJr: number,
     lastD0: number?,
     lastD0Delta: number,
-    d0DeltaHistory: { { time: number, delta: number } },
+    d0DeltaHistory: any, -- RingBuffer of { time: number, delta: number }
     lastVrSign: number?,
-    vrSignFlips: { { time: number, sign: number } },
+    vrSignFlips: any, -- RingBuffer of { time: number, sign: number }
     lastOscillationCheck: number,
     lastOscillationFrequency: number,
     lastOscillationDelta: number,
@@ -4305,9 +4461,9 @@ function Helpers.trimHistory(history, cutoff)
         return
     end
 
-    while #history > 0 and history[1].time < cutoff do
-        table.remove(history, 1)
-    end
+    history:trimWhile(function(entry)
+        return entry.time < cutoff
+    end)
 end
 
 function Helpers.evaluateOscillation(telemetry: TelemetryState?, now: number)
@@ -4325,8 +4481,8 @@ function Helpers.evaluateOscillation(telemetry: TelemetryState?, now: number)
         return false, 0, 0, 0
     end
 
-    local flips = telemetry.vrSignFlips or {}
-    local flipCount = #flips
+    local flips = telemetry.vrSignFlips
+    local flipCount = flips and flips:len() or 0
     telemetry.lastOscillationCount = flipCount
 
     if flipCount < math.max(2, math.ceil(freqThreshold)) then
@@ -4340,25 +4496,29 @@ function Helpers.evaluateOscillation(telemetry: TelemetryState?, now: number)
     local lastIndex = flipCount
     local requiredFlips = math.max(math.ceil(freqThreshold), 2)
     local firstIndex = math.max(1, lastIndex - requiredFlips + 1)
-    local earliest = flips[firstIndex].time
-    local latest = flips[lastIndex].time
+    local earliest = flips:get(firstIndex).time
+    local latest = flips:get(lastIndex).time
     local span = math.max(latest - earliest, Constants.EPSILON)
     local intervals = lastIndex - firstIndex
     local frequency = intervals / span
 
     local d0Threshold = config.oscillationDistanceDelta or 0
-    local d0History = telemetry.d0DeltaHistory or {}
+    local d0History = telemetry.d0DeltaHistory
     local windowStart = earliest
     local maxDelta = 0
     local smallDeltaCount = 0
     local considered = 0
-    for _, entry in ipairs(d0History) do
-        if entry.time >= windowStart then
-            considered += 1
-            maxDelta = math.max(maxDelta, entry.delta)
-            if entry.delta <= d0Threshold then
-                smallDeltaCount += 1
-            end
+    -- Samples are appended in time order, so walk back from the newest until
+    -- the window start instead of scanning the whole history.
+    for index = d0History and d0History:len() or 0, 1, -1 do
+        local entry = d0History:get(index)
+        if entry.time < windowStart then
+            break
+        end
+        considered += 1
+        maxDelta = math.max(maxDelta, entry.delta)
+        if entry.delta <= d0Threshold then
+            smallDeltaCount += 1
         end
     end
 
@@ -5135,19 +5295,7 @@ function Helpers.computePressRearmWindow(state, telemetry)
         end
     end
 
-    local adaptiveProfile = Context.runtime.telemetryAdaptiveProfile
-    if typeof(adaptiveProfile) ~= "table" then
-        adaptiveProfile = nil
-    end
-    if adaptiveProfile == nil and Context.runtime.telemetrySummary ~= nil then
-        local computedProfile = Helpers.computeAdaptiveProfile(Context.runtime.telemetrySummary, os.clock())
-        if typeof(computedProfile) == "table" then
-            adaptiveProfile = computedProfile
-            Context.runtime.telemetryAdaptiveProfile = Helpers.cloneTable(adaptiveProfile)
-        else
-            adaptiveProfile = nil
-        end
-    end
+    local adaptiveProfile = Helpers.resolveAdaptiveProfile(state and state.frame)
 
     local profile = typeof(adaptiveProfile) == "table" and adaptiveProfile or nil
 
@@ -5302,19 +5450,7 @@ function Helpers.computePressRearmMinDelay(state, telemetry, window, now, metric
         end
     end
 
-    local adaptiveProfile = Context.runtime.telemetryAdaptiveProfile
-    if typeof(adaptiveProfile) ~= "table" then
-        adaptiveProfile = nil
-    end
-    if adaptiveProfile == nil and Context.runtime.telemetrySummary ~= nil then
-        local computedProfile = Helpers.computeAdaptiveProfile(Context.runtime.telemetrySummary, os.clock())
-        if typeof(computedProfile) == "table" then
-            adaptiveProfile = computedProfile
-            Context.runtime.telemetryAdaptiveProfile = Helpers.cloneTable(adaptiveProfile)
-        else
-            adaptiveProfile = nil
-        end
-    end
+    local adaptiveProfile = Helpers.resolveAdaptiveProfile(state and state.frame)
 
     local profile = typeof(adaptiveProfile) == "table" and adaptiveProfile or nil
 
@@ -7898,7 +8034,7 @@ function Helpers.publishLatencyTelemetry()
     settings.LatencySamples = latencySamples
     settings.RemoteLatencyActive = state.remoteEstimatorActive
     if publishTelemetryHistory then
-        publishTelemetryHistory()
+        Helpers.markTelemetryDirty()
     end
 end
 
@@ -8051,9 +8187,9 @@ function Helpers.ensureTelemetry(ballId: string, now: number): TelemetryState
         filteredJr = 0,
         lastD0 = nil,
         lastD0Delta = 0,
-        d0DeltaHistory = {},
+        d0DeltaHistory = RingBuffer.new(Constants.OSCILLATION_HISTORY_CAPACITY),
         lastVrSign = nil,
-        vrSignFlips = {},
+        vrSignFlips = RingBuffer.new(Constants.OSCILLATION_HISTORY_CAPACITY),
         lastOscillationCheck = now,
         lastOscillationFrequency = 0,
         lastOscillationDelta = 0,
@@ -8069,7 +8205,7 @@ function Helpers.ensureTelemetry(ballId: string, now: number): TelemetryState
         triggerTime = nil,
         latencySampled = true,
         targetingActive = false,
-        targetingPulses = {},
+        targetingPulses = RingBuffer.new(Constants.TARGETING_PULSE_CAPACITY),
         targetingBurstCount = 0,
         targetingBurstRate = 0,
         targetingMinInterval = nil,
@@ -8085,7 +8221,7 @@ function Helpers.ensureTelemetry(ballId: string, now: number): TelemetryState
         targetingSpeedUrgency = 0,
         targetingSpeedUpdatedAt = now,
         targetingAggressionPulseStamp = nil,
-        pressHistory = {},
+        pressHistory = RingBuffer.new(Constants.TARGETING_PULSE_CAPACITY),
         pressRate = 0,
         lastPressGap = nil,
         lastPressAt = nil,
@@ -8133,6 +8269,14 @@ function Helpers.cloneTable(tbl)
     return Util.deepCopy(tbl)
 end
 
+-- Deep-copies a ring buffer's entries into a plain array, oldest first.
+function Helpers.cloneRingBuffer(buffer)
+    if not RingBuffer.is(buffer) then
+        return nil
+    end
+    return Util.deepCopy(buffer:toArray())
+end
+
 function Helpers.updateTelemetrySummaryTrend(summary, now)
     now = now or os.clock()
 
@@ -8776,6 +8920,35 @@ function Helpers.computeAdaptiveProfile(summary, now)
     return profile
 end
 
+-- Returns the published adaptive profile, computing and caching it from the
+-- telemetry summary when none has been published yet. With a frame context
+-- the result is memoised for the rest of the frame.
+function Helpers.resolveAdaptiveProfile(frame, now)
+    if frame and frame.adaptiveProfileResolved then
+        return frame.adaptiveProfile
+    end
+
+    local runtime = Context.runtime
+    local profile = runtime.telemetryAdaptiveProfile
+    if typeof(profile) ~= "table" then
+        profile = nil
+    end
+    if profile == nil and runtime.telemetrySummary ~= nil then
+        local computedProfile = Helpers.computeAdaptiveProfile(runtime.telemetrySummary, now or (frame and frame.now) or os.clock())
+        if typeof(computedProfile) == "table" then
+            profile = computedProfile
+            runtime.telemetryAdaptiveProfile = Helpers.cloneTable(profile)
+        end
+    end
+
+    if frame then
+        frame.adaptiveProfile = profile
+        frame.adaptiveProfileResolved = true
+    end
+
+    return profile
+end
+
 function Helpers.cloneAutoTuningSnapshot()
     return {
         enabled = autoTuningState.enabled,
@@ -9199,11 +9372,50 @@ function Helpers.cloneTelemetryEvent(event)
     return Helpers.cloneTable(event)
 end
 
+-- Rebuilding the analytics clone, summary, adaptive profile and trend is the
+-- expensive part of publishing, so events only refresh the sequence fields and
+-- mark the store dirty. The render loop flushes at most once per frame and
+-- readers such as getTelemetrySnapshot flush on demand; the store's history
+-- array is materialised from the ring buffer on flush.
+local telemetryPublisher = {
+    dirty = false,
+    flushes = 0,
+    coalesced = 0,
+}
+
+function Helpers.markTelemetryDirty()
+    local _, telemetryStore = Helpers.ensureTelemetryStore()
+    telemetryStore.sequence = Context.telemetry.sequence
+    telemetryStore.lastEvent = Context.telemetry.history:newest()
+    if telemetryPublisher.dirty then
+        telemetryPublisher.coalesced += 1
+    end
+    telemetryPublisher.dirty = true
+end
+
+function Helpers.flushTelemetryPublish()
+    if telemetryPublisher.dirty then
+        return publishTelemetryHistory()
+    end
+    return Helpers.ensureTelemetryStore()
+end
+
+function Helpers.getTelemetryPublisherStats()
+    return {
+        pending = telemetryPublisher.dirty,
+        flushes = telemetryPublisher.flushes,
+        coalesced = telemetryPublisher.coalesced,
+    }
+end
+
 publishTelemetryHistory = function()
+    telemetryPublisher.dirty = false
+    telemetryPublisher.flushes += 1
+
     local settings, telemetryStore = Helpers.ensureTelemetryStore()
-    telemetryStore.history = Context.telemetry.history
+    telemetryStore.history = Context.telemetry.history:toArray()
     telemetryStore.sequence = Context.telemetry.sequence
-    telemetryStore.lastEvent = Context.telemetry.history[#Context.telemetry.history]
+    telemetryStore.lastEvent = Context.telemetry.history:newest()
     telemetryStore.smartTuning = Helpers.snapshotSmartTuningState()
     telemetryStore.metrics = TelemetryAnalytics.clone()
     local summary
@@ -9254,13 +9466,12 @@ telemetryDispatcher = function(eventType: string, payload: { [string]: any }?)
     event.sequence = Context.telemetry.sequence
     event.time = event.time or os.clock()
 
-    Context.telemetry.history[#Context.telemetry.history + 1] = event
-    if #Context.telemetry.history > Context.telemetry.historyLimit then
-        table.remove(Context.telemetry.history, 1)
-    end
+    Context.telemetry.history:push(event)
 
-    publishTelemetryHistory()
-    telemetrySignal:fire(Helpers.cloneTelemetryEvent(event))
+    Helpers.markTelemetryDirty()
+    -- onTelemetry hands each listener its own copy, so the stored event is
+    -- fired as-is.
+    telemetrySignal:fire(event)
     return event
 end
 
@@ -9273,7 +9484,7 @@ function Helpers.resetTelemetryHistory(reason: string?)
     end
     TelemetryAnalytics.resetMetrics(previousResets + 1)
     TelemetryAnalytics.resetAdaptive()
-    Context.telemetry.history = {}
+    Context.telemetry.history:clear()
     Context.runtime.telemetrySummary = nil
     Context.runtime.telemetryAdaptiveProfile = nil
     publishTelemetryHistory()
@@ -10689,8 +10900,8 @@ function Helpers.getTargetingSafeState()
             lastEvaluation = 0,
             clearedAt = 0,
             reason = nil,
-            history = {},
-            observations = {},
+            history = RingBuffer.new(Constants.TARGETING_SAFE_HISTORY_LIMIT),
+            observations = RingBuffer.new(Constants.TARGETING_SAFE_OBSERVATION_LIMIT),
             lastObservation = nil,
         }
         if runtime then
@@ -10698,12 +10909,12 @@ function Helpers.getTargetingSafeState()
         end
     end
 
-    if typeof(safeState.history) ~= "table" then
-        safeState.history = {}
+    if not RingBuffer.is(safeState.history) then
+        safeState.history = RingBuffer.new(Constants.TARGETING_SAFE_HISTORY_LIMIT)
     end
 
-    if typeof(safeState.observations) ~= "table" then
-        safeState.observations = {}
+    if not RingBuffer.is(safeState.observations) then
+        safeState.observations = RingBuffer.new(Constants.TARGETING_SAFE_OBSERVATION_LIMIT)
     end
 
     if safeState.lastObservation ~= nil and typeof(safeState.lastObservation) ~= "table" then
@@ -10719,19 +10930,12 @@ function Helpers.appendTargetingSafeHistory(safeState, entry)
     end
 
     local history = safeState.history
-    if typeof(history) ~= "table" then
-        history = {}
+    if not RingBuffer.is(history) then
+        history = RingBuffer.new(Constants.TARGETING_SAFE_HISTORY_LIMIT)
         safeState.history = history
     end
 
-    history[#history + 1] = Helpers.cloneTable(entry)
-
-    local limit = Constants.TARGETING_SAFE_HISTORY_LIMIT
-    if Helpers.isFiniteNumber(limit) and limit > 0 then
-        while #history > limit do
-            table.remove(history, 1)
-        end
-    end
+    history:push(Helpers.cloneTable(entry))
 end
 
 function Helpers.recordTargetingSafeObservation(safeState, observation)
@@ -10745,19 +10949,12 @@ function Helpers.recordTargetingSafeObservation(safeState, observation)
     end
 
     local observations = safeState.observations
-    if typeof(observations) ~= "table" then
-        observations = {}
+    if not RingBuffer.is(observations) then
+        observations = RingBuffer.new(Constants.TARGETING_SAFE_OBSERVATION_LIMIT)
         safeState.observations = observations
     end
 
-    observations[#observations + 1] = clone
-
-    local limit = Constants.TARGETING_SAFE_OBSERVATION_LIMIT or Constants.TARGETING_SAFE_HISTORY_LIMIT
-    if Helpers.isFiniteNumber(limit) and limit > 0 then
-        while #observations > limit do
-            table.remove(observations, 1)
-        end
-    end
+    observations:push(clone)
 
     safeState.lastObservation = clone
     return clone
@@ -10779,7 +10976,7 @@ function Helpers.emitTargetingSafeTelemetry(safeState, stage, overrides)
         requireDrop = safeState.requireDrop,
         dropObserved = safeState.dropObserved,
         lastObservation = safeState.lastObservation and Helpers.cloneTable(safeState.lastObservation) or nil,
-        observations = safeState.observations and Helpers.cloneTable(safeState.observations) or nil,
+        observations = Helpers.cloneRingBuffer(safeState.observations),
     }
 
     if typeof(overrides) == "table" then
@@ -10793,15 +10990,9 @@ end
 
 function Helpers.snapshotTargetingSafeState()
     local safeState = Helpers.getTargetingSafeState()
-    local snapshot = Helpers.cloneTable(safeState)
-
-    if snapshot.observations then
-        snapshot.observations = Helpers.cloneTable(snapshot.observations)
-    end
-
-    if snapshot.history then
-        snapshot.history = Helpers.cloneTable(snapshot.history)
-    end
+    local snapshot = table.clone(safeState)
+    snapshot.observations = Helpers.cloneRingBuffer(safeState.observations)
+    snapshot.history = Helpers.cloneRingBuffer(safeState.history)
 
     if snapshot.lastObservation then
         snapshot.lastObservation = Helpers.cloneTable(snapshot.lastObservation)
@@ -10848,7 +11039,7 @@ function Helpers.clearTargetingSafeState(reason: string?, now: number?)
         startedAt = previousStartedAt,
         lastPulseAt = previousLastPulse,
         lastDropAt = previousLastDrop,
-        observations = safeState.observations and Helpers.cloneTable(safeState.observations) or nil,
+        observations = Helpers.cloneRingBuffer(safeState.observations),
     }
 
     Helpers.appendTargetingSafeHistory(safeState, historyEntry)
@@ -10864,7 +11055,7 @@ function Helpers.clearTargetingSafeState(reason: string?, now: number?)
     safeState.requireDrop = false
     safeState.dropObserved = false
     safeState.ballId = nil
-    safeState.observations = {}
+    safeState.observations:clear()
     safeState.lastObservation = nil
     if not Helpers.isFiniteNumber(safeState.lastPulseAt) then
         safeState.lastPulseAt = -math.huge
@@ -10901,7 +11092,7 @@ function Helpers.activateTargetingSafeState(ballId: string?, telemetry, now: num
     safeState.reason = "awaiting-drop"
     safeState.dropObserved = false
     safeState.requireDrop = true
-    safeState.observations = {}
+    safeState.observations:clear()
     safeState.lastObservation = nil
 
     if runtime and runtime.targetingHighlightPresent ~= true then
@@ -11166,9 +11357,9 @@ function Helpers.applyTargetingSafeState(decision, telemetry, now: number?, ball
         telemetry.safeGuardLastPulse = safeState.lastPulseAt
         telemetry.safeGuardLastDrop = safeState.lastDropAt
         telemetry.safeGuardLastEvaluation = safeState.lastEvaluation
-        telemetry.safeGuardObservations = safeState.observations and Helpers.cloneTable(safeState.observations) or nil
+        telemetry.safeGuardObservations = Helpers.cloneRingBuffer(safeState.observations)
         telemetry.safeGuardLastObservation = safeState.lastObservation and Helpers.cloneTable(safeState.lastObservation) or nil
-        telemetry.safeGuardHistory = safeState.history and Helpers.cloneTable(safeState.history) or nil
+        telemetry.safeGuardHistory = Helpers.cloneRingBuffer(safeState.history)
     end
 
     return true, safeState
@@ -11256,29 +11447,10 @@ function Helpers.findRealBall(folder)
     return best
 end
 
-function Helpers.scorePressCandidate(
-    decision,
-    telemetry,
-    kinematics,
-    now,
-    ball,
-    ballId,
-    selectionTuning,
-    annotateDecision
-)
-    if not decision then
-        return -math.huge
-    end
-
-    now = now or os.clock()
-
-    local score = 0
-
-    local tuning = selectionTuning
-    if tuning == nil then
-        tuning = Helpers.resolveSelectionTuning(now)
-    end
-
+-- Folds the selection tuning multipliers and biases into the base target
+-- selection weights. The result only depends on `tuning`, so callers with a
+-- frame context compute it once per frame.
+function Helpers.resolveSelectionWeights(tuning)
     local urgencyWeight = TARGET_SELECTION_URGENCY_WEIGHT
     local threatWeight = TARGET_SELECTION_THREAT_WEIGHT
     local detectionWeight = TARGET_SELECTION_DETECTION_WEIGHT
@@ -11331,6 +11503,71 @@ function Helpers.scorePressCandidate(
         end
     end
 
+    return {
+        urgencyWeight = urgencyWeight,
+        threatWeight = threatWeight,
+        detectionWeight = detectionWeight,
+        pressureWeight = pressureWeight,
+        impactWindow = impactWindow,
+        logisticBias = logisticBias,
+        detectionBias = detectionBias,
+        immediateBonus = immediateBonus,
+        timeMultiplier = timeMultiplier,
+        scheduleMultiplier = scheduleMultiplier,
+        trackedMultiplier = trackedMultiplier,
+        scoreBias = scoreBias,
+    }
+end
+
+function Helpers.scorePressCandidate(
+    decision,
+    telemetry,
+    kinematics,
+    now,
+    ball,
+    ballId,
+    selectionTuning,
+    annotateDecision,
+    frame
+)
+    if not decision then
+        return -math.huge
+    end
+
+    now = now or (frame and frame.now) or os.clock()
+
+    local score = 0
+
+    local tuning = selectionTuning
+    if tuning == nil then
+        tuning = if frame and frame.selectionTuning then frame.selectionTuning else Helpers.resolveSelectionTuning(now)
+    end
+
+    local weights
+    if frame and frame.selectionWeights and frame.selectionWeightsTuning == tuning then
+        weights = frame.selectionWeights
+    else
+        weights = Helpers.resolveSelectionWeights(tuning)
+        if frame then
+            frame.selectionWeights = weights
+            frame.selectionWeightsTuning = tuning
+            frame.selectionWeightsResolved += 1
+        end
+    end
+
+    local urgencyWeight = weights.urgencyWeight
+    local threatWeight = weights.threatWeight
+    local detectionWeight = weights.detectionWeight
+    local pressureWeight = weights.pressureWeight
+    local impactWindow = weights.impactWindow
+    local logisticBias = weights.logisticBias
+    local detectionBias = weights.detectionBias
+    local immediateBonus = weights.immediateBonus
+    local timeMultiplier = weights.timeMultiplier
+    local scheduleMultiplier = weights.scheduleMultiplier
+    local trackedMultiplier = weights.trackedMultiplier
+    local scoreBias = weights.scoreBias
+
     if decision.targetingMe then
         score = score + 2.5
     end
@@ -11435,7 +11672,7 @@ function Helpers.scorePressCandidate(
     return score
 end
 
-function Helpers.selectTargetBall(folder, now, playerPosition, selectionTuning)
+function Helpers.selectTargetBall(folder, now, playerPosition, selectionTuning, frame)
     if not folder then
         return nil
     end
@@ -11448,11 +11685,11 @@ function Helpers.selectTargetBall(folder, now, playerPosition, selectionTuning)
         return nil
     end
 
-    now = now or os.clock()
+    now = now or (frame and frame.now) or os.clock()
     if selectionTuning == nil then
-        selectionTuning = Helpers.resolveSelectionTuning(now)
+        selectionTuning = if frame and frame.selectionTuning then frame.selectionTuning else Helpers.resolveSelectionTuning(now)
     end
-    local safeRadius = config.safeRadius or 0
+    local safeRadius = if frame then frame.safeRadius else config.safeRadius or 0
     local selection
     local bestScore = -math.huge
 
@@ -11471,6 +11708,7 @@ function Helpers.selectTargetBall(folder, now, playerPosition, selectionTuning)
                     ballId = ballId,
                     decision = {},
                     preview = true,
+                    frame = frame,
                 })
 
                 local score = Helpers.scorePressCandidate(
@@ -11481,7 +11719,8 @@ function Helpers.selectTargetBall(folder, now, playerPosition, selectionTuning)
                     child,
                     ballId,
                     selectionTuning,
-                    false
+                    false,
+                    frame
                 )
                 if score > bestScore then
                     bestScore = score
@@ -11492,9 +11731,7 @@ function Helpers.selectTargetBall(folder, now, playerPosition, selectionTuning)
                         kinematics = kinematics,
                         decision = previewDecision,
                         score = score,
-                        selectionTuning = selectionTuning
-                            and Helpers.cloneTelemetryEvent(selectionTuning)
-                            or selectionTuning,
+                        selectionTuning = selectionTuning,
                     }
                 end
             end
@@ -12068,23 +12305,23 @@ function Helpers.pressParry(ball: BasePart?, ballId: string?, force: boolean?, d
         telemetry.latencySampled = false
 
         local history = telemetry.pressHistory
-        if typeof(history) ~= "table" then
-            history = {}
+        if not RingBuffer.is(history) then
+            history = RingBuffer.new(Constants.TARGETING_PULSE_CAPACITY)
             telemetry.pressHistory = history
         end
-        history[#history + 1] = now
+        history:push(now)
 
         local window = TARGETING_PRESSURE_WINDOW
         if not Helpers.isFiniteNumber(window) or window <= 0 then
             window = 1
         end
         local cutoff = now - window
-        while #history > 0 and history[1] < cutoff do
-            table.remove(history, 1)
-        end
+        history:trimWhile(function(pressedAt)
+            return pressedAt < cutoff
+        end)
 
-        if #history >= 2 then
-            local gap = history[#history] - history[#history - 1]
+        if history:len() >= 2 then
+            local gap = history:get(-1) - history:get(-2)
             if Helpers.isFiniteNumber(gap) and gap >= 0 then
                 telemetry.lastPressGap = gap
             end
@@ -12623,8 +12860,7 @@ function BallKinematics.trackVrSignHistory(telemetry, now, vrSign)
     if vrSign ~= 0 then
         local previousSign = telemetry.lastVrSign
         if previousSign and previousSign ~= 0 and previousSign ~= vrSign then
-            local flips = telemetry.vrSignFlips
-            flips[#flips + 1] = { time = now, sign = vrSign }
+            telemetry.vrSignFlips:push({ time = now, sign = vrSign })
         end
         telemetry.lastVrSign = vrSign
     end
@@ -12646,7 +12882,7 @@ function BallKinematics.updateDistanceHistory(context, telemetry, now)
     telemetry.lastD0Delta = d0Delta
 
     local d0History = telemetry.d0DeltaHistory
-    d0History[#d0History + 1] = { time = now, delta = math.abs(d0Delta) }
+    d0History:push({ time = now, delta = math.abs(d0Delta) })
     Helpers.trimHistory(d0History, now - Constants.OSCILLATION_HISTORY_SECONDS)
     context.d0Delta = d0Delta
 
@@ -12833,8 +13069,8 @@ function PressDecision.updateTelemetryState(state, telemetry, now, targetingMe,
     end
 
     local pulses = telemetry.targetingPulses
-    if typeof(pulses) ~= "table" then
-        pulses = {}
+    if not RingBuffer.is(pulses) then
+        pulses = RingBuffer.new(Constants.TARGETING_PULSE_CAPACITY)
         telemetry.targetingPulses = pulses
     end
 
@@ -12844,7 +13080,7 @@ function PressDecision.updateTelemetryState(state, telemetry, now, targetingMe,
         for index = 1, #queuedPulses do
             local pulseTime = queuedPulses[index]
             if Helpers.isFiniteNumber(pulseTime) then
-                pulses[#pulses + 1] = pulseTime
+                pulses:push(pulseTime)
             end
         end
         table.clear(queuedPulses)
@@ -12852,8 +13088,8 @@ function PressDecision.updateTelemetryState(state, telemetry, now, targetingMe,
 
     if targetingMe then
         if telemetry.targetingActive ~= true then
-            local previous = pulses[#pulses]
-            pulses[#pulses + 1] = now
+            local previous = pulses:newest()
+            pulses:push(now)
             telemetry.targetingActive = true
             if Helpers.isFiniteNumber(previous) then
                 local interval = now - previous
@@ -12892,11 +13128,11 @@ function PressDecision.updateTelemetryState(state, telemetry, now, targetingMe,
         window = 1
     end
     local cutoff = now - window
-    while #pulses > 0 and pulses[1] < cutoff do
-        table.remove(pulses, 1)
-    end
+    pulses:trimWhile(function(pulseTime)
+        return pulseTime < cutoff
+    end)
 
-    local count = #pulses
+    local count = pulses:len()
     telemetry.targetingBurstCount = count
     if window > 0 then
         telemetry.targetingBurstRate = count / window
@@ -12906,8 +13142,11 @@ function PressDecision.updateTelemetryState(state, telemetry, now, targetingMe,
 
     if count >= 2 then
         local minInterval = math.huge
+        local previous = pulses:get(1)
         for index = 2, count do
-            local interval = pulses[index] - pulses[index - 1]
+            local current = pulses:get(index)
+            local interval = current - previous
+            previous = current
             if Helpers.isFiniteNumber(interval) and interval >= 0 and interval < minInterval then
                 minInterval = interval
             end
@@ -12918,7 +13157,7 @@ function PressDecision.updateTelemetryState(state, telemetry, now, targetingMe,
             telemetry.targetingMinInterval = nil
         end
 
-        local lastInterval = pulses[count] - pulses[count - 1]
+        local lastInterval = pulses:get(count) - pulses:get(count - 1)
         if Helpers.isFiniteNumber(lastInterval) and lastInterval >= 0 then
             telemetry.targetingLastInterval = lastInterval
         end
@@ -12930,7 +13169,7 @@ function PressDecision.updateTelemetryState(state, telemetry, now, targetingMe,
     end
 
     if count > 0 then
-        telemetry.lastTargetingPulse = pulses[count]
+        telemetry.lastTargetingPulse = pulses:get(count)
     end
 end
 
@@ -13146,9 +13385,10 @@ function PressDecision.computeRadii(state, kinematics, safeRadius, telemetry, no
     local reusedSimulation = false
     local cacheKey
     if cache then
-        local refresh, quantizedKey = Helpers.shouldRefreshBallisticCache(cache, ballisticInputs, now)
+        local refresh, quantizedKey, entry = Helpers.shouldRefreshBallisticCache(cache, ballisticInputs, now)
         cacheKey = quantizedKey
         if refresh then
+            entry = Helpers.storeBallisticCacheEntry(cache, quantizedKey, ballisticInputs, now)
             simulation = Helpers.simulateBallisticProximity({
                 safe = ballisticInputs.safe,
                 distance = ballisticInputs.distance,
@@ -13161,26 +13401,17 @@ function PressDecision.computeRadii(state, kinematics, safeRadius, telemetry, no
                 speed = ballisticInputs.speed,
                 horizon = ballisticInputs.horizon,
                 maxHorizon = ballisticInputs.maxHorizon,
-                reuse = cache.result,
+                reuse = entry.result,
             })
-
-            local cacheInputs = cache.inputs
-            Helpers.clearTable(cacheInputs)
-            for key, value in pairs(ballisticInputs) do
-                cacheInputs[key] = value
-            end
-            cache.timestamp = now
-            cache.result = simulation
-            cache.reuseCount = cache.reuseCount or 0
+            entry.result = simulation
             cache.hitStreak = 0
-            cache.quantizedKey = quantizedKey or cache.quantizedKey
         else
-            simulation = cache.result
-            cache.reuseCount = (cache.reuseCount or 0) + 1
+            simulation = entry.result
+            cache.reuseCount += 1
             reusedSimulation = true
-            if quantizedKey then
-                cache.quantizedKey = quantizedKey
-            end
+        end
+        if quantizedKey then
+            cache.quantizedKey = quantizedKey
         end
     end
 
@@ -14185,6 +14416,7 @@ function PressDecision.evaluate(params)
     local now = params.now
     local ballId = params.ballId
     local preview = params.preview == true
+    local frame = params.frame
 
     local decision = params.decision
     if decision == nil then
@@ -14194,9 +14426,18 @@ function PressDecision.evaluate(params)
 
     local state = PressDecision.scratch
     PressDecision.clearTable(state)
+    state.frame = frame
 
     PressDecision.computeConfidence(state, config, kinematics)
-    state.targetingMe = Helpers.isTargetingMe(now)
+    if frame then
+        -- The highlight check is per player, not per ball.
+        if frame.targetingMe == nil then
+            frame.targetingMe = Helpers.isTargetingMe(now)
+        end
+        state.targetingMe = frame.targetingMe
+    else
+        state.targetingMe = Helpers.isTargetingMe(now)
+    end
 
     if not preview then
         PressDecision.updateTelemetryState(state, telemetry, now, state.targetingMe, ballId)
@@ -14343,6 +14584,74 @@ function PressDecision.evaluate(params)
     return decision
 end
 
+-- Per-frame values the render loop and the helpers it drives would otherwise
+-- recompute per ball: the frame clock, the performance snapshot, selection
+-- tuning and its scoring weights, the adaptive profile and the targeting
+-- highlight check. The table is reused and refreshed at the start of each
+-- PreRender pass. PressDecision.evaluate, selectTargetBall and
+-- scorePressCandidate take it as an optional argument and fall back to their
+-- own lookups without it.
+local frameContext = {
+    id = 0,
+    now = 0,
+    safeRadius = 0,
+    performance = nil,
+    selectionTuning = nil,
+    selectionWeights = nil,
+    selectionWeightsTuning = nil,
+    selectionWeightsResolved = 0,
+    adaptiveProfile = nil,
+    adaptiveProfileResolved = false,
+    targetingMe = nil,
+    lastTelemetrySweep = -math.huge,
+    lastLatencyPrune = -math.huge,
+    telemetrySweeps = 0,
+    latencyPrunes = 0,
+}
+
+local function isSweepDue(lastRun, now, interval)
+    -- A clock that moved backwards (a fresh harness clock) counts as due.
+    return now < lastRun or now - lastRun >= interval
+end
+
+-- The telemetry and pending-latency sweeps only drop entries seconds old, so
+-- they run at fixed lower rates instead of every frame.
+function Helpers.runFrameSweeps(frame)
+    local now = frame.now
+    if isSweepDue(frame.lastTelemetrySweep, now, TELEMETRY_SWEEP_INTERVAL) then
+        frame.lastTelemetrySweep = now
+        frame.telemetrySweeps += 1
+        Helpers.cleanupTelemetry(now)
+    end
+    if isSweepDue(frame.lastLatencyPrune, now, LATENCY_PRUNE_INTERVAL) then
+        frame.lastLatencyPrune = now
+        frame.latencyPrunes += 1
+        Helpers.prunePendingLatencyPresses(now)
+    end
+    Helpers.maybeRunAutoTuning(now)
+end
+
+-- Runs the periodic sweeps (auto-tuning may rewrite config) and then resolves
+-- the values the rest of the frame reads.
+function Helpers.beginFrameContext(now)
+    local frame = frameContext
+    frame.id += 1
+    frame.now = now
+    frame.selectionWeights = nil
+    frame.selectionWeightsTuning = nil
+    frame.selectionWeightsResolved = 0
+    frame.adaptiveProfile = nil
+    frame.adaptiveProfileResolved = false
+    frame.targetingMe = nil
+
+    Helpers.runFrameSweeps(frame)
+
+    frame.safeRadius = config.safeRadius or 0
+    frame.performance = Helpers.updatePerformanceTelemetry(now)
+    frame.selectionTuning = Helpers.resolveSelectionTuning(now, Context.runtime.telemetrySummary, frame.performance)
+    return frame
+end
+
 function Helpers.renderLoop()
     if initialization.destroyed then
         Helpers.clearScheduledPress(nil, "destroyed")
@@ -14350,6 +14659,9 @@ function Helpers.renderLoop()
         return
     end
 
+    -- Publish the telemetry events emitted since the previous frame.
+    Helpers.flushTelemetryPublish()
+
     if not Context.player.LocalPlayer then
         Helpers.clearScheduledPress(nil, "missing-player")
         Helpers.resetSpamBurst("missing-player")
@@ -14387,18 +14699,17 @@ function Helpers.renderLoop()
         return
     end
 
-    local now = os.clock()
-    Helpers.cleanupTelemetry(now)
-    Helpers.prunePendingLatencyPresses(now)
-    Helpers.maybeRunAutoTuning(now)
-    local performanceSnapshot = Helpers.updatePerformanceTelemetry(now)
-    local selectionTuning = Helpers.resolveSelectionTuning(now, Context.runtime.telemetrySummary, performanceSnapshot)
+    local frame = Helpers.beginFrameContext(os.clock())
+    local now = frame.now
+    local performanceSnapshot = frame.performance
+    local selectionTuning = frame.selectionTuning
 
     local selection = Helpers.selectTargetBall(
         folder,
         now,
         Context.player.RootPart.Position,
-        selectionTuning
+        selectionTuning,
+        frame
     )
     local ball = selection and selection.ball or Helpers.findRealBall(folder)
     if not ball or not ball:IsDescendantOf(Services.Workspace) then
@@ -14427,7 +14738,7 @@ function Helpers.renderLoop()
     end
 
     local telemetry = selection and selection.telemetry or Helpers.ensureTelemetry(ballId, now)
-    local safeRadius = config.safeRadius or 0
+    local safeRadius = frame.safeRadius
     local kinematics = selection and selection.kinematics
     if not kinematics then
         kinematics = BallKinematics.build(ball, Context.player.RootPart.Position, telemetry, safeRadius, now)
@@ -14441,6 +14752,7 @@ function Helpers.renderLoop()
         now = now,
         ballId = ballId,
         decision = selection and selection.decision or PressDecision.output,
+        frame = frame,
     })
 
     local selectionScore = Helpers.scorePressCandidate(
@@ -14450,8 +14762,10 @@ function Helpers.renderLoop()
         now,
         ball,
         ballId,
-        (selection and selection.selectionTuning) or selectionTuning,
-        true
+        -- The frame's own table, not the selection's copy, so the weights memo hits.
+        selectionTuning,
+        true,
+        frame
     )
     decision.selectionScore = selectionScore
     if telemetry then
@@ -15262,6 +15576,16 @@ function AutoParry.getConfig()
     return Helpers.cloneTable(config)
 end
 
+function AutoParry._testGetFrameContext()
+    return {
+        id = frameContext.id,
+        now = frameContext.now,
+        selectionWeightsResolved = frameContext.selectionWeightsResolved,
+        telemetrySweeps = frameContext.telemetrySweeps,
+        latencyPrunes = frameContext.latencyPrunes,
+    }
+end
+
 function AutoParry._testEvaluateOscillationBurstTuning(payload)
     payload = payload or {}
     local settings = resolveOscillationSpamSettings()
@@ -15442,9 +15766,9 @@ function AutoParry.onTelemetry(callback)
 end
 
 function Helpers.cloneTelemetryHistory()
-    local history = {}
-    for index = 1, #Context.telemetry.history do
-        history[index] = Helpers.cloneTelemetryEvent(Context.telemetry.history[index])
+    local history = Context.telemetry.history:toArray()
+    for index, event in ipairs(history) do
+        history[index] = Helpers.cloneTelemetryEvent(event)
     end
     return history
 end
@@ -15454,7 +15778,7 @@ function AutoParry.getTelemetryHistory()
 end
 
 function AutoParry.getTelemetrySnapshot()
-    local _, telemetryStore = publishTelemetryHistory()
+    local _, telemetryStore = Helpers.flushTelemetryPublish()
     local stats = TelemetryAnalytics.clone()
     return {
         sequence = Context.telemetry.sequence,
@@ -15468,9 +15792,42 @@ function AutoParry.getTelemetrySnapshot()
         adaptiveState = stats and stats.adaptiveState or telemetryStore.adaptiveState,
         summary = telemetryStore.summary and Helpers.cloneTable(telemetryStore.summary) or nil,
         adaptiveProfile = telemetryStore.adaptiveProfile and Helpers.cloneTable(telemetryStore.adaptiveProfile) or nil,
+        publisher = Helpers.getTelemetryPublisherStats(),
+        ballisticCache = Helpers.getBallisticCacheStats(),
+    }
+end
+
+-- Captures the telemetry state a scenario replay needs to resume from: the
+-- event history and sequence, analytics metrics, the adaptive bias and the
+-- activation latency estimate. Press scheduling and smart tuning are not part
+-- of the checkpoint.
+function AutoParry.captureTelemetryCheckpoint()
+    return {
+        sequence = Context.telemetry.sequence,
+        history = Helpers.cloneTelemetryHistory(),
+        metrics = Helpers.cloneTable(TelemetryAnalytics.metrics),
+        adaptiveState = Helpers.cloneTable(TelemetryAnalytics.adaptiveState),
+        activationLatency = activationLatencyEstimate,
     }
 end
 
+function AutoParry.restoreTelemetryCheckpoint(checkpoint)
+    assert(typeof(checkpoint) == "table", "AutoParry.restoreTelemetryCheckpoint expects a checkpoint table")
+
+    Context.telemetry.sequence = checkpoint.sequence or 0
+    local history = Context.telemetry.history
+    history:clear()
+    for _, event in ipairs(checkpoint.history or {}) do
+        history:push(Helpers.cloneTelemetryEvent(event))
+    end
+    TelemetryAnalytics.metrics = Helpers.cloneTable(checkpoint.metrics)
+    TelemetryAnalytics.adaptiveState = Helpers.cloneTable(checkpoint.adaptiveState)
+    if Helpers.isFiniteNumber(checkpoint.activationLatency) then
+        activationLatencyEstimate = checkpoint.activationLatency
+    end
+    publishTelemetryHistory()
+end
+
 function AutoParry.getTelemetryStats()
     Helpers.ensureInitialization()
     return TelemetryAnalytics.clone()
@@ -15713,6 +16070,13 @@ function Helpers.maybeRunAutoTuning(now)
     end
 
     now = now or os.clock()
+    -- performAutoTuning applies the same check; testing it here first skips
+    -- the pcall and options table on the frames in between runs.
+    local interval = autoTuningState.intervalSeconds
+    if Helpers.isFiniteNumber(interval) and interval > 0 and now - (autoTuningState.lastRun or 0) < interval then
+        return
+    end
+
     local ok, result = pcall(Helpers.performAutoTuning, { now = now })
     if not ok then
         autoTuningState.lastError = tostring(result)
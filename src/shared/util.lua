@@ -53,6 +53,276 @@ end
 
 Util.Signal = Signal
 
+-- Fixed-capacity FIFO backed by a circular array. Pushing onto a full buffer
+-- overwrites the oldest entry, so appends and trims are O(1) regardless of
+-- capacity. Index 1 is the oldest entry; negative indices count back from the
+-- newest (-1 is the most recent push).
+local RingBuffer = {}
+RingBuffer.__index = RingBuffer
+
+function RingBuffer.new(capacity)
+    assert(typeof(capacity) == "number" and capacity >= 1, "RingBuffer.new expects a positive capacity")
+    capacity = math.floor(capacity)
+    return setmetatable({ _items = table.create(capacity), _capacity = capacity, _head = 1, _count = 0 }, RingBuffer)
+end
+
+function RingBuffer.is(value)
+    return typeof(value) == "table" and getmetatable(value) == RingBuffer
+end
+
+function RingBuffer:len()
+    return self._count
+end
+
+function RingBuffer:capacity()
+    return self._capacity
+end
+
+function RingBuffer:get(index)
+    local count = self._count
+    if index < 0 then
+        index = count + index + 1
+    end
+    if index < 1 or index > count then
+        return nil
+    end
+
+    return self._items[(self._head + index - 2) % self._capacity + 1]
+end
+
+function RingBuffer:oldest()
+    return self:get(1)
+end
+
+function RingBuffer:newest()
+    return self:get(-1)
+end
+
+function RingBuffer:push(value)
+    local capacity = self._capacity
+    if self._count < capacity then
+        self._count = self._count + 1
+        self._items[(self._head + self._count - 2) % capacity + 1] = value
+        return nil
+    end
+
+    local head = self._head
+    local evicted = self._items[head]
+    self._items[head] = value
+    self._head = head % capacity + 1
+    return evicted
+end
+
+function RingBuffer:shift()
+    if self._count == 0 then
+        return nil
+    end
+
+    local head = self._head
+    local value = self._items[head]
+    self._items[head] = nil
+    self._head = head % self._capacity + 1
+    self._count = self._count - 1
+    return value
+end
+
+function RingBuffer:trimWhile(predicate)
+    local removed = 0
+    while self._count > 0 and predicate(self._items[self._head]) do
+        self:shift()
+        removed = removed + 1
+    end
+
+    return removed
+end
+
+function RingBuffer:clear()
+    table.clear(self._items)
+    self._head = 1
+    self._count = 0
+end
+
+function RingBuffer:toArray()
+    local count = self._count
+    local result = table.create(count)
+    local items = self._items
+    local capacity = self._capacity
+    local head = self._head
+    for index = 1, count do
+        result[index] = items[(head + index - 2) % capacity + 1]
+    end
+
+    return result
+end
+
+function RingBuffer:iterate()
+    local index = 0
+    return function()
+        index = index + 1
+        if index > self._count then
+            return nil
+        end
+
+        return index, self:get(index)
+    end
+end
+
+Util.RingBuffer = RingBuffer
+
+-- Constant-memory streaming quantile estimate using the P-squared algorithm
+-- (Jain & Chlamtac), which tracks five marker heights instead of storing the
+-- samples. To follow a sliding window of roughly `window` samples, markers
+-- are kept in generations of `window` samples: a new generation starts when
+-- the current one fills, and reads come from the current generation once it
+-- holds at least half a window, otherwise from the previous one. State is
+-- plain data so it survives Util.deepCopy and serialisation.
+local StreamingQuantile = {}
+
+local function newMarkerGeneration()
+    return { count = 0, heights = {}, positions = {}, desired = {} }
+end
+
+local function pushMarkerGeneration(generation, quantile, value)
+    generation.count = generation.count + 1
+    local heights = generation.heights
+
+    if generation.count <= 5 then
+        local index = #heights + 1
+        while index > 1 and heights[index - 1] > value do
+            heights[index] = heights[index - 1]
+            index = index - 1
+        end
+        heights[index] = value
+
+        if generation.count == 5 then
+            generation.positions = { 1, 2, 3, 4, 5 }
+            generation.desired = { 1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5 }
+        end
+        return
+    end
+
+    local positions = generation.positions
+    local desired = generation.desired
+
+    local cell
+    if value < heights[1] then
+        heights[1] = value
+        cell = 1
+    elseif value >= heights[5] then
+        heights[5] = value
+        cell = 4
+    else
+        cell = 1
+        while cell < 4 and value >= heights[cell + 1] do
+            cell = cell + 1
+        end
+    end
+
+    for index = cell + 1, 5 do
+        positions[index] = positions[index] + 1
+    end
+    desired[2] = desired[2] + quantile / 2
+    desired[3] = desired[3] + quantile
+    desired[4] = desired[4] + (1 + quantile) / 2
+    desired[5] = desired[5] + 1
+
+    for index = 2, 4 do
+        local offset = desired[index] - positions[index]
+        local above = positions[index + 1] - positions[index]
+        local below = positions[index] - positions[index - 1]
+        if (offset >= 1 and above > 1) or (offset <= -1 and below > 1) then
+            local step = offset > 0 and 1 or -1
+            local height = heights[index]
+            local upper = (below + step) * (heights[index + 1] - height) / above
+            local lower = (above - step) * (height - heights[index - 1]) / below
+            local candidate = height + step * (upper + lower) / (above + below)
+
+            if candidate <= heights[index - 1] or candidate >= heights[index + 1] then
+                candidate = height
+                    + step * (heights[index + step] - height) / (positions[index + step] - positions[index])
+            end
+
+            heights[index] = candidate
+            positions[index] = positions[index] + step
+        end
+    end
+end
+
+local function markerGenerationValue(generation, quantile)
+    local count = generation.count
+    local heights = generation.heights
+    if count < 5 then
+        local index = math.floor(quantile * (count - 1) + 1.5)
+        return heights[math.clamp(index, 1, count)]
+    end
+
+    if quantile <= 0 then
+        return heights[1]
+    elseif quantile >= 1 then
+        return heights[5]
+    end
+    return heights[3]
+end
+
+function StreamingQuantile.new(quantile, window)
+    assert(typeof(quantile) == "number" and quantile >= 0 and quantile <= 1, "StreamingQuantile.new expects a quantile in [0, 1]")
+    assert(typeof(window) == "number" and window >= 1, "StreamingQuantile.new expects a positive window")
+
+    return {
+        quantile = quantile,
+        window = math.floor(window),
+        total = 0,
+        current = newMarkerGeneration(),
+        previous = nil,
+    }
+end
+
+function StreamingQuantile.push(state, value)
+    if state.current.count >= state.window then
+        state.previous = state.current
+        state.current = newMarkerGeneration()
+    end
+
+    pushMarkerGeneration(state.current, state.quantile, value)
+    state.total = state.total + 1
+end
+
+-- Returns the same shape as an exact windowed summary: { count, value, min,
+-- max }, where count is the number of samples the window represents. The
+-- outer markers hold each generation's exact extremes, so min and max span
+-- both the previous and current generations and never miss a sample the
+-- window still covers.
+function StreamingQuantile.summarise(state)
+    if state.total == 0 then
+        return { count = 0 }
+    end
+
+    local current = state.current
+    local previous = state.previous
+    local generation = current
+    if previous and current.count < state.window / 2 then
+        generation = previous
+    end
+
+    local heights = current.heights
+    local low = heights[1]
+    local high = heights[math.min(current.count, 5)]
+    if previous then
+        local previousHeights = previous.heights
+        low = math.min(low, previousHeights[1])
+        high = math.max(high, previousHeights[5])
+    end
+
+    return {
+        count = math.min(state.total, state.window),
+        value = markerGenerationValue(generation, state.quantile),
+        min = low,
+        max = high,
+    }
+end
+
+Util.StreamingQuantile = StreamingQuantile
+
 function Util.deepCopy(value, seen)
     if typeof(value) ~= "table" then
         return value
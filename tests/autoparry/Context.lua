@@ -282,7 +282,7 @@ end
 
 local function createContext(options)
     options = options or {}
-    local scheduler = Scheduler.new(1 / 120)
+    local scheduler = Scheduler.new(1 / 120, options.schedulerOptions)
     local runService = createRunServiceStub()
 
     local highlightEnabled = true
@@ -435,6 +435,7 @@ local function createContext(options)
         now = scheduler:clock(),
         ballsFolder = ballsFolder,
         config = autoparryConfig,
+        telemetry = options.telemetryOptions,
     })
 
     local playerAgent = world:addAgent({
@@ -518,6 +519,7 @@ local function createContext(options)
         character = character,
         world = world,
         playerAgent = playerAgent,
+        fastForwardIdle = options.fastForward == true,
         setHighlightEnabled = function(_, flag)
             highlightEnabled = flag
         end,
@@ -595,14 +597,123 @@ local function createContext(options)
         return false
     end
 
+    function context:_isIdle()
+        if self.world and #self.world.projectiles > 0 then
+            return false
+        end
+        return #self.ballsFolder:GetChildren() == 0
+    end
+
+    -- Skips whole steps while nothing is in flight and no scheduled callback is
+    -- due. Heartbeat listeners do not run for the skipped span, so callers opt
+    -- in (see `fastForwardIdle`). Returns the simulated time skipped.
+    function context:fastForward(duration, options)
+        options = options or {}
+        if not self:_isIdle() then
+            return 0
+        end
+
+        local span = self.scheduler:fastForward(duration, options.step or 1 / 240)
+        if span > 0 and self.world then
+            local getter = self.autoparry and self.autoparry.getConfig
+            if type(getter) == "function" then
+                self.world:updateConfig(getter())
+            end
+            self.world:fastForward(span)
+        end
+        return span
+    end
+
     function context:advance(duration, options)
         options = options or {}
         local stepSize = options.step or 1 / 240
+        local fastForward = options.fastForward
+        if fastForward == nil then
+            fastForward = self.fastForwardIdle
+        end
+
+        -- `stopAt` pauses between steps once the clock reaches it; passing the
+        -- returned remainder back in continues on the same step grid.
+        local stopAt = options.stopAt
         local remaining = duration or 0
         while remaining > 0 do
-            local dt = math.min(stepSize, remaining)
-            self:step(dt)
-            remaining -= dt
+            if stopAt and self.scheduler:clock() >= stopAt then
+                return remaining
+            end
+            local skipped = 0
+            if fastForward then
+                -- Never skip past `stopAt`, or checkpoints land late.
+                local span = if stopAt then math.min(remaining, stopAt - self.scheduler:clock()) else remaining
+                skipped = self:fastForward(span, { step = stepSize })
+            end
+            if skipped > 0 then
+                remaining -= skipped
+            else
+                local dt = math.min(stepSize, remaining)
+                self:step(dt)
+                remaining -= dt
+            end
+        end
+        return 0
+    end
+
+    -- Captures scheduler, world and AutoParry telemetry state plus the log
+    -- lengths so `restore` can rewind a scenario to this point. Checkpoints
+    -- hold callbacks and instances by reference and only restore in-process.
+    function context:checkpoint()
+        local capture = self.autoparry and self.autoparry.captureTelemetryCheckpoint
+        return {
+            scheduler = self.scheduler:snapshot(),
+            world = if self.world then self.world:snapshot() else nil,
+            telemetry = if type(capture) == "function" then capture() else nil,
+            balls = self.ballsFolder:GetChildren(),
+            parryLog = #parryLog,
+            remoteLog = #remoteLog,
+            virtualInputLog = #virtualInputLog,
+        }
+    end
+
+    function context:restore(checkpoint)
+        self.scheduler:restore(checkpoint.scheduler)
+        if self.world and checkpoint.world then
+            self.world:restore(checkpoint.world)
+        end
+
+        local restoreTelemetry = self.autoparry and self.autoparry.restoreTelemetryCheckpoint
+        if checkpoint.telemetry and type(restoreTelemetry) == "function" then
+            restoreTelemetry(checkpoint.telemetry)
+        end
+
+        local saved = {}
+        for _, ball in ipairs(checkpoint.balls) do
+            saved[ball] = true
+        end
+        local present = {}
+        for _, ball in ipairs(self.ballsFolder:GetChildren()) do
+            if saved[ball] then
+                present[ball] = true
+            else
+                self.ballsFolder:Remove(ball)
+            end
+        end
+        for _, ball in ipairs(checkpoint.balls) do
+            if not present[ball] then
+                self.ballsFolder:Add(ball)
+            end
+        end
+        -- Keep the folder's child order so ball iteration matches the run that
+        -- produced the checkpoint.
+        self.ballsFolder._children = table.clone(checkpoint.balls)
+
+        for _, entry in ipairs({
+            { parryLog, checkpoint.parryLog },
+            { remoteLog, checkpoint.remoteLog },
+            { virtualInputLog, checkpoint.virtualInputLog },
+        }) do
+            local log, count = entry[1], entry[2]
+            for index = #log, count + 1, -1 do
+                log[index] = nil
+            end
         end
     end
 
@@ -329,4 +329,35 @@ return function(t)
             connection:Disconnect()
         end
     end)
+
+    t.test("lazy source map only loads chunks that are required", function(expect)
+        local Bootstrap = Runtime.bootstrap
+        local loads = {}
+        local chunks = {
+            src_shared_a_lua = "local B = ARequire('src/shared/b.lua')\nreturn { value = B.value + 1 }\n",
+            src_shared_b_lua = "return { value = 41 }\n",
+            src_shared_unused_lua = "error('unused chunk should never load')\n",
+        }
+
+        local sourceMap = Bootstrap.createLazySourceMap({
+            version = 1,
+            modules = {
+                ["src/shared/a.lua"] = { chunk = "src_shared_a_lua" },
+                ["src/shared/b.lua"] = { chunk = "src_shared_b_lua" },
+                ["src/shared/unused.lua"] = { chunk = "src_shared_unused_lua" },
+            },
+        }, function(chunkName)
+            loads[chunkName] = (loads[chunkName] or 0) + 1
+            return chunks[chunkName]
+        end)
+
+        local virtualRequire = Bootstrap.createVirtualRequire(sourceMap)
+        expect(virtualRequire("src/shared/a.lua").value):toEqual(42)
+        expect(virtualRequire("src/shared/a.lua").value):toEqual(42)
+
+        expect(loads.src_shared_a_lua):toEqual(1)
+        expect(loads.src_shared_b_lua):toEqual(1)
+        expect(loads.src_shared_unused_lua):toEqual(nil)
+        expect(sourceMap["src/shared/missing.lua"]):toEqual(nil)
+    end)
 end
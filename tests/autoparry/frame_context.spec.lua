@@ -0,0 +1,70 @@
+local TestHarness = script.Parent.Parent
+local Context = require(TestHarness:WaitForChild("Context"))
+
+local function createEnabledContext()
+    local context = Context.createContext()
+    local autoparry = context.autoparry
+
+    autoparry.resetConfig()
+    autoparry.configure({
+        smartTuning = false,
+    })
+    autoparry.setEnabled(true)
+
+    return context, autoparry
+end
+
+return function(t)
+    t.test("selection weights are resolved once per frame", function(expect)
+        local context, autoparry = createEnabledContext()
+
+        for index = 1, 3 do
+            context:addBall({
+                name = "FrameBall" .. index,
+                position = Vector3.new(index * 12, 0, 400),
+                velocity = Vector3.new(0, 0, -10),
+            })
+        end
+
+        context:advance(0.1, { step = 1 / 120 })
+
+        for _ = 1, 30 do
+            context:step(1 / 120)
+            -- Three candidates in selectTargetBall plus the render loop's own
+            -- score all share the frame's tuning table.
+            expect(autoparry._testGetFrameContext().selectionWeightsResolved):toEqual(1)
+        end
+
+        context:destroy()
+    end)
+
+    t.test("frame sweeps run at their own intervals", function(expect)
+        local context, autoparry = createEnabledContext()
+
+        context:addBall({
+            name = "SweepBall",
+            position = Vector3.new(0, 0, 400),
+            velocity = Vector3.new(0, 0, -10),
+        })
+
+        context:advance(0.1, { step = 1 / 240 })
+        local before = autoparry._testGetFrameContext()
+
+        for _ = 1, 240 do
+            context:step(1 / 240)
+        end
+
+        local after = autoparry._testGetFrameContext()
+        local telemetrySweeps = after.telemetrySweeps - before.telemetrySweeps
+        local latencyPrunes = after.latencyPrunes - before.latencyPrunes
+
+        expect(after.id - before.id):toEqual(240)
+        -- One second of frames: a sweep every 0.5s and a prune every 0.25s.
+        expect(telemetrySweeps):toBeGreaterThanOrEqual(2)
+        expect(3):toBeGreaterThanOrEqual(telemetrySweeps)
+        expect(latencyPrunes):toBeGreaterThanOrEqual(4)
+        expect(5):toBeGreaterThanOrEqual(latencyPrunes)
+
+        context:destroy()
+    end)
+end
@@ -124,6 +124,16 @@ return function(t)
         local snapshot = autoparry.getTelemetrySnapshot()
         expect(type(snapshot.sequence) == "number"):toBeTruthy()
         expect(snapshot.history ~= nil):toBeTruthy()
+        expect(snapshot.publisher.pending):toEqual(false)
+        expect(snapshot.publisher.flushes):toBeGreaterThanOrEqual(1)
+        expect(snapshot.ballisticCache.misses):toBeGreaterThanOrEqual(1)
+        expect(snapshot.ballisticCache.hitRate >= 0 and snapshot.ballisticCache.hitRate <= 1):toBeTruthy()
+
+        -- Listeners get their own copies, so mutating one leaves the history intact.
+        events[#events].listenerMark = true
+        for _, entry in ipairs(autoparry.getTelemetryHistory()) do
+            expect(entry.listenerMark == nil):toBeTruthy()
+        end
 
         local smartSnapshot = autoparry.getSmartTuningSnapshot()
         expect(type(smartSnapshot) == "table"):toBeTruthy()
@@ -196,7 +206,7 @@ return function(t)
         expect(type(pressEvent.decision.proximitySimulationCacheHits) == "number" or pressEvent.decision.proximitySimulationCacheHits == nil):toBeTruthy()
         expect(type(pressEvent.decision.proximitySimulationCacheStreak) == "number" or pressEvent.decision.proximitySimulationCacheStreak == nil):toBeTruthy()
         if pressEvent.decision.proximitySimulationCacheKey ~= nil then
-            expect(type(pressEvent.decision.proximitySimulationCacheKey) == "string"):toBeTruthy()
+            expect(type(pressEvent.decision.proximitySimulationCacheKey) == "number"):toBeTruthy()
         end
 
         local diagnostics = autoparry.getDiagnosticsReport()
@@ -54,9 +54,10 @@ for _, scenario in ipairs(results) do
     local lateness = scheduler.lateness or {}
     local averageLatenessMs = (lateness.average or 0) * 1000
     local maxLatenessMs = (lateness.max or 0) * 1000
+    local p99LatenessMs = (lateness.p99 or 0) * 1000
 
     local message = string.format(
-        "[PASS] %s threats=%d parries=%d hitches=%d queueMax=%.0f util=%.3f gcΔ=%.2fKB lateAvg=%.2fms lateMax=%.2fms",
+        "[PASS] %s threats=%d parries=%d hitches=%d queueMax=%.0f util=%.3f gcΔ=%.2fKB lateAvg=%.2fms lateP99=%.2fms lateMax=%.2fms",
         scenario.id,
         metrics.threats or 0,
         metrics.parries or 0,
@@ -65,6 +66,7 @@ for _, scenario in ipairs(results) do
         utilisation,
         gc.deltaKb or 0,
         averageLatenessMs,
+        p99LatenessMs,
         maxLatenessMs
     )
     print(message)
@@ -118,6 +118,7 @@ local function massPressureScenario()
                 pressMaxLookahead = 0.9,
                 pressScheduleSlack = 0.01,
             },
+            scheduler = { profiling = "sampled" },
         },
         timeline = timeline,
     }
@@ -184,6 +185,7 @@ local function hitchResilienceScenario()
                 pressMaxLookahead = 0.95,
                 pressScheduleSlack = 0.008,
             },
+            scheduler = { profiling = "sampled" },
         },
         timeline = timeline,
     }
@@ -250,6 +252,7 @@ local function flickerStormScenario()
                 pressMaxLookahead = 0.92,
                 pressScheduleSlack = 0.009,
             },
+            scheduler = { profiling = "sampled" },
         },
         timeline = timeline,
     }
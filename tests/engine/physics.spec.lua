@@ -4,6 +4,7 @@
 local TestHarness = script.Parent.Parent
 local RuntimeFolder = TestHarness:WaitForChild("engine")
 local Physics = require(RuntimeFolder:WaitForChild("physics"))
+local Exporter = require(RuntimeFolder:WaitForChild("telemetry"):WaitForChild("exporter"))
 local Context = require(TestHarness:WaitForChild("Context"))
 local Fixtures = require(TestHarness:WaitForChild("PhysicsFixtures"))
 
@@ -18,6 +19,7 @@ local function createWorld(options)
         now = options.now or 0,
         ballsFolder = ballsFolder,
         config = options.config,
+        telemetry = options.telemetry,
     })
 
     local rootPart = {
@@ -194,4 +196,330 @@ return function(t)
             expect(delta < 5):toEqual(true)
         end
     end)
+
+    t.test("contact broad-phase matches brute-force resolution", function(expect)
+        local function run(broadphase)
+            local config = {}
+            for key, value in pairs(Fixtures.defaults) do
+                config[key] = value
+            end
+            config.contactBroadphase = broadphase
+
+            local world = createWorld({ config = config })
+            for index = 1, 6 do
+                local angle = index * math.pi / 3
+                world:addAgent({
+                    name = "agent" .. index,
+                    instance = {
+                        Name = "Agent" .. index,
+                        Position = Vector3.new(math.cos(angle) * 18, 0, math.sin(angle) * 18),
+                        AssemblyLinearVelocity = Vector3.new(),
+                        CFrame = CFrame.new(),
+                    },
+                    safeRadius = 3 + index,
+                })
+            end
+            world:addFieldVolume({ center = Vector3.new(18, 0, 0), radius = 14, mode = "additive" })
+
+            for index = 1, 24 do
+                local angle = index * math.pi / 12
+                world:addProjectile({
+                    name = "Probe" .. index,
+                    position = Vector3.new(math.cos(angle) * 70, (index % 3) * 2, math.sin(angle) * 70),
+                    velocity = Vector3.new(-math.cos(angle) * 90, 0, -math.sin(angle) * 90),
+                    safeRadius = if index % 5 == 0 then 20 else nil,
+                })
+            end
+
+            for _ = 1, 180 do
+                world:step(Fixtures.step)
+            end
+
+            return world:exportTelemetry()
+        end
+
+        local brute = run(false)
+        local grid = run(true)
+        expect(#grid.steps):toEqual(#brute.steps)
+
+        local contacts = 0
+        for index, expected in ipairs(brute.steps) do
+            local sample = grid.steps[index]
+            expect(#sample.projectiles):toEqual(#expected.projectiles)
+            for projectileIndex, expectedProjectile in ipairs(expected.projectiles) do
+                local projectile = sample.projectiles[projectileIndex]
+                assertVector(expect, projectile.position, expectedProjectile.position, 1e-9)
+                assertVector(expect, projectile.velocity, expectedProjectile.velocity, 1e-9)
+                expect(projectile.contact):toEqual(expectedProjectile.contact)
+                if expectedProjectile.contact then
+                    contacts += 1
+                end
+            end
+        end
+
+        expect(contacts):toBeGreaterThanOrEqual(1)
+    end)
+
+    t.test("columnar telemetry matches step snapshots", function(expect)
+        local function run(layout)
+            local world = createWorld({ config = Fixtures.defaults, telemetry = { layout = layout, capacity = 16 } })
+            world:addAgent({
+                name = "ally",
+                instance = {
+                    Name = "Ally",
+                    Position = Vector3.new(6, 0, 4),
+                    AssemblyLinearVelocity = Vector3.new(1, 0, 0),
+                    CFrame = CFrame.new(),
+                },
+                latency = 0.05,
+            })
+            world:addProjectile({
+                name = "ColumnarProbe",
+                position = Vector3.new(0, 0, 40),
+                velocity = Vector3.new(0, 0, -120),
+            })
+            world:addProjectile({
+                name = "ColumnarFlank",
+                position = Vector3.new(30, 2, 0),
+                velocity = Vector3.new(-80, 0, 0),
+            })
+
+            for step = 1, 90 do
+                if step == 45 then
+                    world:addProjectile({
+                        name = "ColumnarLate",
+                        position = Vector3.new(-20, 0, -20),
+                        velocity = Vector3.new(60, 0, 60),
+                    })
+                end
+                world:step(Fixtures.step)
+            end
+
+            return world
+        end
+
+        local snapshots = run("steps")
+        local columnar = run("columnar")
+
+        expect(snapshots:getTelemetryColumns() == nil):toEqual(true)
+        expect(Exporter.encode(columnar:exportTelemetry())):toEqual(Exporter.encode(snapshots:exportTelemetry()))
+
+        local columns = columnar:getTelemetryColumns()
+        expect(#columns.t):toEqual(90)
+        expect(#columns.projectiles):toEqual(3)
+
+        local fromSteps = Exporter.buildTrace({ steps = snapshots:exportTelemetry().steps })
+        local fromColumns = Exporter.buildTrace({ columns = columns })
+        expect(Exporter.encodeTrace(fromColumns)):toEqual(Exporter.encodeTrace(fromSteps))
+
+        columnar:clearTelemetry()
+        expect(#columnar:getTelemetryColumns().t):toEqual(0)
+        expect(#columnar:exportTelemetry().steps):toEqual(0)
+    end)
+
+    t.test("telemetry ring buffer keeps the latest steps and spills the rest", function(expect)
+        local function run(telemetry)
+            local world = createWorld({ config = Fixtures.defaults, telemetry = telemetry })
+            world:addProjectile({
+                name = "RingProbe",
+                position = Vector3.new(0, 0, 80),
+                velocity = Vector3.new(0, 0, -60),
+            })
+            for _ = 1, 100 do
+                world:step(Fixtures.step)
+            end
+            return world
+        end
+
+        local full = Exporter.buildTrace({ columns = run({}):getTelemetryColumns() })
+
+        for _, layout in ipairs({ "columnar", "steps" }) do
+            local lines = {}
+            local writeChunk = Exporter.createTraceSpill({
+                path = "ring.jsonl",
+                writer = function(_, contents)
+                    lines[#lines + 1] = contents
+                    return true
+                end,
+            })
+            local replayed = {}
+            local function spill(chunk)
+                for _, step in ipairs(Exporter.buildTrace(chunk).steps) do
+                    replayed[#replayed + 1] = step
+                end
+                return writeChunk(chunk)
+            end
+
+            local world = run({ layout = layout, maxSteps = 20, spill = spill })
+            local retained = world:exportTelemetry().steps
+            expect(#retained):toEqual(20)
+            expect(world.telemetry.evicted):toEqual(80)
+            expect(retained[1].t):toBeCloseTo(full.steps[81][1], 1e-9)
+            expect(retained[20].t):toBeCloseTo(full.steps[100][1], 1e-9)
+
+            -- Evicted steps leave in batches of maxSteps; flushing writes out the rest.
+            expect(#lines):toEqual(4)
+            world:flushTelemetry()
+            expect(#lines):toEqual(5)
+            expect(#world:exportTelemetry().steps):toEqual(0)
+
+            for index, line in ipairs(lines) do
+                expect(string.sub(line, -1)):toEqual("\n")
+                expect(string.find(line, '"chunk":' .. index, 1, true) ~= nil):toEqual(true)
+            end
+            expect(Exporter.encode(replayed)):toEqual(Exporter.encode(full.steps))
+        end
+
+        -- A failed spill keeps its batch and retries it with the next one.
+        for _, layout in ipairs({ "columnar", "steps" }) do
+            local attempts = 0
+            local spilled = {}
+            local function spill(chunk)
+                attempts += 1
+                if attempts == 1 then
+                    return false, "disk full"
+                end
+                for _, step in ipairs(Exporter.buildTrace(chunk).steps) do
+                    spilled[#spilled + 1] = step
+                end
+                return true
+            end
+
+            local world = run({ layout = layout, maxSteps = 20, spill = spill })
+            expect(attempts):toEqual(4)
+            expect(world.telemetry.spillFailures):toEqual(1)
+            expect(world.telemetry.lastSpillError):toEqual("disk full")
+            expect(world.telemetry.dropped):toEqual(0)
+            expect(#world:exportTelemetry().steps):toEqual(20)
+            expect(Exporter.encode(spilled)):toEqual(Exporter.encode(table.move(full.steps, 1, 80, 1, {})))
+        end
+
+        -- A sink that never recovers can't grow the ring past 3 * maxSteps steps.
+        for _, layout in ipairs({ "columnar", "steps" }) do
+            local attempts = 0
+            local world = run({
+                layout = layout,
+                maxSteps = 20,
+                spill = function()
+                    attempts += 1
+                    return false, "disk full"
+                end,
+            })
+            local telemetry = world.telemetry
+            local held = if telemetry.columns then #telemetry.columns.t else #telemetry.steps
+            expect(60):toBeGreaterThanOrEqual(held)
+            expect(attempts):toEqual(4)
+            expect(telemetry.spillFailures):toEqual(4)
+            expect(telemetry.dropped):toEqual(60)
+            expect(telemetry.evicted):toEqual(80)
+
+            local retained = world:exportTelemetry().steps
+            expect(#retained):toEqual(20)
+            expect(retained[1].t):toBeCloseTo(full.steps[81][1], 1e-9)
+        end
+    end)
+
+    t.test("telemetry decimation policies thin recorded steps", function(expect)
+        local function run(telemetry)
+            local world = createWorld({ config = Fixtures.defaults, telemetry = telemetry })
+            world:addProjectile({
+                name = "DecimationProbe",
+                position = Vector3.new(0, 0, 30),
+                velocity = Vector3.new(0, 0, -90),
+            })
+            for _ = 1, 120 do
+                world:step(Fixtures.step)
+            end
+            return world
+        end
+
+        local full = run({}):exportTelemetry().steps
+        expect(#full):toEqual(120)
+
+        local every = run({ decimation = "every", every = 4 })
+        local sampled = every:exportTelemetry().steps
+        expect(#sampled):toEqual(30)
+        expect(every.telemetry.decimated):toEqual(90)
+        for index, step in ipairs(sampled) do
+            expect(step.t):toBeCloseTo(full[(index - 1) * 4 + 1].t, 1e-9)
+        end
+
+        local contactSteps = 0
+        for _, step in ipairs(full) do
+            if step.projectiles[1] and step.projectiles[1].contact then
+                contactSteps += 1
+            end
+        end
+        local contactOnly = run({ decimation = "contact" }):exportTelemetry().steps
+        expect(#contactOnly < #full):toEqual(true)
+        expect(#contactOnly >= contactSteps):toEqual(true)
+
+        local adaptive = run({ decimation = "adaptive", velocityThreshold = 1e6, maxInterval = 30 })
+        expect(#adaptive:exportTelemetry().steps):toEqual(4)
+
+        local ok = pcall(function()
+            Physics.World.new({ telemetry = { decimation = "sometimes" } })
+        end)
+        expect(ok):toEqual(false)
+    end)
+
+    t.test("fastForward on an idle world matches stepping", function(expect)
+        local latency = 0.105
+        local stepped, _, steppedRoot = createWorld({ config = Fixtures.defaults, latency = latency })
+        local skipped, _, skippedRoot = createWorld({ config = Fixtures.defaults, latency = latency })
+        for _, root in ipairs({ steppedRoot, skippedRoot }) do
+            root.AssemblyLinearVelocity = Vector3.new(4, 0, -2)
+        end
+
+        local duration = Fixtures.step * 600
+        for _ = 1, 600 do
+            stepped:step(Fixtures.step)
+        end
+        expect(skipped:fastForward(duration)):toEqual(600)
+
+        expect(skipped.now):toBeCloseTo(stepped.now, 1e-6)
+        assertVector(expect, skippedRoot.Position, steppedRoot.Position, 1e-4)
+        assertVector(expect, skipped.agents[1]:getLatencyPosition(), stepped.agents[1]:getLatencyPosition(), 1e-4)
+        expect(#skipped:exportTelemetry().steps < 600):toEqual(true)
+    end)
+
+    t.test("restore rewinds projectiles, agents and telemetry to a snapshot", function(expect)
+        local world, ballsFolder, rootPart = createWorld({ config = Fixtures.defaults, latency = 0.05 })
+        rootPart.AssemblyLinearVelocity = Vector3.new(0, 0, 3)
+        local early = world:addProjectile({
+            name = "Early",
+            position = Vector3.new(0, 0, 80),
+            velocity = Vector3.new(0, 0, -90),
+        })
+        for _ = 1, 30 do
+            world:step(Fixtures.step)
+        end
+
+        local snapshot = world:snapshot()
+        world:addProjectile({
+            name = "Late",
+            position = Vector3.new(20, 0, 80),
+            velocity = Vector3.new(0, 0, -90),
+        })
+        for _ = 1, 60 do
+            world:step(Fixtures.step)
+        end
+        local expectedBall = early.Position
+        local expectedRoot = rootPart.Position
+        local expectedSteps = #world:exportTelemetry().steps
+        world:removeProjectile(early)
+
+        world:restore(snapshot)
+        expect(#world.projectiles):toEqual(1)
+        expect(world.projectiles[1].instance == early):toEqual(true)
+        expect(#ballsFolder:GetChildren()):toEqual(1)
+        expect(world.now):toEqual(snapshot.now)
+
+        for _ = 1, 60 do
+            world:step(Fixtures.step)
+        end
+        assertVector(expect, early.Position, expectedBall, 1e-9)
+        assertVector(expect, rootPart.Position, expectedRoot, 1e-9)
+        expect(#world:exportTelemetry().steps):toEqual(expectedSteps)
+    end)
 end
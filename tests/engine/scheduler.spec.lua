@@ -0,0 +1,251 @@
+-- selene: allow(global_usage)
+-- selene: allow(incorrect_standard_library_use)
+
+local TestHarness = script.Parent.Parent
+local RuntimeFolder = TestHarness:WaitForChild("engine")
+local Runtime = require(RuntimeFolder:WaitForChild("runtime"))
+local Scheduler = Runtime.Scheduler
+
+-- Park-Miller generator so both backends see the identical workload; the
+-- products stay well inside double precision.
+local function createRandom(seed)
+    local state = seed
+    return function()
+        state = (state * 16807) % 2147483647
+        return state / 2147483647
+    end
+end
+
+local function runWorkload(mode, seed)
+    local scheduler = Scheduler.new(1 / 240, { mode = mode })
+    local random = createRandom(seed)
+    local order = {}
+    local nextId = 0
+
+    local function spawn(delay)
+        nextId += 1
+        local id = nextId
+        scheduler:schedule(delay, function()
+            order[#order + 1] = id
+            if random() < 0.3 then
+                spawn(random() < 0.5 and 0 or random() * 2)
+            end
+        end)
+    end
+
+    for _ = 1, 400 do
+        local roll = random()
+        if roll < 0.2 then
+            spawn(0)
+        elseif roll < 0.4 then
+            spawn(math.floor(random() * 12) / 240)
+        elseif roll < 0.8 then
+            spawn(random() * 3)
+        else
+            spawn(30 + random() * 600)
+        end
+    end
+
+    for _ = 1, 2000 do
+        local roll = random()
+        if roll < 0.7 then
+            scheduler:wait(1 / 240)
+        elseif roll < 0.95 then
+            scheduler:wait(random() * 0.25)
+        else
+            scheduler:wait(5)
+        end
+    end
+    scheduler:wait(1000)
+
+    return order, scheduler
+end
+
+return function(t)
+    t.test("timing wheel preserves heap (time, sequence) ordering", function(expect)
+        for seed = 1, 4 do
+            local heapOrder = runWorkload("heap", seed)
+            local wheelOrder = runWorkload("wheel", seed)
+            expect(#wheelOrder):toEqual(#heapOrder)
+            local mismatch
+            for index = 1, #heapOrder do
+                if wheelOrder[index] ~= heapOrder[index] then
+                    mismatch = index
+                    break
+                end
+            end
+            expect(mismatch == nil):toEqual(true)
+        end
+    end)
+
+    t.test("timing wheel runs same-time events in schedule order", function(expect)
+        local scheduler = Scheduler.new(1 / 240, { mode = "wheel" })
+        local order = {}
+        for index = 1, 5 do
+            scheduler:schedule(0.5, function()
+                order[#order + 1] = index
+            end)
+        end
+        scheduler:schedule(0.25, function()
+            order[#order + 1] = 0
+        end)
+
+        scheduler:wait(0.49)
+        expect(#order):toEqual(1)
+        scheduler:wait(0.01)
+        expect(table.concat(order, ",")):toEqual("0,1,2,3,4,5")
+    end)
+
+    t.test("timing wheel cascades events beyond the first ring", function(expect)
+        local scheduler = Scheduler.new(1, { mode = "wheel", resolution = 1 / 240 })
+        local fired = {}
+        for _, delay in ipairs({ 2, 400, 70000, 20 }) do
+            scheduler:schedule(delay, function()
+                fired[#fired + 1] = delay
+            end)
+        end
+
+        scheduler:wait(1)
+        expect(#fired):toEqual(0)
+        scheduler:wait(100)
+        expect(table.concat(fired, ",")):toEqual("2,20")
+        scheduler:wait(70000)
+        expect(table.concat(fired, ",")):toEqual("2,20,400,70000")
+        expect(scheduler:getProfilingData().mode):toEqual("wheel")
+    end)
+
+    t.test("scheduler recycles event records", function(expect)
+        for _, mode in ipairs({ "heap", "wheel" }) do
+            local scheduler = Scheduler.new(1 / 240, { mode = mode })
+            for _ = 1, 16 do
+                scheduler:schedule(0, function() end)
+            end
+            scheduler:wait(1 / 240)
+            expect(#scheduler._eventPool):toEqual(16)
+
+            scheduler:schedule(0, function() end)
+            expect(#scheduler._eventPool):toEqual(15)
+        end
+    end)
+
+    t.test("fastForward with a step stops short of the next event", function(expect)
+        for _, mode in ipairs({ "heap", "wheel" }) do
+            local scheduler = Scheduler.new(1 / 240, { mode = mode })
+            local fired = 0
+            scheduler:schedule(1, function()
+                fired += 1
+            end)
+
+            local skipped = scheduler:fastForward(5, 0.25)
+            expect(skipped):toBeCloseTo(0.75, 1e-9)
+            expect(fired):toEqual(0)
+
+            scheduler:wait(0.25)
+            expect(fired):toEqual(1)
+            expect(scheduler:fastForward(2, 0.25)):toBeCloseTo(2, 1e-9)
+            expect(scheduler.now):toBeCloseTo(3, 1e-9)
+        end
+    end)
+
+    t.test("fastForward without a step jumps to and runs the next event", function(expect)
+        for _, mode in ipairs({ "heap", "wheel" }) do
+            local scheduler = Scheduler.new(1 / 240, { mode = mode })
+            local order = {}
+            for _, delay in ipairs({ 0.5, 0.5, 2 }) do
+                scheduler:schedule(delay, function()
+                    order[#order + 1] = delay
+                end)
+            end
+
+            expect(scheduler:fastForward(10)):toBeCloseTo(0.5, 1e-9)
+            expect(table.concat(order, ",")):toEqual("0.5,0.5")
+            expect(scheduler:fastForward(10)):toBeCloseTo(1.5, 1e-9)
+            expect(table.concat(order, ",")):toEqual("0.5,0.5,2")
+            expect(scheduler:fastForward(1)):toBeCloseTo(1, 1e-9)
+        end
+    end)
+
+    t.test("fastForward spans are profiled separately from waits", function(expect)
+        local scheduler = Scheduler.new(1 / 60)
+        scheduler:wait(0.5)
+        scheduler:wait(0.5)
+        scheduler:fastForward(9, 0.5)
+
+        local profile = scheduler:getProfilingData()
+        expect(profile.totalSimulated):toBeCloseTo(10, 1e-9)
+        expect(profile.averageStep):toBeCloseTo(0.5, 1e-9)
+        expect(profile.fastForward.count):toEqual(1)
+        expect(profile.fastForward.simulated):toBeCloseTo(9, 1e-9)
+    end)
+
+    t.test("profiling reports lateness quantiles from the reservoir", function(expect)
+        local scheduler = Scheduler.new(0.01, { reservoirSize = 4096 })
+        for index = 1, 100 do
+            -- Events land mid-step, so lateness spans 0 .. 0.0099 in 0.0001 steps.
+            scheduler:schedule(index * 0.01 - (index - 1) * 0.0001, function() end)
+        end
+        for _ = 1, 110 do
+            scheduler:wait(0.01)
+        end
+
+        local lateness = scheduler:getProfilingData().lateness
+        expect(lateness.samples):toEqual(100)
+        expect(lateness.p50):toBeCloseTo(0.00495, 1e-6)
+        expect(lateness.p99):toBeCloseTo(0.009801, 1e-6)
+        expect(lateness.max):toBeCloseTo(0.0099, 1e-9)
+    end)
+
+    t.test("sampled profiling times one wait in sampleEvery", function(expect)
+        local sampled = Scheduler.new(1 / 60, { profiling = "sampled", sampleEvery = 8 })
+        for _ = 1, 64 do
+            sampled:wait()
+        end
+        local profile = sampled:getProfilingData()
+        expect(profile.stepCount):toEqual(64)
+        expect(profile.profiling.level):toEqual("sampled")
+        expect(profile.profiling.sampledWaits):toEqual(8)
+        expect(profile.host.waitLatency.observed):toEqual(8)
+
+        local off = Scheduler.new(1 / 60, { profiling = "off" })
+        off:wait()
+        expect(off:getProfilingData().stepCount):toEqual(0)
+        expect(off:getProfilingData().profiling.level):toEqual("off")
+        expect(off:resetProfiling() == nil):toEqual(true)
+
+        local ok = pcall(Scheduler.new, 1, { profiling = "verbose" })
+        expect(ok):toEqual(false)
+    end)
+
+    t.test("restore rewinds the clock and replays pending events in order", function(expect)
+        for _, mode in ipairs({ "heap", "wheel" }) do
+            local scheduler = Scheduler.new(0.05, { mode = mode })
+            local fired = {}
+            for _, delay in ipairs({ 0.3, 0.1, 4, 0.2 }) do
+                scheduler:schedule(delay, function()
+                    table.insert(fired, delay)
+                end)
+            end
+            scheduler:wait(0.15)
+
+            local snapshot = scheduler:snapshot()
+            expect(#snapshot.events):toEqual(3)
+            scheduler:wait(0.2)
+            scheduler:schedule(0.01, function()
+                table.insert(fired, -1)
+            end)
+
+            scheduler:restore(snapshot)
+            table.clear(fired)
+            expect(scheduler:clock()):toBeCloseTo(0.15, 1e-9)
+            for _ = 1, 100 do
+                scheduler:wait()
+            end
+            expect(table.concat(fired, ",")):toEqual("0.2,0.3,4")
+        end
+    end)
+
+    t.test("unknown scheduler modes are rejected", function(expect)
+        local ok = pcall(Scheduler.new, 1, { mode = "calendar" })
+        expect(ok):toEqual(false)
+    end)
+end
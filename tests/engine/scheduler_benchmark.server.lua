@@ -0,0 +1,154 @@
+-- selene: allow(global_usage)
+-- selene: allow(incorrect_standard_library_use)
+
+local ReplicatedStorage = game:GetService("ReplicatedStorage")
+local TestHarness = ReplicatedStorage:WaitForChild("TestHarness")
+local EngineFolder = TestHarness:WaitForChild("engine")
+local Runtime = require(EngineFolder:WaitForChild("runtime"))
+local Runner = require(EngineFolder:WaitForChild("scenario"):WaitForChild("runner"))
+
+local Scheduler = Runtime.Scheduler
+
+local STEP = 1 / 240
+local ROUNDS = 3
+local MODES = { "heap", "wheel" }
+
+local function hasEnginePerfTag(plan)
+    local metadata = plan.metadata or {}
+    local tags = metadata.tags
+    if typeof(tags) ~= "table" then
+        return false
+    end
+    for _, tag in ipairs(tags) do
+        if string.lower(tostring(tag)) == "engine-perf" then
+            return true
+        end
+    end
+    return false
+end
+
+local function loadPlans()
+    local plans = {}
+    for _, module in ipairs(Runner.listScenarioModules()) do
+        local ok, plan = pcall(require, module)
+        if ok and typeof(plan) == "table" and hasEnginePerfTag(plan) then
+            plans[#plans + 1] = plan
+        end
+    end
+    return plans
+end
+
+-- Replays a plan's timeline as raw timers. Every threat spawn fans out into the
+-- timers the runtime keeps per threat (press window, telemetry poll, expiry), so
+-- the queue sees the same depth and 1/240 s granularity as a real engine-perf run.
+local function runWorkload(mode, plan)
+    local scheduler = Scheduler.new(STEP, { mode = mode })
+    local executed = 0
+    local checksum = 0
+    local horizon = 0
+
+    local function record(id)
+        executed += 1
+        checksum = (checksum * 31 + id) % 2147483647
+    end
+
+    local started = os.clock()
+    for index, event in ipairs(plan.events or {}) do
+        local time = event.time or 0
+        if time > horizon then
+            horizon = time
+        end
+        scheduler:schedule(time, function()
+            record(index)
+            if event.event == "spawn-threat" then
+                scheduler:schedule(0.08 + (index % 17) * STEP, function()
+                    record(index + 1000000)
+                end)
+                scheduler:schedule(4 * STEP, function()
+                    record(index + 2000000)
+                end)
+                scheduler:schedule(1.2, function()
+                    record(index + 3000000)
+                end)
+            end
+        end)
+    end
+
+    horizon += 2
+    while scheduler:clock() < horizon do
+        scheduler:wait(STEP)
+    end
+    local elapsed = os.clock() - started
+
+    local profile = scheduler:getProfilingData()
+    return {
+        elapsed = elapsed,
+        executed = executed,
+        checksum = checksum,
+        maxDepth = profile.queue.maxDepth,
+    }
+end
+
+local function median(values)
+    table.sort(values)
+    return values[math.floor((#values + 1) / 2)]
+end
+
+local plans = loadPlans()
+if #plans == 0 then
+    error("scheduler benchmark did not resolve any scenarios tagged with 'engine-perf'", 0)
+end
+
+local ok = true
+local scenarios = {}
+
+for _, plan in ipairs(plans) do
+    local metadata = plan.metadata or {}
+    local entry = { id = metadata.id, events = #(plan.events or {}), modes = {} }
+
+    for _, mode in ipairs(MODES) do
+        local timings = {}
+        local last
+        for round = 1, ROUNDS do
+            last = runWorkload(mode, plan)
+            timings[round] = last.elapsed
+        end
+        entry.modes[mode] = {
+            medianSeconds = median(timings),
+            executed = last.executed,
+            checksum = last.checksum,
+            maxQueueDepth = last.maxDepth,
+        }
+    end
+
+    local heap = entry.modes.heap
+    local wheel = entry.modes.wheel
+    entry.speedup = wheel.medianSeconds > 0 and heap.medianSeconds / wheel.medianSeconds or nil
+    local consistent = heap.executed == wheel.executed and heap.checksum == wheel.checksum
+    entry.consistent = consistent
+    scenarios[#scenarios + 1] = entry
+
+    print(string.format(
+        "[%s] %s timers=%d queueMax=%d heap=%.2fms wheel=%.2fms speedup=%.2fx",
+        consistent and "PASS" or "FAIL",
+        tostring(entry.id),
+        heap.executed,
+        heap.maxQueueDepth or 0,
+        heap.medianSeconds * 1000,
+        wheel.medianSeconds * 1000,
+        entry.speedup or 0
+    ))
+    if not consistent then
+        ok = false
+    end
+end
+
+Runner.emitArtifact("scheduler_benchmark", {
+    step = STEP,
+    rounds = ROUNDS,
+    scenarios = scenarios,
+})
+
+if not ok then
+    error("[SchedulerBenchmark] timing wheel diverged from heap execution order", 0)
+end
@@ -5,6 +5,7 @@ local TestHarness = script.Parent.Parent
 local EngineFolder = TestHarness:WaitForChild("engine")
 local TelemetryFolder = EngineFolder:WaitForChild("telemetry")
 local Exporter = require(TelemetryFolder:WaitForChild("exporter"))
+local Json = require(TelemetryFolder:WaitForChild("json"))
 local TelemetryTestUtils = require(TestHarness:WaitForChild("TelemetryTestUtils"))
 local SourceMap = require(TestHarness:WaitForChild("AutoParrySourceMap"))
 local HttpService = game:GetService("HttpService")
@@ -433,4 +434,99 @@ return function(t)
             }, "\n"), 0)
         end
     end)
+
+    t.test("binary traces round-trip through quantised delta encoding", function(expect)
+        local steps = {}
+        for index = 1, 240 do
+            local time = (index - 1) / 240
+            steps[index] = {
+                t = time,
+                agents = {
+                    {
+                        name = "player",
+                        position = Vector3.new(math.sin(time), 0, 0),
+                        velocity = Vector3.new(math.cos(time), 0, 0),
+                    },
+                },
+                projectiles = {
+                    {
+                        name = "BinaryThreat",
+                        position = Vector3.new(0, 4 + time, 120 - time * 160),
+                        velocity = Vector3.new(0, 1, -160),
+                        contact = index > 200,
+                    },
+                },
+                rules = if index == 120 then { ["cooldown-guard"] = true } else nil,
+            }
+        end
+
+        local trace = Exporter.buildTrace({ steps = steps, traceMetadata = { frequency = 240 } })
+        local encoded = Exporter.encodeBinaryTrace(trace)
+        expect(string.sub(encoded, 1, 4)):toEqual(Exporter.BINARY_TRACE_MAGIC)
+        expect(#encoded * 5 < #Exporter.encodeTrace(trace)):toEqual(true)
+
+        local decoded = Exporter.decodeBinaryTrace(encoded, function(text)
+            return serde.decode("json", text)
+        end)
+        expect(decoded.agents[1]):toEqual("player")
+        expect(decoded.projectiles[1]):toEqual("BinaryThreat")
+        expect(decoded.rules[1]):toEqual("cooldown-guard")
+        expect(decoded.metadata.frequency):toEqual(240)
+        expect(#decoded.steps):toEqual(#trace.steps)
+
+        local tolerance = 0.5 / 1024 + 1e-9
+        for index, expected in ipairs(trace.steps) do
+            local actual = decoded.steps[index]
+            expect(actual[1]):toBeCloseTo(expected[1], 1e-6)
+            for group = 2, 3 do
+                local expectedEntry = expected[group][1]
+                local actualEntry = actual[group][1]
+                expect(actualEntry[1]):toEqual(expectedEntry[1])
+                for component = 2, 7 do
+                    expect(math.abs(actualEntry[component] - expectedEntry[component]) <= tolerance):toEqual(true)
+                end
+            end
+            expect(actual[3][1][8]):toEqual(expected[3][1][8])
+            expect(#actual[4]):toEqual(#expected[4])
+        end
+
+        local writes = {}
+        local ok, paths = Exporter.writeArtifacts({
+            runId = "binary-spec",
+            writer = function(path, contents)
+                writes[path] = contents
+                return true
+            end,
+            steps = steps,
+            traceFormat = "binary",
+        })
+        expect(ok):toEqual(true)
+        expect(string.sub(paths.trace, -10)):toEqual("-trace.bin")
+        expect(string.sub(writes[paths.trace], 1, 4)):toEqual(Exporter.BINARY_TRACE_MAGIC)
+    end)
+
+    t.test("shared json encoder streams sorted, escaped output", function(expect)
+        expect(Json.encode({
+            b = { 1, 2, 0 / 0 },
+            a = 'say "hi"\n',
+            ["a b"] = true,
+            empty = {},
+            [3] = false,
+        })):toEqual('{"3":false,"a b":true,"a":"say \\"hi\\"\\n","b":[1,2,null],"empty":[]}')
+
+        local shared = { x = 1 }
+        local rows = {}
+        for index = 1, 5000 do
+            rows[index] = { index, index * 0.5, shared }
+        end
+        local payload = { rows = rows, name = "stream" }
+
+        local chunks = {}
+        Json.encodeTo(payload, function(chunk)
+            chunks[#chunks + 1] = chunk
+        end)
+        expect(#chunks):toBeGreaterThanOrEqual(2)
+        expect(table.concat(chunks)):toEqual(Json.encode(payload))
+        expect(Exporter.encode(payload)):toEqual(Json.encode(payload))
+    end)
 end
@@ -24,5 +24,7 @@ return {
     thresholds = {
         average = 0.0016,
         p95 = 0.0035,
+        -- goal.md: ultra-tight P99 commit ≤ 10 ms.
+        p99 = 0.010,
     },
 }
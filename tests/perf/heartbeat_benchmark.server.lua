@@ -22,6 +22,7 @@ local function loadConfig()
         thresholds = {
             average = 0.002,
             p95 = 0.004,
+            p99 = 0.010,
         },
     }
 
@@ -329,7 +330,9 @@ local function main()
                 samples = #allSamples,
                 average = average(allSamples),
                 p95 = percentile(allSamples, 0.95),
+                p99 = percentile(allSamples, 0.99),
             },
+            distribution = allSamples,
             parryAttempts = parryAttempts,
         }
     end
@@ -372,6 +375,9 @@ local function main()
     if thresholds.p95 and metrics.summary.p95 > thresholds.p95 then
         table.insert(failures, string.format("p95 %.6f > %.6f", metrics.summary.p95, thresholds.p95))
     end
+    if thresholds.p99 and metrics.summary.p99 > thresholds.p99 then
+        table.insert(failures, string.format("p99 %.6f > %.6f", metrics.summary.p99, thresholds.p99))
+    end
 
     if #failures > 0 then
         error("[HeartbeatBenchmark] Performance regression detected: " .. table.concat(failures, "; "), 0)
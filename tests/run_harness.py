@@ -20,21 +20,27 @@ are missing by providing actionable remediation hints.
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import gzip
+import hashlib
 import io
 import json
+import math
 import os
 import platform
 import re
 import shutil
+import statistics
 import subprocess
 import sys
 import textwrap
 import time
 import urllib.request
 import zipfile
-from dataclasses import dataclass, field
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 ROOT = Path(__file__).resolve().parents[1]
 TESTS_DIR = ROOT / "tests"
@@ -44,6 +50,7 @@ PLACE_FILE = TESTS_DIR / "AutoParryHarness.rbxl"
 BUILD_SCRIPT = TESTS_DIR / "build-place.sh"
 RUN_IN_ROBLOX = "run-in-roblox"
 SOURCE_MAP_PATH = TESTS_DIR / "fixtures" / "AutoParrySourceMap.lua"
+SOURCE_MAP_CHUNKS_DIR = TESTS_DIR / "fixtures" / "AutoParrySourceMapChunks"
 SOURCE_MAP_SCRIPT = TESTS_DIR / "tools" / "generate_source_map.py"
 SPEC_RUNNER_SCRIPT = TESTS_DIR / "tools" / "run_specs.luau"
 PERF_BASELINE_PATH = TESTS_DIR / "perf" / "baseline.json"
@@ -51,6 +58,20 @@ SCENARIO_DIR = TESTS_DIR / "scenarios"
 SCENARIO_ARTIFACT_DIR = ARTIFACTS_DIR / "scenarios"
 SCENARIO_COMPILE_SCRIPT = TESTS_DIR / "tools" / "compile_scenarios.lua"
 TOOLS_BIN_DIR = TESTS_DIR / "tools" / "bin"
+PLACE_PROJECT_PATH = TESTS_DIR / "fixtures" / "place.project.json"
+CACHE_DIR = ARTIFACTS_DIR / "cache"
+SPEC_DURATIONS_PATH = CACHE_DIR / "spec-durations.json"
+BUILD_STATE_PATH = CACHE_DIR / "build-state.json"
+REPEAT_SUMMARY_PATH = ARTIFACTS_DIR / "repeat-summary.json"
+PERF_HISTORY_PATH = CACHE_DIR / "perf-history.json"
+PERF_HISTORY_LIMIT = 30
+# A run regresses when it is slower than the reference distribution with
+# p < PERF_REGRESSION_ALPHA *and* its median moved by at least
+# PERF_REGRESSION_MIN_SHIFT, so large sample counts cannot flag noise-level drift.
+PERF_REGRESSION_ALPHA = 0.01
+PERF_REGRESSION_MIN_SHIFT = 0.05
+# goal.md: ultra-tight P99 commit ≤ 10 ms.
+PERF_P99_BUDGET = 0.010
 PYTHON_EXECUTABLE = sys.executable or "python3"
 
 LUNE_VERSION = "0.10.3"
@@ -166,6 +187,7 @@ class HarnessContext:
     place_file: Path
     spec_engine: str
     lune_executable: Optional[str] = None
+    engine_workers: int = 1
 
 
 @dataclass(frozen=True)
@@ -177,6 +199,9 @@ class SuiteConfig:
     repeatable: bool = True
     requires_source_map: Union[bool, Callable[[HarnessContext], bool]] = False
     env_factory: Optional[Callable[[HarnessContext], Dict[str, str]]] = None
+    parallel_safe: Union[bool, Callable[[HarnessContext], bool]] = False
+    shardable: Union[bool, Callable[[HarnessContext], bool]] = False
+    engine_artifact: Optional[str] = None
 
 
 def suite_requires_place(config: SuiteConfig, ctx: HarnessContext) -> bool:
@@ -193,6 +218,24 @@ def suite_requires_source_map(config: SuiteConfig, ctx: HarnessContext) -> bool:
     return bool(requirement)
 
 
+def suite_is_parallel_safe(config: SuiteConfig, ctx: HarnessContext) -> bool:
+    requirement = config.parallel_safe
+    if callable(requirement):
+        return bool(requirement(ctx))
+    return bool(requirement)
+
+
+def suite_is_shardable(config: SuiteConfig, ctx: HarnessContext) -> bool:
+    requirement = config.shardable
+    if callable(requirement):
+        return bool(requirement(ctx))
+    return bool(requirement)
+
+
+def suite_uses_engine_workers(config: SuiteConfig, ctx: HarnessContext) -> bool:
+    return config.engine_artifact is not None and ctx.engine_workers > 1
+
+
 def _roblox_suite(script_path: Path, description: str) -> SuiteConfig:
     script = str(script_path)
 
@@ -207,6 +250,30 @@ def _roblox_suite(script_path: Path, description: str) -> SuiteConfig:
     )
 
 
+def _engine_scenario_suite(script_path: Path, artifact: str, description: str) -> SuiteConfig:
+    """Scenario suite that runs in the Rojo place, or across Lune workers.
+
+    With ``--engine-workers N`` (N > 1) the compiled scenarios are split over N
+    Lune processes and their results merged into ``artifact`` by the engine
+    runner, so the place is not needed.
+    """
+    place_suite = _roblox_suite(script_path, description)
+
+    def factory(ctx: HarnessContext) -> Sequence[str]:
+        if ctx.engine_workers > 1:
+            exe = ctx.lune_executable or "lune"
+            return [exe, "run", str(SPEC_RUNNER_SCRIPT), "--root", str(ROOT)]
+        return place_suite.command_factory(ctx)
+
+    return SuiteConfig(
+        description=description,
+        command_factory=factory,
+        requires_place=lambda ctx: ctx.engine_workers <= 1,
+        requires_source_map=True,
+        engine_artifact=artifact,
+    )
+
+
 def _spec_suite() -> SuiteConfig:
 
     def factory(ctx: HarnessContext) -> Sequence[str]:
@@ -226,6 +293,8 @@ def _spec_suite() -> SuiteConfig:
         command_factory=factory,
         requires_place=lambda ctx: ctx.spec_engine == "roblox",
         requires_source_map=True,
+        parallel_safe=lambda ctx: ctx.spec_engine == "lune",
+        shardable=lambda ctx: ctx.spec_engine == "lune",
     )
 
 
@@ -245,6 +314,8 @@ def _telemetry_suite() -> SuiteConfig:
         command_factory=factory,
         requires_source_map=True,
         env_factory=env_factory,
+        parallel_safe=True,
+        shardable=True,
     )
 
 
@@ -264,6 +335,8 @@ def _filtered_lune_suite(filter_name: str, description: str) -> SuiteConfig:
         command_factory=factory,
         requires_source_map=True,
         env_factory=env_factory,
+        parallel_safe=True,
+        shardable=True,
     )
 
 
@@ -284,6 +357,7 @@ def _cli_suite(
         command_factory=factory,
         optional=optional,
         repeatable=repeatable,
+        parallel_safe=True,
     )
 
 
@@ -326,6 +400,8 @@ SUITES: Dict[str, SuiteConfig] = {
         [
             PYTHON_EXECUTABLE,
             str(TESTS_DIR / "tools" / "check_register_pressure.py"),
+            "--jobs",
+            "0",
         ],
         "Detect functions that risk Luau register overflow (limit 200 locals).",
     ),
@@ -351,22 +427,29 @@ SUITES: Dict[str, SuiteConfig] = {
         TESTS_DIR / "perf" / "parry_accuracy.server.lua",
         "Deterministic parry accuracy workload with violation reporting.",
     ),
-    "engine-sim": _roblox_suite(
+    "engine-sim": _engine_scenario_suite(
         TESTS_DIR / "engine" / "engine_sim.server.lua",
+        "engine_simulation",
         "Runs compiled scenario bundles through the engine runtime and captures simulation artifacts.",
     ),
-    "engine-replay": _roblox_suite(
+    "engine-replay": _engine_scenario_suite(
         TESTS_DIR / "engine" / "engine_replay.server.lua",
+        "engine_replay",
         "Replays scenario batches and records remote/parry logs for debugging.",
     ),
-    "engine-metrics": _roblox_suite(
+    "engine-metrics": _engine_scenario_suite(
         TESTS_DIR / "engine" / "engine_metrics.server.lua",
+        "engine_metrics",
         "Aggregates engine scenario metrics to surface press and remote counts at a glance.",
     ),
     "engine-perf": _roblox_suite(
         TESTS_DIR / "engine" / "engine_perf.server.lua",
         "High-load engine perf suite capturing scheduler, GC, and utilisation telemetry for regressions.",
     ),
+    "engine-scheduler": _roblox_suite(
+        TESTS_DIR / "engine" / "scheduler_benchmark.server.lua",
+        "Benchmarks the heap and timing-wheel scheduler backends on engine-perf timer loads.",
+    ),
 }
 
 
@@ -382,8 +465,9 @@ SUITE_ALIASES: Dict[str, List[str]] = {
         "engine-replay",
         "engine-metrics",
         "engine-perf",
+        "engine-scheduler",
     ],
-    "engine": ["engine-sim", "engine-replay", "engine-metrics", "engine-perf"],
+    "engine": ["engine-sim", "engine-replay", "engine-metrics", "engine-perf", "engine-scheduler"],
     "quick": ["telemetry"],
 }
 
@@ -405,7 +489,11 @@ ARTIFACT_PATTERNS: Tuple[Tuple[re.Pattern[str], str], ...] = (
 
 PASS_PATTERN = re.compile(r"^\[PASS\]\s+(.*)$")
 FAIL_PATTERN = re.compile(r"^\[FAIL\]\s+(.*)$")
+SPEC_DURATION_PATTERN = re.compile(r"^\[SPEC-DURATION\]\s+(\S+)\s+([-+0-9.eE]+)$")
 SUMMARY_PATTERN = re.compile(r"^\[(?:AutoParrySpec|ParryAccuracy|HeartbeatBenchmark)\]\s+(.*)$")
+# Subprocess output is read in bounded chunks so multi-megabyte artifact lines
+# stream to disk instead of being materialised as a single string.
+OUTPUT_CHUNK_SIZE = 1 << 16
 
 
 def human_join(items: Sequence[str], fallback: str = "none") -> str:
@@ -426,75 +514,374 @@ def is_executable_available(executable: str) -> bool:
     return shutil.which(executable) is not None
 
 
+def open_artifact(path: Path) -> IO[str]:
+    """Open a captured artifact for reading, transparently handling ``.json.gz``."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
 def load_json_file(path: Path) -> Optional[Any]:
     try:
-        with path.open("r", encoding="utf-8") as handle:
+        with open_artifact(path) as handle:
             return json.load(handle)
     except (OSError, json.JSONDecodeError):
         return None
 
 
-def find_latest_source_mtime() -> float:
-    """Return the most recent mtime among tracked sources for the harness."""
-    tracked_paths: List[Path] = [
-        ROOT / "loader.lua",
-        TESTS_DIR / "perf" / "config.lua",
-        TESTS_DIR / "perf" / "parry_accuracy.config.lua",
-        TESTS_DIR / "fixtures" / "ui_snapshot.json",
-        TESTS_DIR / "fixtures" / "place.project.json",
-        BUILD_SCRIPT,
-    ]
+def discover_spec_modules(spec_filter: Optional[str] = None) -> List[str]:
+    """Return the spec module names the Lune runner would load for ``spec_filter``."""
+    project = load_json_file(PLACE_PROJECT_PATH)
+    try:
+        specs = project["tree"]["ReplicatedStorage"]["TestHarness"]["Specs"]
+    except (KeyError, TypeError):
+        return []
+
+    lowered = spec_filter.lower() if spec_filter else ""
+    names: List[str] = []
+    for name, node in specs.items():
+        if not isinstance(node, dict) or "$path" not in node:
+            continue
+        if lowered and lowered not in name.lower():
+            continue
+        names.append(name)
+    return sorted(names)
 
-    src_root = ROOT / "src"
-    for path in src_root.rglob("*.lua"):
-        tracked_paths.append(path)
 
-    engine_root = ROOT / "engine"
-    for path in engine_root.rglob("*.lua"):
-        tracked_paths.append(path)
+def load_spec_durations() -> Dict[str, float]:
+    payload = load_json_file(SPEC_DURATIONS_PATH)
+    if not isinstance(payload, dict):
+        return {}
+    durations = payload.get("durations")
+    if not isinstance(durations, dict):
+        return {}
+    return {
+        str(name): float(value)
+        for name, value in durations.items()
+        if isinstance(value, (int, float)) and value >= 0
+    }
+
+
+def record_spec_durations(results: Iterable["SuiteResult"]) -> None:
+    """Persist the latest per-spec durations so later runs can balance shards."""
+    observed: Dict[str, float] = {}
+    for result in results:
+        observed.update(result.spec_durations)
+    if not observed:
+        return
 
-    if SCENARIO_DIR.exists():
-        for path in SCENARIO_DIR.glob("*.lua*"):
-            tracked_paths.append(path)
+    durations = load_spec_durations()
+    durations.update(observed)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with SPEC_DURATIONS_PATH.open("w", encoding="utf-8") as handle:
+            json.dump({"version": 1, "durations": durations}, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+    except OSError as err:
+        print(f"[run-harness] Failed to record spec durations: {err}", file=sys.stderr)
 
-    if SCENARIO_ARTIFACT_DIR.exists():
-        for path in SCENARIO_ARTIFACT_DIR.glob("*.roblox.lua"):
-            tracked_paths.append(path)
 
-    latest = 0.0
-    for path in tracked_paths:
-        if not path.exists():
-            continue
-        try:
-            latest = max(latest, path.stat().st_mtime)
-        except OSError:
-            continue
-    return latest
+def plan_spec_shards(
+    modules: Sequence[str], shard_count: int, durations: Dict[str, float]
+) -> List[List[str]]:
+    """Split ``modules`` into at most ``shard_count`` shards of similar total duration.
+
+    Uses longest-processing-time-first assignment: specs are placed heaviest
+    first onto the currently lightest shard. Specs without a recorded duration
+    are costed at the median of the known ones (or 1s when nothing is known).
+    """
+    if shard_count <= 1 or len(modules) <= 1:
+        return [list(modules)] if modules else []
+
+    known = sorted(durations[name] for name in modules if name in durations)
+    fallback = known[len(known) // 2] if known else 1.0
+
+    def cost(name: str) -> float:
+        return durations.get(name, fallback)
+
+    shard_total = min(shard_count, len(modules))
+    shards: List[List[str]] = [[] for _ in range(shard_total)]
+    loads = [0.0] * shard_total
+    for name in sorted(modules, key=lambda item: (-cost(item), item)):
+        target = min(range(shard_total), key=lambda index: (loads[index], index))
+        shards[target].append(name)
+        loads[target] += cost(name)
 
+    return [sorted(shard) for shard in shards if shard]
 
-def ensure_source_map(force: bool = False, dry_run: bool = False) -> bool:
-    """Regenerate the AutoParry source map when inputs changed."""
 
-    needs_refresh = force or not SOURCE_MAP_PATH.exists()
+def plan_scenario_batches(worker_count: int) -> List[List[str]]:
+    """Split the compiled scenario modules into at most ``worker_count`` batches.
 
-    if not needs_refresh and SOURCE_MAP_PATH.exists():
+    Module names match what Rojo and the Lune worker register (``<id>.roblox``).
+    Each module is costed by its compiled size, a proxy for timeline length.
+    """
+    outputs = _scenario_outputs()
+    names = [path.name[: -len(".lua")] for path in outputs]
+    sizes = {path.name[: -len(".lua")]: float(path.stat().st_size) for path in outputs}
+    return plan_spec_shards(names, worker_count, sizes)
+
+
+BUILD_STATE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class BuildTarget:
+    """A harness build product and the inputs that determine its contents."""
+
+    name: str
+    inputs: Tuple[str, ...]
+    outputs: Callable[[], List[Path]]
+    depends_on: Tuple[str, ...] = ()
+
+
+def _scenario_outputs() -> List[Path]:
+    if not SCENARIO_ARTIFACT_DIR.exists():
+        return []
+    return sorted(SCENARIO_ARTIFACT_DIR.glob("*.roblox.lua"))
+
+
+BUILD_TARGETS: Dict[str, BuildTarget] = {
+    "source-map": BuildTarget(
+        name="source-map",
+        inputs=(
+            "src/*.lua",
+            "loader.lua",
+            "tests/perf/config.lua",
+            "tests/fixtures/ui_snapshot.json",
+            "tests/artifacts/engine/baselines/*.json",
+            "tests/tools/generate_source_map.py",
+        ),
+        outputs=lambda: [SOURCE_MAP_PATH, SOURCE_MAP_CHUNKS_DIR / "index.lua"],
+    ),
+    "scenarios": BuildTarget(
+        name="scenarios",
+        inputs=(
+            "tests/scenarios/*.lua*",
+            "tests/engine/*.manifest.lua",
+            "engine/*.lua",
+            "tests/tools/compile_scenarios.lua",
+        ),
+        outputs=_scenario_outputs,
+    ),
+    "place": BuildTarget(
+        name="place",
+        inputs=(
+            "src/*.lua",
+            "engine/*.lua",
+            "loader.lua",
+            "tests/perf/config.lua",
+            "tests/perf/parry_accuracy.config.lua",
+            "tests/fixtures/ui_snapshot.json",
+            "tests/fixtures/place.project.json",
+            "tests/build-place.sh",
+        ),
+        outputs=lambda: [PLACE_FILE],
+        depends_on=("source-map", "scenarios"),
+    ),
+}
+
+# Every input root is walked at most once per run; targets select from the
+# shared scan with fnmatch patterns relative to the repository root.
+BUILD_INPUT_ROOTS: Tuple[Tuple[Path, str], ...] = (
+    (ROOT / "src", "**/*.lua"),
+    (ROOT / "engine", "**/*.lua"),
+    (SCENARIO_DIR, "*.lua*"),
+    (TESTS_DIR / "engine", "*.manifest.lua"),
+    (ARTIFACTS_DIR / "engine" / "baselines", "**/*.json"),
+)
+BUILD_INPUT_FILES: Tuple[Path, ...] = (
+    ROOT / "loader.lua",
+    TESTS_DIR / "perf" / "config.lua",
+    TESTS_DIR / "perf" / "parry_accuracy.config.lua",
+    TESTS_DIR / "fixtures" / "ui_snapshot.json",
+    TESTS_DIR / "fixtures" / "place.project.json",
+    BUILD_SCRIPT,
+    SOURCE_MAP_SCRIPT,
+    SCENARIO_COMPILE_SCRIPT,
+)
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha1()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BuildState:
+    """Persistent content-digest cache that decides which harness outputs are stale.
+
+    The state file records, per input, the ``(size, mtime_ns)`` stat key and the
+    SHA-1 of its contents, so unchanged files are never re-read; a touched file
+    is re-hashed and only counts as changed when its bytes differ. Per target it
+    stores the digests of the inputs (and upstream outputs) it was last built
+    from, which makes checkouts and touches that leave contents intact free.
+    """
+
+    def __init__(self, path: Path = BUILD_STATE_PATH) -> None:
+        self.path = path
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._targets: Dict[str, Dict[str, Any]] = {}
+        self._scanned: Optional[Dict[str, str]] = None
+
+        payload = load_json_file(path)
+        if isinstance(payload, dict) and payload.get("version") == BUILD_STATE_VERSION:
+            files = payload.get("files")
+            targets = payload.get("targets")
+            if isinstance(files, dict):
+                self._files = files
+            if isinstance(targets, dict):
+                self._targets = targets
+
+    def _digest(self, path: Path) -> Optional[str]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        relative = path.relative_to(ROOT).as_posix()
+        cached = self._files.get(relative)
+        if (
+            isinstance(cached, dict)
+            and cached.get("size") == stat.st_size
+            and cached.get("mtime_ns") == stat.st_mtime_ns
+            and isinstance(cached.get("sha1"), str)
+        ):
+            return cached["sha1"]
         try:
-            current_mtime = SOURCE_MAP_PATH.stat().st_mtime
+            digest = _file_digest(path)
         except OSError:
-            current_mtime = 0.0
-        needs_refresh = current_mtime < find_latest_source_mtime()
+            return None
+        self._files[relative] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha1": digest,
+        }
+        return digest
+
+    def _scan(self) -> Dict[str, str]:
+        if self._scanned is None:
+            scanned: Dict[str, str] = {}
+            candidates: List[Path] = list(BUILD_INPUT_FILES)
+            for base, pattern in BUILD_INPUT_ROOTS:
+                if base.exists():
+                    candidates.extend(sorted(base.glob(pattern)))
+            for path in candidates:
+                if not path.is_file():
+                    continue
+                digest = self._digest(path)
+                if digest is not None:
+                    scanned[path.relative_to(ROOT).as_posix()] = digest
+            self._scanned = scanned
+        return self._scanned
+
+    def refresh(self, paths: Iterable[Path]) -> None:
+        """Re-digest files the current run rewrote (e.g. outputs feeding later targets)."""
+        scanned = self._scan()
+        for path in paths:
+            relative = path.relative_to(ROOT).as_posix()
+            digest = self._digest(path)
+            if digest is None:
+                scanned.pop(relative, None)
+            else:
+                scanned[relative] = digest
+
+    def _collect_inputs(self, target: BuildTarget) -> Dict[str, str]:
+        scanned = self._scan()
+        inputs = {
+            relative: digest
+            for relative, digest in scanned.items()
+            if any(fnmatch.fnmatchcase(relative, pattern) for pattern in target.inputs)
+        }
+        for upstream in target.depends_on:
+            for path in BUILD_TARGETS[upstream].outputs():
+                digest = self._digest(path)
+                if digest is not None:
+                    inputs[path.relative_to(ROOT).as_posix()] = digest
+        return inputs
+
+    def stale_reasons(self, target: BuildTarget) -> List[str]:
+        """Explain why ``target`` needs rebuilding; an empty list means it is fresh."""
+        outputs = target.outputs()
+        if not outputs or not all(path.exists() for path in outputs):
+            return ["output missing"]
+
+        recorded = self._targets.get(target.name)
+        if not isinstance(recorded, dict) or not isinstance(recorded.get("inputs"), dict):
+            return ["no recorded build state"]
+
+        previous: Dict[str, str] = recorded["inputs"]
+        current = self._collect_inputs(target)
+        changed = sorted(
+            relative
+            for relative in set(previous) | set(current)
+            if previous.get(relative) != current.get(relative)
+        )
+        if not changed:
+            return []
+        preview = ", ".join(changed[:3])
+        if len(changed) > 3:
+            preview += f" (+{len(changed) - 3} more)"
+        return [f"inputs changed: {preview}"]
+
+    def mark_built(self, target: BuildTarget) -> None:
+        self.refresh(target.outputs())
+        self._targets[target.name] = {"inputs": self._collect_inputs(target)}
+
+    def save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("w", encoding="utf-8") as handle:
+                json.dump(
+                    {
+                        "version": BUILD_STATE_VERSION,
+                        "files": self._files,
+                        "targets": self._targets,
+                    },
+                    handle,
+                    indent=2,
+                    sort_keys=True,
+                )
+                handle.write("\n")
+        except OSError as err:
+            print(f"[run-harness] Failed to persist build state: {err}", file=sys.stderr)
+
+
+def _stale_build_reasons(target_name: str, state: BuildState, force: bool) -> List[str]:
+    if force:
+        return ["forced rebuild"]
+    return state.stale_reasons(BUILD_TARGETS[target_name])
+
 
-    if not needs_refresh:
+def ensure_source_map(
+    force: bool = False, dry_run: bool = False, state: Optional[BuildState] = None
+) -> bool:
+    """Regenerate the AutoParry source map when its input contents changed."""
+
+    state = state or BuildState()
+    reasons = _stale_build_reasons("source-map", state, force)
+    if not reasons:
         return False
 
     if dry_run:
-        print("[run-harness] Would regenerate AutoParry source map (dry-run enabled)")
+        print(
+            f"[run-harness] Would regenerate AutoParry source map ({'; '.join(reasons)}; dry-run enabled)"
+        )
         return False
 
-    print("[run-harness] Regenerating AutoParry source map …")
+    print(f"[run-harness] Regenerating AutoParry source map ({'; '.join(reasons)}) …")
     try:
         subprocess.run(
-            [sys.executable, str(SOURCE_MAP_SCRIPT), str(ROOT), str(SOURCE_MAP_PATH)],
+            [
+                sys.executable,
+                str(SOURCE_MAP_SCRIPT),
+                str(ROOT),
+                str(SOURCE_MAP_PATH),
+                "--incremental",
+                "--chunks",
+                str(SOURCE_MAP_CHUNKS_DIR),
+            ],
             check=True,
         )
     except subprocess.CalledProcessError as exc:
@@ -502,50 +889,32 @@ def ensure_source_map(force: bool = False, dry_run: bool = False) -> bool:
             f"Failed to generate source map (exit code {exc.returncode})"
         ) from exc
 
+    state.mark_built(BUILD_TARGETS["source-map"])
+    state.save()
     return True
 
 
 def ensure_scenarios(
-    *, force: bool = False, dry_run: bool = False, preferred_lune: str = "lune"
+    *,
+    force: bool = False,
+    dry_run: bool = False,
+    preferred_lune: str = "lune",
+    state: Optional[BuildState] = None,
 ) -> bool:
-    """Compile scenario manifests into runtime modules when inputs change."""
+    """Compile scenario manifests into runtime modules when their inputs change."""
 
     if not SCENARIO_DIR.exists():
         return False
 
-    latest_input = 0.0
-
-    for path in SCENARIO_DIR.glob("*.lua*"):
-        try:
-            latest_input = max(latest_input, path.stat().st_mtime)
-        except OSError:
-            continue
-
-    engine_root = ROOT / "engine"
-    for path in engine_root.rglob("*.lua"):
-        try:
-            latest_input = max(latest_input, path.stat().st_mtime)
-        except OSError:
-            continue
-
-    artifact_mtimes: List[float] = []
-    if SCENARIO_ARTIFACT_DIR.exists():
-        for path in SCENARIO_ARTIFACT_DIR.glob("*.roblox.lua"):
-            try:
-                artifact_mtimes.append(path.stat().st_mtime)
-            except OSError:
-                continue
-
-    needs_compile = force or not artifact_mtimes
-    if not needs_compile:
-        artifact_latest = max(artifact_mtimes) if artifact_mtimes else 0.0
-        needs_compile = artifact_latest < latest_input
-
-    if not needs_compile:
+    state = state or BuildState()
+    reasons = _stale_build_reasons("scenarios", state, force)
+    if not reasons:
         return False
 
     if dry_run:
-        print("[run-harness] Would compile engine scenarios (dry-run enabled)")
+        print(
+            f"[run-harness] Would compile engine scenarios ({'; '.join(reasons)}; dry-run enabled)"
+        )
         return False
 
     try:
@@ -554,7 +923,10 @@ def ensure_scenarios(
         raise RuntimeError(f"Failed to prepare Lune for scenario compilation: {err}") from err
 
     command = [lune_executable, "run", str(SCENARIO_COMPILE_SCRIPT), "--root", str(ROOT)]
-    print("[run-harness] Compiling engine scenarios via tests/tools/compile_scenarios.lua …")
+    print(
+        "[run-harness] Compiling engine scenarios via tests/tools/compile_scenarios.lua "
+        f"({'; '.join(reasons)}) …"
+    )
     try:
         subprocess.run(command, check=True)
     except subprocess.CalledProcessError as exc:
@@ -562,28 +934,25 @@ def ensure_scenarios(
             f"Failed to compile scenarios (exit code {exc.returncode})"
         ) from exc
 
+    state.mark_built(BUILD_TARGETS["scenarios"])
+    state.save()
     return True
 
 
-def ensure_place(force: bool = False, dry_run: bool = False) -> bool:
-    """Rebuild the Rojo place if required.
+def ensure_place(
+    force: bool = False, dry_run: bool = False, state: Optional[BuildState] = None
+) -> bool:
+    """Rebuild the Rojo place if any of its inputs or upstream outputs changed.
 
     Returns True when a rebuild occurred, False otherwise.
     """
-    needs_build = force or not PLACE_FILE.exists()
-
-    if not needs_build and PLACE_FILE.exists():
-        try:
-            place_mtime = PLACE_FILE.stat().st_mtime
-        except OSError:
-            place_mtime = 0.0
-        needs_build = place_mtime < find_latest_source_mtime()
-
-    if not needs_build:
+    state = state or BuildState()
+    reasons = _stale_build_reasons("place", state, force)
+    if not reasons:
         return False
 
     if dry_run:
-        print("[run-harness] Would rebuild test place (dry-run enabled)")
+        print(f"[run-harness] Would rebuild test place ({'; '.join(reasons)}; dry-run enabled)")
         return False
 
     if not shutil.which("python3"):
@@ -594,15 +963,183 @@ def ensure_place(force: bool = False, dry_run: bool = False) -> bool:
             "rojo CLI not found. Install via https://rojo.space/docs/v7/getting-started/"
         )
 
-    print("[run-harness] Rebuilding Rojo test place via tests/build-place.sh …")
+    print(
+        f"[run-harness] Rebuilding Rojo test place via tests/build-place.sh ({'; '.join(reasons)}) …"
+    )
     try:
         subprocess.run([str(BUILD_SCRIPT)], check=True)
     except subprocess.CalledProcessError as exc:
         raise RuntimeError(f"Failed to rebuild harness place (exit code {exc.returncode})") from exc
 
+    # build-place.sh refreshes the source map as a side effect.
+    state.refresh(BUILD_TARGETS["source-map"].outputs())
+    state.mark_built(BUILD_TARGETS["place"])
+    state.save()
     return True
 
 
+@dataclass(frozen=True)
+class ArtifactOptions:
+    """How captured artifacts are written to disk."""
+
+    pretty: bool = False
+    gzip_over: Optional[int] = None
+
+
+class JsonStreamValidator:
+    """Check that a JSON document is structurally sound while it is still arriving.
+
+    Complete strings are stripped and matched bracket pairs collapsed with C-level
+    string operations, so memory stays proportional to nesting depth and the cost
+    per chunk is a handful of passes rather than a Python loop per character.
+    Scalars are not validated; ``--pretty-artifacts`` performs a full decode when
+    that matters.
+    """
+
+    _STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+    _STRING_TAIL = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+    _NON_BRACKET = re.compile(r"[^{}\[\]]+")
+
+    def __init__(self) -> None:
+        self._open = ""
+        self._in_string = False
+        self._escaped = False
+        self._seen_value = False
+        self._closed = False
+        self.error: Optional[str] = None
+        self.size = 0
+
+    @staticmethod
+    def _ends_with_escape(text: str) -> bool:
+        return (len(text) - len(text.rstrip("\\"))) % 2 == 1
+
+    def feed(self, chunk: str) -> None:
+        if self.error is not None or not chunk:
+            return
+        self.size += len(chunk)
+
+        text = chunk
+        if self._in_string:
+            if self._escaped:
+                text = text[1:]
+                self._escaped = False
+            match = self._STRING_TAIL.match(text)
+            if match is None:
+                self._escaped = self._ends_with_escape(text)
+                return
+            text = text[match.end():]
+            self._in_string = False
+
+        text = self._STRING.sub("0", text)
+        quote = text.find('"')
+        if quote >= 0:
+            self._in_string = True
+            self._escaped = self._ends_with_escape(text[quote + 1 :])
+            text = text[: quote + 1]
+
+        if not text.strip():
+            return
+        if self._closed:
+            self.error = "unexpected data after the top-level value"
+            return
+        self._seen_value = True
+
+        brackets = self._NON_BRACKET.sub("", text)
+        if not brackets:
+            return
+        sequence = self._open + brackets
+        previous = None
+        while sequence != previous:
+            previous = sequence
+            sequence = sequence.replace("{}", "").replace("[]", "")
+        if "}" in sequence or "]" in sequence:
+            self.error = f"unbalanced brackets near byte {self.size}"
+            return
+        self._open = sequence
+        if not sequence and not self._in_string:
+            self._closed = True
+            last_bracket = max(text.rfind("}"), text.rfind("]"))
+            if text[last_bracket + 1 :].strip():
+                self.error = "unexpected data after the top-level value"
+
+    def close(self) -> Optional[str]:
+        if self.error is None:
+            if self._in_string:
+                self.error = "unterminated string"
+            elif self._open:
+                self.error = f"{len(self._open)} unclosed bracket(s)"
+            elif not self._seen_value:
+                self.error = "empty payload"
+        return self.error
+
+
+class ArtifactStream:
+    """Write one artifact payload to disk as it arrives.
+
+    The payload is validated incrementally and written to a ``.partial`` file
+    that only replaces the final artifact once the document closes cleanly, so
+    the harness never holds more than one read chunk of it in memory.
+    """
+
+    def __init__(self, name: str, artifact_dir: Path, options: ArtifactOptions) -> None:
+        self.name = name
+        self.options = options
+        self.path = artifact_dir / f"{name}.json"
+        self._partial_path = artifact_dir / f"{name}.json.partial"
+        self._validator = JsonStreamValidator()
+        self._handle = self._partial_path.open("w", encoding="utf-8")
+
+    def feed(self, chunk: str) -> None:
+        self._validator.feed(chunk)
+        if self._validator.error is None:
+            self._handle.write(chunk)
+
+    def _discard(self) -> None:
+        self._handle.close()
+        try:
+            self._partial_path.unlink()
+        except OSError:
+            pass
+
+    def finish(self) -> Path:
+        """Validate, finalise and return the artifact path.
+
+        Raises ``ValueError`` for malformed payloads and ``OSError`` for write failures.
+        """
+        error = self._validator.close()
+        if error is not None:
+            self._discard()
+            raise ValueError(error)
+
+        try:
+            self._handle.write("\n")
+            self._handle.close()
+            if self.options.pretty:
+                with self._partial_path.open("r", encoding="utf-8") as handle:
+                    data = json.load(handle)
+                with self._partial_path.open("w", encoding="utf-8") as handle:
+                    json.dump(data, handle, indent=2, sort_keys=True)
+                    handle.write("\n")
+
+            gzip_over = self.options.gzip_over
+            if gzip_over is not None and self._partial_path.stat().st_size >= gzip_over:
+                compressed_path = self.path.with_name(f"{self.path.name}.gz")
+                with self._partial_path.open("rb") as source, gzip.open(compressed_path, "wb") as target:
+                    shutil.copyfileobj(source, target)
+                self._partial_path.unlink()
+                self.path.unlink(missing_ok=True)
+                self.path = compressed_path
+            else:
+                os.replace(self._partial_path, self.path)
+        except json.JSONDecodeError as err:
+            self._discard()
+            raise ValueError(str(err)) from err
+        except OSError:
+            self._discard()
+            raise
+        return self.path
+
+
 @dataclass
 class SuiteResult:
     name: str
@@ -618,6 +1155,9 @@ class SuiteResult:
     summary_lines: List[str] = field(default_factory=list)
     skipped: bool = False
     optional: bool = False
+    output: List[str] = field(default_factory=list)
+    spec_durations: Dict[str, float] = field(default_factory=dict)
+    metrics: Dict[str, float] = field(default_factory=dict)
 
     @property
     def succeeded(self) -> bool:
@@ -637,11 +1177,14 @@ class SuiteRunner:
         artifact_dir: Path,
         *,
         optional: bool = False,
+        buffer_output: bool = False,
+        display_name: Optional[str] = None,
+        artifact_options: Optional[ArtifactOptions] = None,
     ) -> None:
         self.base_name = base_name
         self.iteration = iteration
         self.total_iterations = total_iterations
-        self.display_name = (
+        self.display_name = display_name or (
             base_name
             if total_iterations <= 1
             else f"{base_name} (run {iteration}/{total_iterations})"
@@ -650,48 +1193,73 @@ class SuiteRunner:
         self.log_path = log_path
         self.artifact_dir = artifact_dir
         self.optional = optional
+        self.buffer_output = buffer_output
+        self.artifact_options = artifact_options or ArtifactOptions()
         self.artifact_dir.mkdir(parents=True, exist_ok=True)
         self._artifacts: Dict[str, Path] = {}
         self._passed: List[str] = []
         self._failed: List[str] = []
         self._summary: List[str] = []
+        self._output: List[str] = []
+        self._spec_durations: Dict[str, float] = {}
 
-    def _write_artifact(self, name: str, payload: str) -> None:
-        try:
-            data = json.loads(payload)
-        except json.JSONDecodeError as err:
-            print(f"[run-harness] Failed to decode artifact {name}: {err}", file=sys.stderr)
+    def _emit(self, text: str, *, end: str = "\n", error: bool = False) -> None:
+        """Print console output, or hold it back when the suite runs in a worker."""
+        if self.buffer_output:
+            self._output.append(text + end)
             return
+        print(text, end=end, file=sys.stderr if error else sys.stdout)
 
-        artifact_path = self.artifact_dir / f"{name}.json"
+    def _open_artifact_stream(self, line: str) -> Optional[ArtifactStream]:
+        """Start streaming an artifact if ``line`` opens with an artifact marker."""
+        # Only leading whitespace is dropped: ``line`` may end mid-string.
+        stripped = line.lstrip()
+        for pattern, name_template in ARTIFACT_PATTERNS:
+            match = pattern.match(stripped)
+            if not match:
+                continue
+            groups = match.groups()
+            payload = groups[-1]
+            if "{name}" in name_template:
+                artifact_name = name_template.format(name=groups[0])
+                payload = groups[1]
+            else:
+                artifact_name = name_template
+            try:
+                stream = ArtifactStream(artifact_name, self.artifact_dir, self.artifact_options)
+            except OSError as err:
+                self._emit(
+                    f"[run-harness] Failed to write artifact {artifact_name}: {err}", error=True
+                )
+                return None
+            stream.feed(payload)
+            return stream
+        return None
+
+    def _finish_artifact(self, stream: ArtifactStream) -> None:
         try:
-            with artifact_path.open("w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2, sort_keys=True)
-                handle.write("\n")
+            artifact_path = stream.finish()
+        except ValueError as err:
+            self._emit(f"[run-harness] Failed to decode artifact {stream.name}: {err}", error=True)
+            return
         except OSError as err:
-            print(f"[run-harness] Failed to write artifact {artifact_path}: {err}", file=sys.stderr)
+            self._emit(f"[run-harness] Failed to write artifact {stream.path}: {err}", error=True)
             return
 
-        self._artifacts[name] = artifact_path
-        print(f"[run-harness] Captured artifact {name} → {artifact_path.relative_to(ROOT)}")
+        self._artifacts[stream.name] = artifact_path
+        self._emit(
+            f"[run-harness] Captured artifact {stream.name} → {artifact_path.relative_to(ROOT)}"
+        )
 
     def _handle_line(self, line: str) -> Optional[str]:
         stripped = line.strip()
         if not stripped:
             return None
 
-        for pattern, name_template in ARTIFACT_PATTERNS:
-            match = pattern.match(stripped)
-            if match:
-                groups = match.groups()
-                payload = groups[-1]
-                if "{name}" in name_template:
-                    artifact_name = name_template.format(name=groups[0])
-                    payload = groups[1]
-                else:
-                    artifact_name = name_template
-                self._write_artifact(artifact_name, payload)
-                return ""
+        stream = self._open_artifact_stream(stripped)
+        if stream is not None:
+            self._finish_artifact(stream)
+            return ""
 
         match = PASS_PATTERN.match(stripped)
         if match:
@@ -705,6 +1273,14 @@ class SuiteRunner:
             self._failed.append(message)
             return None
 
+        match = SPEC_DURATION_PATTERN.match(stripped)
+        if match:
+            try:
+                self._spec_durations[match.group(1)] = float(match.group(2))
+            except ValueError:
+                pass
+            return ""
+
         match = SUMMARY_PATTERN.match(stripped)
         if match:
             self._summary.append(match.group(1))
@@ -712,10 +1288,17 @@ class SuiteRunner:
 
         return None
 
+    def _process_line(self, raw_line: str) -> None:
+        replacement = self._handle_line(raw_line)
+        if replacement is None:
+            self._emit(raw_line, end="")
+        elif replacement:
+            self._emit(replacement, end="")
+
     def run(self, env: Optional[Dict[str, str]] = None) -> SuiteResult:
         LOG_DIR.mkdir(parents=True, exist_ok=True)
         start = time.time()
-        print(f"[run-harness] ▶ Running {self.display_name} …")
+        self._emit(f"[run-harness] ▶ Running {self.display_name} …")
 
         with self.log_path.open("w", encoding="utf-8") as log_file:
             try:
@@ -730,14 +1313,42 @@ class SuiteRunner:
                 raise RuntimeError(f"Failed to spawn {self.command[0]}: {err}") from err
 
             assert process.stdout is not None
-            for raw_line in process.stdout:
-                log_file.write(raw_line)
+            artifact: Optional[ArtifactStream] = None
+            partial: List[str] = []
+            while True:
+                chunk = process.stdout.readline(OUTPUT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                log_file.write(chunk)
                 log_file.flush()
-                replacement = self._handle_line(raw_line)
-                if replacement is None:
-                    print(raw_line, end="")
-                elif replacement:
-                    print(replacement, end="")
+                complete = chunk.endswith("\n")
+
+                if artifact is not None:
+                    artifact.feed(chunk.rstrip() if complete else chunk)
+                    if complete:
+                        self._finish_artifact(artifact)
+                        artifact = None
+                    continue
+
+                if not complete and not partial:
+                    # A line longer than one chunk: artifacts stream straight to
+                    # disk, anything else is reassembled as before.
+                    artifact = self._open_artifact_stream(chunk)
+                    if artifact is not None:
+                        continue
+                if partial or not complete:
+                    partial.append(chunk)
+                    if not complete:
+                        continue
+                    chunk = "".join(partial)
+                    partial = []
+
+                self._process_line(chunk)
+
+            if artifact is not None:
+                self._finish_artifact(artifact)
+            elif partial:
+                self._process_line("".join(partial))
 
             process.wait()
             returncode = process.returncode or 0
@@ -745,7 +1356,7 @@ class SuiteRunner:
         duration = time.time() - start
         status = "PASSED" if returncode == 0 else f"FAILED (exit {returncode})"
         artifact_names = human_join(sorted(self._artifacts), "no artifacts")
-        print(
+        self._emit(
             f"[run-harness] ◀ {self.display_name} {status} in {duration:.1f}s — captured {artifact_names}.\n"
         )
 
@@ -766,7 +1377,295 @@ class SuiteRunner:
             failed_cases=list(self._failed),
             summary_lines=list(self._summary),
             optional=self.optional,
+            output=list(self._output),
+            spec_durations=dict(self._spec_durations),
+        )
+
+
+@dataclass(frozen=True)
+class PlannedRun:
+    suite_name: str
+    iteration: int
+    iterations: int
+    command: Sequence[str]
+    env: Optional[Dict[str, str]]
+    log_path: Path
+    artifact_dir: Path
+    optional: bool = False
+    parallel: bool = False
+    shards: Tuple[Tuple[str, ...], ...] = ()
+    shard_workers: int = 0
+    artifact_options: ArtifactOptions = ArtifactOptions()
+    engine_batches: Tuple[Tuple[str, ...], ...] = ()
+    engine_artifact: Optional[str] = None
+
+
+def run_sharded_suite(plan: PlannedRun, buffer_output: bool = False) -> SuiteResult:
+    """Fan a Lune spec suite out over one worker per shard and merge the results.
+
+    Each shard receives its module list through ``SPEC_MODULES`` and writes its own
+    log next to the suite log; artifacts share the suite's artifact directory. At most
+    ``plan.shard_workers`` shards run at once (all of them when it is 0).
+    """
+    display_name = build_display_name(plan.suite_name, plan.iteration, plan.iterations)
+    shard_total = len(plan.shards)
+    base_env = dict(plan.env) if plan.env is not None else os.environ.copy()
+    base_env.pop("SPEC_SHARD", None)
+
+    runners: List[Tuple[SuiteRunner, Dict[str, str]]] = []
+    for index, modules in enumerate(plan.shards, start=1):
+        shard_env = dict(base_env)
+        shard_env["SPEC_MODULES"] = ",".join(modules)
+        log_path = plan.log_path.with_name(
+            f"{plan.log_path.stem}-shard-{index}{plan.log_path.suffix}"
+        )
+        runner = SuiteRunner(
+            plan.suite_name,
+            plan.iteration,
+            plan.iterations,
+            plan.command,
+            log_path=log_path,
+            artifact_dir=plan.artifact_dir,
+            optional=plan.optional,
+            buffer_output=True,
+            display_name=f"{display_name} [shard {index}/{shard_total}]",
+            artifact_options=plan.artifact_options,
         )
+        runners.append((runner, shard_env))
+
+    output: List[str] = [
+        f"[run-harness] ▶ Running {display_name} across {shard_total} shard(s) …\n"
+    ]
+    shard_workers = min(plan.shard_workers or shard_total, shard_total)
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=shard_workers) as executor:
+        shard_results = list(executor.map(lambda item: item[0].run(env=item[1]), runners))
+    duration = time.time() - start
+
+    returncode = next((item.returncode for item in shard_results if item.returncode != 0), 0)
+    artifacts: Dict[str, Path] = {}
+    passed: List[str] = []
+    failed: List[str] = []
+    summary: List[str] = []
+    spec_durations: Dict[str, float] = {}
+    for index, shard_result in enumerate(shard_results, start=1):
+        output.extend(shard_result.output)
+        artifacts.update(shard_result.artifacts)
+        passed.extend(shard_result.passed_cases)
+        failed.extend(shard_result.failed_cases)
+        spec_durations.update(shard_result.spec_durations)
+        for line in shard_result.summary_lines:
+            summary.append(f"shard {index}/{shard_total}: {line}")
+
+    status = "PASSED" if returncode == 0 else f"FAILED (exit {returncode})"
+    output.append(
+        f"[run-harness] ◀ {display_name} {status} in {duration:.1f}s across {shard_total} shard(s) "
+        f"— {len(passed)} passed, {len(failed)} failed.\n\n"
+    )
+
+    if not buffer_output:
+        for chunk in output:
+            print(chunk, end="")
+        output = []
+
+    return SuiteResult(
+        name=plan.suite_name,
+        display_name=display_name,
+        iteration=plan.iteration,
+        command=list(plan.command),
+        returncode=returncode,
+        duration=duration,
+        log_path=shard_results[0].log_path if shard_results else None,
+        artifacts=artifacts,
+        passed_cases=passed,
+        failed_cases=failed,
+        summary_lines=summary,
+        optional=plan.optional,
+        output=output,
+        spec_durations=spec_durations,
+    )
+
+
+def run_engine_worker_suite(plan: PlannedRun, buffer_output: bool = False) -> SuiteResult:
+    """Run scenario batches on parallel Lune workers, then merge their results.
+
+    Every worker runs its batch in its own runtime and prints the raw scenario
+    results as an ``engine_scenario_batch_<i>`` artifact. A final Lune process
+    merges the batches and emits ``plan.engine_artifact`` through the runner's
+    payload builders, so the artifact matches a serial place run.
+    """
+    display_name = build_display_name(plan.suite_name, plan.iteration, plan.iterations)
+    worker_total = len(plan.engine_batches)
+    base_env = dict(plan.env) if plan.env is not None else os.environ.copy()
+    batch_dir = plan.artifact_dir / "workers"
+
+    runners: List[Tuple[SuiteRunner, Dict[str, str]]] = []
+    for index, modules in enumerate(plan.engine_batches, start=1):
+        worker_env = dict(base_env)
+        worker_env["ENGINE_SCENARIOS"] = ",".join(modules)
+        worker_env["ENGINE_SCENARIO_BATCH"] = f"engine_scenario_batch_{index}"
+        runner = SuiteRunner(
+            plan.suite_name,
+            plan.iteration,
+            plan.iterations,
+            plan.command,
+            log_path=plan.log_path.with_name(
+                f"{plan.log_path.stem}-worker-{index}{plan.log_path.suffix}"
+            ),
+            artifact_dir=batch_dir,
+            optional=plan.optional,
+            buffer_output=True,
+            display_name=f"{display_name} [worker {index}/{worker_total}]",
+            artifact_options=plan.artifact_options,
+        )
+        runners.append((runner, worker_env))
+
+    output: List[str] = [
+        f"[run-harness] ▶ Running {display_name} across {worker_total} engine worker(s) …\n"
+    ]
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=worker_total) as executor:
+        worker_results = list(executor.map(lambda item: item[0].run(env=item[1]), runners))
+
+    passed: List[str] = []
+    failed: List[str] = []
+    batch_paths: List[Path] = []
+    returncode = 0
+    for index, worker_result in enumerate(worker_results, start=1):
+        output.extend(worker_result.output)
+        passed.extend(worker_result.passed_cases)
+        failed.extend(worker_result.failed_cases)
+        batch_path = worker_result.artifacts.get(f"engine_scenario_batch_{index}")
+        if worker_result.returncode != 0:
+            returncode = worker_result.returncode
+        elif batch_path is None:
+            returncode = 1
+            failed.append(f"worker {index}/{worker_total} did not emit its scenario batch")
+        else:
+            batch_paths.append(batch_path)
+
+    artifacts: Dict[str, Path] = {}
+    if returncode == 0:
+        merge_env = dict(base_env)
+        merge_env["ENGINE_SCENARIO_MERGE"] = ",".join(str(path) for path in batch_paths)
+        merge_env["ENGINE_SCENARIO_ARTIFACT"] = plan.engine_artifact or "engine_simulation"
+        merger = SuiteRunner(
+            plan.suite_name,
+            plan.iteration,
+            plan.iterations,
+            plan.command,
+            log_path=plan.log_path,
+            artifact_dir=plan.artifact_dir,
+            optional=plan.optional,
+            buffer_output=True,
+            display_name=f"{display_name} [merge]",
+            artifact_options=plan.artifact_options,
+        )
+        merged = merger.run(env=merge_env)
+        output.extend(merged.output)
+        passed.extend(merged.passed_cases)
+        failed.extend(merged.failed_cases)
+        artifacts.update(merged.artifacts)
+        returncode = merged.returncode
+    duration = time.time() - start
+
+    status = "PASSED" if returncode == 0 else f"FAILED (exit {returncode})"
+    output.append(
+        f"[run-harness] ◀ {display_name} {status} in {duration:.1f}s across {worker_total} engine worker(s).\n\n"
+    )
+
+    if not buffer_output:
+        for chunk in output:
+            print(chunk, end="")
+        output = []
+
+    return SuiteResult(
+        name=plan.suite_name,
+        display_name=display_name,
+        iteration=plan.iteration,
+        command=list(plan.command),
+        returncode=returncode,
+        duration=duration,
+        log_path=plan.log_path,
+        artifacts=artifacts,
+        passed_cases=passed,
+        failed_cases=failed,
+        optional=plan.optional,
+        output=output,
+    )
+
+
+def run_planned_suite(plan: PlannedRun, buffer_output: bool = False) -> SuiteResult:
+    if plan.engine_batches:
+        return run_engine_worker_suite(plan, buffer_output)
+    if plan.shards:
+        return run_sharded_suite(plan, buffer_output)
+    runner = SuiteRunner(
+        plan.suite_name,
+        plan.iteration,
+        plan.iterations,
+        plan.command,
+        log_path=plan.log_path,
+        artifact_dir=plan.artifact_dir,
+        optional=plan.optional,
+        buffer_output=buffer_output,
+        artifact_options=plan.artifact_options,
+    )
+    return runner.run(env=plan.env)
+
+
+def _flush_buffered_output(result: SuiteResult) -> None:
+    for chunk in result.output:
+        print(chunk, end="")
+    result.output = []
+
+
+def execute_planned_runs(plans: Sequence[PlannedRun], jobs: int) -> List[SuiteResult]:
+    """Run the planned suites, fanning parallel-safe entries out to a process pool.
+
+    Parallel-safe suites (static tooling and Lune-backed specs) execute on up to
+    ``jobs`` worker processes with their console output buffered and replayed as a
+    single block once each suite finishes. Everything else — notably the
+    run-in-roblox suites, which share one Studio session — runs serially in the
+    main process while the pool drains.
+
+    Sharded suites count against the same budget: each pooled suite may run at most
+    ``jobs // workers`` shards at once, so no more than ``jobs`` Lune processes are
+    alive at any time.
+    """
+    pooled = [plan for plan in plans if plan.parallel]
+    serial = [plan for plan in plans if not plan.parallel]
+    results: List[SuiteResult] = []
+
+    if not pooled or jobs <= 1:
+        for plan in plans:
+            results.append(run_planned_suite(replace(plan, shard_workers=max(1, jobs))))
+        return results
+
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    workers = min(jobs, len(pooled))
+    shard_budget = max(1, jobs // workers)
+    pooled = [replace(plan, shard_workers=shard_budget) for plan in pooled]
+    print(
+        f"[run-harness] Scheduling {len(pooled)} suite run(s) across {workers} worker process(es) …"
+    )
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures: Dict[Future[SuiteResult], PlannedRun] = {
+            executor.submit(run_planned_suite, plan, True): plan for plan in pooled
+        }
+
+        for plan in serial:
+            results.append(run_planned_suite(plan))
+
+        for future in as_completed(futures):
+            result = future.result()
+            _flush_buffered_output(result)
+            results.append(result)
+
+    return results
 
 
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
@@ -780,6 +1679,7 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
   python tests/run_harness.py --suite spec
   python tests/run_harness.py --suite perf --force-build
   python tests/run_harness.py --suite spec --suite accuracy --keep-artifacts
+  python tests/run_harness.py --suite static --suite quick --jobs 4
 """
         ),
     )
@@ -827,7 +1727,61 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         type=int,
         default=1,
         metavar="N",
-        help="Repeat Roblox-backed suites N times to detect flakiness (default: 1).",
+        help=(
+            "Repeat Roblox- and Lune-backed suites N times and aggregate case failure rates and "
+            "metric confidence intervals into repeat-summary.json (default: 1)."
+        ),
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Split Lune spec suites across N worker processes balanced by recorded "
+            "per-spec durations (default: 1)."
+        ),
+    )
+    parser.add_argument(
+        "--engine-workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Run engine-sim, engine-replay and engine-metrics on N parallel Lune workers "
+            "instead of the Rojo place, merging their results into the usual artifacts (default: 1)."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Run independent static and Lune-backed suites on N worker processes "
+            "(default: 1, or one per repeat up to the CPU count with --repeat; "
+            "0 uses every CPU core)."
+        ),
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help=(
+            "Rewrite tests/perf/baseline.json from this run's perf distribution instead of "
+            "failing on a regression."
+        ),
+    )
+    parser.add_argument(
+        "--pretty-artifacts",
+        action="store_true",
+        help="Re-indent captured JSON artifacts with sorted keys (decodes each payload in memory).",
+    )
+    parser.add_argument(
+        "--gzip-artifacts-over",
+        type=float,
+        default=None,
+        metavar="MB",
+        help="Gzip captured artifacts at least MB megabytes in size (0 compresses every artifact).",
     )
 
     return parser.parse_args(argv)
@@ -904,7 +1858,7 @@ def clear_artifacts() -> None:
     baseline_dir = ARTIFACTS_DIR / "engine" / "baselines"
     for path in ARTIFACTS_DIR.iterdir():
         try:
-            if path == baseline_dir:
+            if path in (baseline_dir, CACHE_DIR, SCENARIO_ARTIFACT_DIR):
                 continue
             if path.is_dir():
                 if path == ARTIFACTS_DIR / "engine" and baseline_dir.exists():
@@ -932,7 +1886,7 @@ def summarise_perf_result(result: SuiteResult) -> None:
         return
 
     try:
-        with artifact_path.open("r", encoding="utf-8") as handle:
+        with open_artifact(artifact_path) as handle:
             payload = json.load(handle)
     except (OSError, json.JSONDecodeError) as err:
         result.summary_lines.append(f"perf artifact parse failed: {err}")
@@ -954,8 +1908,14 @@ def summarise_perf_result(result: SuiteResult) -> None:
     samples = summary.get("samples")
     if isinstance(average, (int, float)):
         metrics_bits.append(f"mean {average * 1000:.2f} ms")
+        result.metrics["average_ms"] = average * 1000
     if isinstance(p95, (int, float)):
         metrics_bits.append(f"p95 {p95 * 1000:.2f} ms")
+        result.metrics["p95_ms"] = p95 * 1000
+    p99 = summary.get("p99")
+    if isinstance(p99, (int, float)):
+        metrics_bits.append(f"p99 {p99 * 1000:.2f} ms")
+        result.metrics["p99_ms"] = p99 * 1000
     if isinstance(samples, int) and samples > 0:
         metrics_bits.append(f"{samples} samples")
     if metrics_bits:
@@ -996,12 +1956,222 @@ def summarise_perf_result(result: SuiteResult) -> None:
             result.summary_lines.append(line)
 
 
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Linear-interpolated percentile matching the heartbeat benchmark's helper."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * fraction
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def mann_whitney_greater(sample: Sequence[float], reference: Sequence[float]) -> float:
+    """One-sided Mann-Whitney U p-value that ``sample`` is stochastically larger.
+
+    Uses the normal approximation with tie correction, which is accurate for the
+    hundreds of frame samples each benchmark run produces.
+    """
+    n1, n2 = len(sample), len(reference)
+    if not n1 or not n2:
+        return 1.0
+
+    combined = sorted(
+        [(value, 0) for value in sample] + [(value, 1) for value in reference]
+    )
+    rank_sum = 0.0
+    tie_term = 0.0
+    index = 0
+    total = len(combined)
+    while index < total:
+        end = index
+        while end + 1 < total and combined[end + 1][0] == combined[index][0]:
+            end += 1
+        ties = end - index + 1
+        average_rank = (index + end) / 2 + 1
+        rank_sum += average_rank * sum(1 for item in combined[index : end + 1] if item[1] == 0)
+        tie_term += ties ** 3 - ties
+        index = end + 1
+
+    u_statistic = rank_sum - n1 * (n1 + 1) / 2
+    mean_u = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z_score = (u_statistic - mean_u - 0.5) / variance ** 0.5
+    return 0.5 * math.erfc(z_score / math.sqrt(2))
+
+
+def current_commit() -> str:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return completed.stdout.strip() or "unknown"
+
+
+def perf_samples(result: SuiteResult) -> List[float]:
+    """Return the raw frame-time distribution captured in a perf artifact."""
+    path = result.artifacts.get("perf")
+    if result.skipped or not path:
+        return []
+    payload = load_json_file(path)
+    if not isinstance(payload, dict):
+        return []
+    distribution = payload.get("distribution")
+    if not isinstance(distribution, list):
+        return []
+    return [float(value) for value in distribution if isinstance(value, (int, float))]
+
+
+def load_perf_history() -> List[Dict[str, Any]]:
+    payload = load_json_file(PERF_HISTORY_PATH)
+    if not isinstance(payload, dict) or not isinstance(payload.get("entries"), list):
+        return []
+    return [entry for entry in payload["entries"] if isinstance(entry, dict)]
+
+
+def record_perf_history(commit: str, samples: Sequence[float]) -> None:
+    """Keep a rolling per-commit record of perf distributions for later comparisons."""
+    if not samples:
+        return
+    entries = [entry for entry in load_perf_history() if entry.get("commit") != commit]
+    entries.append(
+        {
+            "commit": commit,
+            "recordedAt": time.time(),
+            "summary": summarise_distribution(samples),
+            "samples": [round(value, 9) for value in samples],
+        }
+    )
+    entries = entries[-PERF_HISTORY_LIMIT:]
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with PERF_HISTORY_PATH.open("w", encoding="utf-8") as handle:
+            json.dump({"entries": entries}, handle)
+            handle.write("\n")
+    except OSError as err:
+        print(f"[run-harness] Failed to record perf history: {err}", file=sys.stderr)
+
+
+def summarise_distribution(samples: Sequence[float]) -> Dict[str, float]:
+    return {
+        "samples": len(samples),
+        "average": statistics.fmean(samples),
+        "p95": percentile(samples, 0.95),
+        "p99": percentile(samples, 0.99),
+    }
+
+
+def reference_perf_samples(commit: str) -> Tuple[List[float], str]:
+    """Pick the distribution a run is gated against.
+
+    The committed baseline wins; without one the most recent history entry from
+    a different commit stands in.
+    """
+    baseline = load_json_file(PERF_BASELINE_PATH)
+    if isinstance(baseline, dict) and isinstance(baseline.get("distribution"), list):
+        samples = [float(value) for value in baseline["distribution"] if isinstance(value, (int, float))]
+        if samples:
+            label = str(baseline.get("commit") or "baseline")[:12]
+            return samples, f"baseline {label}"
+
+    for entry in reversed(load_perf_history()):
+        if entry.get("commit") != commit and isinstance(entry.get("samples"), list):
+            return [float(value) for value in entry["samples"]], f"history {str(entry['commit'])[:12]}"
+    return [], ""
+
+
+def gate_perf_results(results: Sequence[SuiteResult], *, enforce: bool = True) -> None:
+    """Fail perf runs that are significantly slower than the reference or over budget."""
+    commit = current_commit()
+    reference, label = reference_perf_samples(commit)
+    pooled: List[float] = []
+
+    for result in results:
+        samples = perf_samples(result)
+        if not samples:
+            continue
+        pooled.extend(samples)
+
+        failures: List[str] = []
+        p99 = percentile(samples, 0.99)
+        if p99 > PERF_P99_BUDGET:
+            failures.append(
+                f"p99 {p99 * 1000:.2f} ms exceeds the {PERF_P99_BUDGET * 1000:.0f} ms budget"
+            )
+
+        if reference:
+            p_value = mann_whitney_greater(samples, reference)
+            reference_median = statistics.median(reference)
+            shift = (
+                statistics.median(samples) / reference_median - 1 if reference_median > 0 else 0.0
+            )
+            result.summary_lines.append(
+                f"vs {label}: median {shift * 100:+.1f}%, Mann-Whitney p={p_value:.4f} "
+                f"(n={len(samples)}/{len(reference)})"
+            )
+            if p_value < PERF_REGRESSION_ALPHA and shift >= PERF_REGRESSION_MIN_SHIFT:
+                failures.append(f"significant slowdown vs {label}")
+
+        for failure in failures:
+            result.summary_lines.append(f"perf regression: {failure}")
+        if failures and enforce and result.returncode == 0:
+            result.returncode = 1
+
+    record_perf_history(commit, pooled)
+
+
+def update_perf_baseline(results: Sequence[SuiteResult]) -> bool:
+    """Rewrite ``tests/perf/baseline.json`` from the pooled distributions of ``results``."""
+    samples: List[float] = []
+    for result in results:
+        samples.extend(perf_samples(result))
+    if not samples:
+        print(
+            "[run-harness] --update-baseline skipped: no perf distribution was captured",
+            file=sys.stderr,
+        )
+        return False
+
+    existing = load_json_file(PERF_BASELINE_PATH)
+    notes = (
+        existing.get("notes")
+        if isinstance(existing, dict) and existing.get("notes")
+        else "Update these values when establishing a new performance baseline from main."
+    )
+    summary = summarise_distribution(samples)
+    payload = {
+        "summary": {"average": summary["average"], "p95": summary["p95"], "p99": summary["p99"]},
+        "commit": current_commit(),
+        "samples": summary["samples"],
+        "distribution": [round(value, 9) for value in samples],
+        "notes": notes,
+    }
+    with PERF_BASELINE_PATH.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2)
+        handle.write("\n")
+    print(
+        f"[run-harness] Updated {PERF_BASELINE_PATH.relative_to(ROOT)} from {len(samples)} samples "
+        f"(avg {summary['average'] * 1000:.2f} ms, p95 {summary['p95'] * 1000:.2f} ms, "
+        f"p99 {summary['p99'] * 1000:.2f} ms)"
+    )
+    return True
+
+
 def load_artifact_json(result: SuiteResult, artifact_name: str) -> Optional[Any]:
     path = result.artifacts.get(artifact_name)
     if not path:
         return None
     try:
-        with path.open("r", encoding="utf-8") as handle:
+        with open_artifact(path) as handle:
             return json.load(handle)
     except (OSError, json.JSONDecodeError) as err:
         result.summary_lines.append(f"{artifact_name} artifact parse failed: {err}")
@@ -1111,7 +2281,7 @@ def summarise_accuracy_result(result: SuiteResult) -> None:
         return
 
     try:
-        with artifact_path.open("r", encoding="utf-8") as handle:
+        with open_artifact(artifact_path) as handle:
             payload = json.load(handle)
     except (OSError, json.JSONDecodeError) as err:
         result.summary_lines.append(f"accuracy artifact parse failed: {err}")
@@ -1133,12 +2303,16 @@ def summarise_accuracy_result(result: SuiteResult) -> None:
 
     if isinstance(accuracy, (int, float)):
         metrics_bits.append(f"accuracy {accuracy * 100:.2f}%")
+        result.metrics["accuracy_pct"] = accuracy * 100
     if isinstance(precision, (int, float)):
         metrics_bits.append(f"precision {precision * 100:.2f}%")
+        result.metrics["precision_pct"] = precision * 100
     if isinstance(false_positives, int):
         metrics_bits.append(f"{false_positives} false positive(s)")
+        result.metrics["false_positives"] = false_positives
     if isinstance(missed, int):
         metrics_bits.append(f"{missed} missed")
+        result.metrics["missed"] = missed
     if metrics_bits:
         result.summary_lines.append(", ".join(metrics_bits))
 
@@ -1178,7 +2352,7 @@ def summarise_telemetry_result(result: SuiteResult) -> None:
         return
 
     try:
-        with artifact_path.open("r", encoding="utf-8") as handle:
+        with open_artifact(artifact_path) as handle:
             payload = json.load(handle)
     except (OSError, json.JSONDecodeError) as err:
         result.summary_lines.append(f"telemetry artifact parse failed: {err}")
@@ -1260,6 +2434,113 @@ SUMMARY_HOOKS: Dict[str, Tuple[Callable[[SuiteResult], None], ...]] = {
 }
 
 
+# Two-sided 95% Student's t critical values indexed by degrees of freedom.
+T_CRITICAL_95: Tuple[float, ...] = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+
+
+def describe_samples(values: Sequence[float]) -> Dict[str, float]:
+    """Mean, spread and a 95% confidence interval for the mean of ``values``."""
+    count = len(values)
+    mean = statistics.fmean(values)
+    stddev = statistics.stdev(values) if count > 1 else 0.0
+    critical = T_CRITICAL_95[count - 2] if 1 < count <= len(T_CRITICAL_95) + 1 else 1.96
+    half_width = critical * stddev / (count ** 0.5) if count > 1 else 0.0
+    return {
+        "count": count,
+        "mean": mean,
+        "stddev": stddev,
+        "min": min(values),
+        "max": max(values),
+        "ciLow": mean - half_width,
+        "ciHigh": mean + half_width,
+    }
+
+
+def summarise_repeats(results: Sequence[SuiteResult]) -> Dict[str, Any]:
+    """Aggregate repeated runs of one suite into case failure rates and metric distributions.
+
+    ``failureRate`` is the share of repeats a case failed in; only cases that both
+    passed and failed are listed in ``flakyCases``.
+    """
+    executed = [item for item in results if not item.skipped]
+
+    cases: Dict[str, Dict[str, int]] = {}
+    for result in executed:
+        for name in result.passed_cases:
+            cases.setdefault(name, {"passed": 0, "failed": 0})["passed"] += 1
+        for name in result.failed_cases:
+            cases.setdefault(name, {"passed": 0, "failed": 0})["failed"] += 1
+
+    case_report: Dict[str, Dict[str, float]] = {}
+    flaky: List[str] = []
+    for name, counts in sorted(cases.items()):
+        total = counts["passed"] + counts["failed"]
+        case_report[name] = {
+            "passed": counts["passed"],
+            "failed": counts["failed"],
+            "failureRate": counts["failed"] / total,
+        }
+        if counts["passed"] and counts["failed"]:
+            flaky.append(name)
+
+    samples: Dict[str, List[float]] = {}
+    for result in executed:
+        for key, value in result.metrics.items():
+            samples.setdefault(key, []).append(float(value))
+
+    return {
+        "runs": len(executed),
+        "passed": sum(1 for item in executed if item.returncode == 0),
+        "failed": sum(1 for item in executed if item.returncode != 0),
+        "cases": case_report,
+        "flakyCases": flaky,
+        "metrics": {key: describe_samples(values) for key, values in sorted(samples.items())},
+    }
+
+
+def write_repeat_summary(
+    results_by_suite: Dict[str, List[SuiteResult]], repeat: int
+) -> Dict[str, Dict[str, Any]]:
+    """Write ``repeat-summary.json`` for every suite that executed more than once."""
+    suites = {
+        name: summarise_repeats(results)
+        for name, results in results_by_suite.items()
+        if sum(1 for item in results if not item.skipped) > 1
+    }
+    if not suites:
+        return suites
+
+    payload = {"generatedAt": time.time(), "repeat": repeat, "suites": suites}
+    try:
+        ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
+        with REPEAT_SUMMARY_PATH.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+    except OSError as err:
+        print(f"[run-harness] Failed to write {REPEAT_SUMMARY_PATH}: {err}", file=sys.stderr)
+    return suites
+
+
+def format_repeat_details(summary: Dict[str, Any], indent: str = "      ") -> List[str]:
+    lines: List[str] = []
+    for key, stats in summary["metrics"].items():
+        if stats["count"] < 2:
+            continue
+        half_width = stats["ciHigh"] - stats["mean"]
+        lines.append(
+            f"{indent}{key} {stats['mean']:.3f} ± {half_width:.3f} (95% CI, n={stats['count']}), "
+            f"stddev {stats['stddev']:.3f}, range {stats['min']:.3f}–{stats['max']:.3f}"
+        )
+    for name in summary["flakyCases"]:
+        rate = summary["cases"][name]["failureRate"]
+        lines.append(f"{indent}flaky: {name} failed {rate * 100:.0f}% of runs")
+    return lines
+
+
 def status_label(result: SuiteResult) -> str:
     if result.skipped and result.optional:
         return "SKIP (optional)"
@@ -1361,7 +2642,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         else:
             spec_engine = "lune"
 
-    if spec_engine == "lune":
+    if spec_engine == "lune" or args.engine_workers > 1:
         if not lune_available:
             try:
                 resolved_lune = ensure_lune_cli(args.lune, dry_run=args.dry_run)
@@ -1386,40 +2667,78 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         place_file=PLACE_FILE,
         spec_engine=spec_engine,
         lune_executable=lune_executable,
+        engine_workers=max(args.engine_workers, 1),
     )
 
     needs_place = any(suite_requires_place(config, harness_ctx) for config in selected_configs)
+    needs_scenarios = needs_place or any(
+        suite_uses_engine_workers(config, harness_ctx) for config in selected_configs
+    )
     needs_source_map = any(suite_requires_source_map(config, harness_ctx) for config in selected_configs)
 
     if args.repeat < 1:
         print("[run-harness] --repeat expects a value >= 1", file=sys.stderr)
         return 1
 
+    if args.jobs is not None and args.jobs < 0:
+        print("[run-harness] --jobs expects a value >= 0", file=sys.stderr)
+        return 1
+    if args.jobs is None:
+        # Repeats of parallel-safe suites fan out by default; everything else stays serial.
+        jobs = min(args.repeat, os.cpu_count() or 1)
+    else:
+        jobs = args.jobs or (os.cpu_count() or 1)
+
+    if args.shards < 1:
+        print("[run-harness] --shards expects a value >= 1", file=sys.stderr)
+        return 1
+    if args.engine_workers < 1:
+        print("[run-harness] --engine-workers expects a value >= 1", file=sys.stderr)
+        return 1
+    spec_durations = load_spec_durations()
+
+    if args.gzip_artifacts_over is not None and args.gzip_artifacts_over < 0:
+        print("[run-harness] --gzip-artifacts-over expects a value >= 0", file=sys.stderr)
+        return 1
+    artifact_options = ArtifactOptions(
+        pretty=args.pretty_artifacts,
+        gzip_over=(
+            None
+            if args.gzip_artifacts_over is None
+            else int(args.gzip_artifacts_over * 1024 * 1024)
+        ),
+    )
+
     if args.dry_run:
         print("[run-harness] Dry run enabled — no commands will execute.")
 
     if not args.keep_artifacts and not args.dry_run:
         clear_artifacts()
 
+    build_state = BuildState()
+
     if needs_source_map:
         try:
-            ensure_source_map(force=args.force_build, dry_run=args.dry_run)
+            ensure_source_map(force=args.force_build, dry_run=args.dry_run, state=build_state)
         except RuntimeError as err:
             print(f"[run-harness] {err}", file=sys.stderr)
             return 1
 
-    if needs_place and not args.skip_build:
+    if needs_scenarios and not args.skip_build:
         try:
             ensure_scenarios(
                 force=args.force_build,
                 dry_run=args.dry_run,
                 preferred_lune=lune_executable,
+                state=build_state,
             )
         except RuntimeError as err:
             print(f"[run-harness] {err}", file=sys.stderr)
             return 1
+
+    if needs_place and not args.skip_build:
         try:
-            ensure_place(force=args.force_build, dry_run=args.dry_run)
+            ensure_place(force=args.force_build, dry_run=args.dry_run, state=build_state)
         except RuntimeError as err:
             print(f"[run-harness] {err}", file=sys.stderr)
             return 1
@@ -1450,10 +2769,19 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         return 1
 
     results_by_suite: Dict[str, List[SuiteResult]] = {}
+    planned_runs: List[PlannedRun] = []
 
     for suite_name in suites_to_run:
         config = SUITES[suite_name]
-        iterations = args.repeat if (config.repeatable and suite_requires_place(config, harness_ctx)) else 1
+        iterations = (
+            args.repeat
+            if config.repeatable
+            and (
+                suite_requires_place(config, harness_ctx)
+                or suite_is_parallel_safe(config, harness_ctx)
+            )
+            else 1
+        )
 
         for iteration in range(1, iterations + 1):
             display_name = build_display_name(suite_name, iteration, iterations)
@@ -1515,12 +2843,58 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                         else:
                             suite_env[str(key)] = str(value)
 
+            shards: Tuple[Tuple[str, ...], ...] = ()
+            if args.shards > 1 and suite_is_shardable(config, harness_ctx):
+                modules = discover_spec_modules(suite_env.get("SPEC_FILTER"))
+                planned_shards = plan_spec_shards(modules, args.shards, spec_durations)
+                if len(planned_shards) > 1:
+                    shards = tuple(tuple(shard) for shard in planned_shards)
+
+            engine_batches: Tuple[Tuple[str, ...], ...] = ()
+            if suite_uses_engine_workers(config, harness_ctx):
+                planned_batches = plan_scenario_batches(harness_ctx.engine_workers)
+                engine_batches = tuple(tuple(batch) for batch in planned_batches)
+
             if args.dry_run:
                 env_note = ""
                 if suite_env is not env:
                     diff_bits = [f"{k}={v}" for k, v in overrides.items()]
                     env_note = f" with env {' '.join(diff_bits)}" if diff_bits else ""
-                print(f"[run-harness] Would run {display_name}{env_note}:", " ".join(command))
+                mode_note = (
+                    " [parallel]" if jobs > 1 and suite_is_parallel_safe(config, harness_ctx) else ""
+                )
+                print(
+                    f"[run-harness] Would run {display_name}{mode_note}{env_note}:",
+                    " ".join(command),
+                )
+                for index, shard in enumerate(shards, start=1):
+                    print(f"[run-harness]   shard {index}/{len(shards)}: {', '.join(shard)}")
+                for index, batch in enumerate(engine_batches, start=1):
+                    print(
+                        f"[run-harness]   engine worker {index}/{len(engine_batches)}: {', '.join(batch)}"
+                    )
+                continue
+
+            if suite_uses_engine_workers(config, harness_ctx) and not engine_batches:
+                print(
+                    f"[run-harness] Skipping {display_name} — no compiled scenarios to distribute",
+                    file=sys.stderr,
+                )
+                results_by_suite.setdefault(suite_name, []).append(
+                    SuiteResult(
+                        name=suite_name,
+                        display_name=display_name,
+                        iteration=iteration,
+                        command=command,
+                        returncode=1,
+                        duration=0.0,
+                        log_path=None,
+                        artifacts={},
+                        summary_lines=["no compiled scenarios under tests/artifacts/scenarios"],
+                        skipped=True,
+                        optional=config.optional,
+                    )
+                )
                 continue
 
             if not command:
@@ -1579,36 +2953,58 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                 if iterations == 1
                 else artifact_root / f"run-{iteration}"
             )
-            runner = SuiteRunner(
-                suite_name,
-                iteration,
-                iterations,
-                command,
-                log_path=LOG_DIR / log_name,
-                artifact_dir=artifact_dir,
-                optional=config.optional,
+            planned_runs.append(
+                PlannedRun(
+                    suite_name=suite_name,
+                    iteration=iteration,
+                    iterations=iterations,
+                    command=command,
+                    env=suite_env,
+                    log_path=LOG_DIR / log_name,
+                    artifact_dir=artifact_dir,
+                    optional=config.optional,
+                    parallel=jobs > 1 and suite_is_parallel_safe(config, harness_ctx),
+                    shards=shards,
+                    artifact_options=artifact_options,
+                    engine_batches=engine_batches,
+                    engine_artifact=config.engine_artifact,
+                )
             )
-            try:
-                result = runner.run(env=suite_env)
-            except RuntimeError as err:
-                print(f"[run-harness] {err}", file=sys.stderr)
-                return 1
-
-            for hook in SUMMARY_HOOKS.get(suite_name, ()): 
-                try:
-                    hook(result)
-                except Exception as hook_err:
-                    result.summary_lines.append(f"summary hook failed: {hook_err}")
-
-            results_by_suite.setdefault(suite_name, []).append(result)
 
     if args.dry_run:
         return 0
 
+    try:
+        executed = execute_planned_runs(planned_runs, jobs)
+    except RuntimeError as err:
+        print(f"[run-harness] {err}", file=sys.stderr)
+        return 1
+
+    record_spec_durations(executed)
+
+    for result in executed:
+        for hook in SUMMARY_HOOKS.get(result.name, ()):
+            try:
+                hook(result)
+            except Exception as hook_err:
+                result.summary_lines.append(f"summary hook failed: {hook_err}")
+        results_by_suite.setdefault(result.name, []).append(result)
+
+    for suite_results in results_by_suite.values():
+        suite_results.sort(key=lambda item: item.iteration)
+
+    perf_results = results_by_suite.get("perf", [])
+    if perf_results:
+        gate_perf_results(perf_results, enforce=not args.update_baseline)
+        if args.update_baseline:
+            update_perf_baseline(perf_results)
+
     if not any(results_by_suite.values()):
         print("[run-harness] No suites were executed.")
         return 0
 
+    repeat_summaries = write_repeat_summary(results_by_suite, args.repeat)
+
     print("\nSummary:")
     overall_success = True
     for suite_name in suites_to_run:
@@ -1627,6 +3023,9 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             continue
 
         print(format_group_header(suite_name, suite_results))
+        if suite_name in repeat_summaries:
+            for line in format_repeat_details(repeat_summaries[suite_name]):
+                print(line)
         for result in suite_results:
             print(format_result_line("      ", result))
             emit_result_details(result, indent="        ")
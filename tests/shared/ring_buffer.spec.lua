@@ -0,0 +1,98 @@
+-- selene: allow(global_usage)
+local TestHarness = script.Parent.Parent
+local SourceMap = require(TestHarness:WaitForChild("AutoParrySourceMap"))
+
+local function loadUtilModule()
+    local chunk, err = loadstring(SourceMap["src/shared/util.lua"], "=src/shared/util.lua")
+    assert(chunk, err)
+
+    local previous = rawget(_G, "ARequire")
+    local ok, result = pcall(chunk)
+
+    if previous == nil then
+        rawset(_G, "ARequire", nil)
+    else
+        rawset(_G, "ARequire", previous)
+    end
+
+    if not ok then
+        error(result, 0)
+    end
+
+    return result
+end
+
+local function joined(buffer)
+    return table.concat(buffer:toArray(), ",")
+end
+
+return function(t)
+    local Util = loadUtilModule()
+    local RingBuffer = Util.RingBuffer
+
+    t.test("push keeps insertion order and evicts the oldest when full", function(expect)
+        local buffer = RingBuffer.new(3)
+        expect(buffer:len()):toEqual(0)
+        expect(buffer:newest()):toEqual(nil)
+
+        expect(buffer:push(1)):toEqual(nil)
+        buffer:push(2)
+        buffer:push(3)
+        expect(joined(buffer)):toEqual("1,2,3")
+
+        expect(buffer:push(4)):toEqual(1)
+        expect(buffer:push(5)):toEqual(2)
+        expect(buffer:len()):toEqual(3)
+        expect(joined(buffer)):toEqual("3,4,5")
+        expect(buffer:oldest()):toEqual(3)
+        expect(buffer:newest()):toEqual(5)
+        expect(buffer:get(-2)):toEqual(4)
+        expect(buffer:get(4)):toEqual(nil)
+        expect(buffer:get(0)):toEqual(nil)
+    end)
+
+    t.test("trimWhile drops entries from the oldest end across the wrap point", function(expect)
+        local buffer = RingBuffer.new(4)
+        for value = 1, 6 do
+            buffer:push(value)
+        end
+
+        local removed = buffer:trimWhile(function(value)
+            return value < 5
+        end)
+
+        expect(removed):toEqual(2)
+        expect(joined(buffer)):toEqual("5,6")
+        expect(buffer:shift()):toEqual(5)
+        expect(buffer:shift()):toEqual(6)
+        expect(buffer:shift()):toEqual(nil)
+        expect(buffer:trimWhile(function()
+            return true
+        end)):toEqual(0)
+
+        buffer:push(7)
+        buffer:push(8)
+        local seen = {}
+        for index, value in buffer:iterate() do
+            seen[index] = value
+        end
+        expect(table.concat(seen, ",")):toEqual("7,8")
+    end)
+
+    t.test("clear empties the buffer and is recognises instances", function(expect)
+        local buffer = RingBuffer.new(2)
+        buffer:push("a")
+        buffer:push("b")
+        buffer:push("c")
+        buffer:clear()
+
+        expect(buffer:len()):toEqual(0)
+        expect(#buffer:toArray()):toEqual(0)
+        buffer:push("d")
+        expect(joined(buffer)):toEqual("d")
+
+        expect(RingBuffer.is(buffer)):toEqual(true)
+        expect(RingBuffer.is({})):toEqual(false)
+        expect(pcall(RingBuffer.new, 0)):toEqual(false)
+    end)
+end
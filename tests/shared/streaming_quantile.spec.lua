@@ -0,0 +1,140 @@
+-- selene: allow(global_usage)
+local TestHarness = script.Parent.Parent
+local SourceMap = require(TestHarness:WaitForChild("AutoParrySourceMap"))
+
+local function loadUtilModule()
+    local chunk, err = loadstring(SourceMap["src/shared/util.lua"], "=src/shared/util.lua")
+    assert(chunk, err)
+
+    local previous = rawget(_G, "ARequire")
+    local ok, result = pcall(chunk)
+
+    if previous == nil then
+        rawset(_G, "ARequire", nil)
+    else
+        rawset(_G, "ARequire", previous)
+    end
+
+    if not ok then
+        error(result, 0)
+    end
+
+    return result
+end
+
+-- Mirrors the exact estimator in src/core/autoparry.lua: sort the last
+-- `window` samples and pick the nearest-rank index.
+local function exactQuantile(samples, quantile, window)
+    local sorted = table.move(samples, math.max(1, #samples - window + 1), #samples, 1, {})
+    table.sort(sorted)
+    local count = #sorted
+    local index = math.clamp(math.floor(quantile * (count - 1) + 1.5), 1, count)
+    return sorted[index], sorted[1], sorted[count]
+end
+
+local function newGenerator(seed)
+    local state = seed
+    return function()
+        state = (state * 16807) % 2147483647
+        return state / 2147483647
+    end
+end
+
+return function(t)
+    local Util = loadUtilModule()
+    local StreamingQuantile = Util.StreamingQuantile
+
+    t.test("tracks the exact windowed quantile on a stationary stream", function(expect)
+        for _, quantile in ipairs({ 0.1, 0.5, 0.9, 0.99 }) do
+            local window = 256
+            local random = newGenerator(12345)
+            local sketch = StreamingQuantile.new(quantile, window)
+            local samples = {}
+            local worst = 0
+
+            for index = 1, window * 4 do
+                local sample = 0.05 + 0.1 * random() + 0.02 * (random() + random() + random())
+                samples[index] = sample
+                StreamingQuantile.push(sketch, sample)
+                if index >= window then
+                    local exact = exactQuantile(samples, quantile, window)
+                    worst = math.max(worst, math.abs(StreamingQuantile.summarise(sketch).value - exact))
+                end
+            end
+
+            -- Samples span roughly 0.05..0.21, so this is within ~8% of the range.
+            expect(worst <= 0.0125):toBeTruthy()
+
+            local summary = StreamingQuantile.summarise(sketch)
+            local exact = exactQuantile(samples, quantile, window)
+            expect(summary.count):toEqual(window)
+            expect(summary.value):toBeCloseTo(exact, 0.005)
+        end
+    end)
+
+    t.test("matches the exact estimator while the window is filling", function(expect)
+        local sketch = StreamingQuantile.new(0.5, 64)
+        expect(StreamingQuantile.summarise(sketch).count):toEqual(0)
+
+        local samples = { 0.3, 0.1, 0.4, 0.2 }
+        for index, sample in ipairs(samples) do
+            StreamingQuantile.push(sketch, sample)
+            local exact, low, high = exactQuantile(table.move(samples, 1, index, 1, {}), 0.5, 64)
+            local summary = StreamingQuantile.summarise(sketch)
+            expect(summary.count):toEqual(index)
+            expect(summary.value):toEqual(exact)
+            expect(summary.min):toEqual(low)
+            expect(summary.max):toEqual(high)
+        end
+    end)
+
+    t.test("follows a shift in the distribution within one window", function(expect)
+        for _, quantile in ipairs({ 0.5, 0.99 }) do
+            local window = 256
+            local random = newGenerator(7)
+            local sketch = StreamingQuantile.new(quantile, window)
+            local samples = {}
+
+            for index = 1, window * 4 do
+                local base = if index <= window * 2 then 0.1 else 0.3
+                local sample = base + 0.05 * random()
+                samples[index] = sample
+                StreamingQuantile.push(sketch, sample)
+            end
+
+            local exact = exactQuantile(samples, quantile, window)
+            expect(StreamingQuantile.summarise(sketch).value):toBeCloseTo(exact, 0.01)
+            expect(StreamingQuantile.summarise(sketch).min >= 0.3):toBeTruthy()
+        end
+    end)
+
+    t.test("keeps exact min and max across a generation rollover", function(expect)
+        local sketch = StreamingQuantile.new(0.5, 8)
+        for sample = 1, 8 do
+            StreamingQuantile.push(sketch, sample)
+        end
+
+        -- The new generation is too small to read from, but its extremes count.
+        StreamingQuantile.push(sketch, 100)
+        local summary = StreamingQuantile.summarise(sketch)
+        expect(summary.min):toEqual(1)
+        expect(summary.max):toEqual(100)
+
+        -- Reads move to the current generation; the previous one still bounds it.
+        for _ = 1, 5 do
+            StreamingQuantile.push(sketch, 50)
+        end
+        summary = StreamingQuantile.summarise(sketch)
+        expect(summary.value):toEqual(50)
+        expect(summary.min):toEqual(1)
+        expect(summary.max):toEqual(100)
+
+        -- Once the first generation rolls off, its samples no longer count.
+        StreamingQuantile.push(sketch, 60)
+        StreamingQuantile.push(sketch, 70)
+        StreamingQuantile.push(sketch, 55)
+        summary = StreamingQuantile.summarise(sketch)
+        expect(summary.min):toEqual(50)
+        expect(summary.max):toEqual(100)
+    end)
+end
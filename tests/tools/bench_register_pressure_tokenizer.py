@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the register-pressure tokenizer.
+
+Compares the current compiled-regex scanner in ``check_register_pressure.py``
+against the original character-at-a-time tokenizer (kept here verbatim as the
+reference implementation), verifies both emit identical ``(kind, value, line)``
+streams, and reports throughput in tokens per second.
+
+Example usage:
+    python tests/tools/bench_register_pressure_tokenizer.py
+    python tests/tools/bench_register_pressure_tokenizer.py --repeat 10 src/ui/init.lua
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from check_register_pressure import KEYWORDS, ROOT, Token, tokenize  # noqa: E402
+
+DEFAULT_TARGET = ROOT / "src" / "core" / "autoparry.lua"
+
+
+def match_long_bracket(source: str, index: int) -> int:
+    if source[index] != "[":
+        return -1
+    depth = 0
+    cursor = index + 1
+    while cursor < len(source) and source[cursor] == "=":
+        depth += 1
+        cursor += 1
+    if cursor < len(source) and source[cursor] == "[":
+        return depth
+    return -1
+
+
+def skip_long_bracket(source: str, index: int, eq_count: int, line: int) -> Tuple[int, int]:
+    closing = "]" + ("=" * eq_count) + "]"
+    cursor = index + 1 + eq_count + 1
+    while cursor < len(source):
+        char = source[cursor]
+        if char == "\n":
+            line += 1
+            cursor += 1
+            continue
+        if source.startswith(closing, cursor):
+            cursor += len(closing)
+            return cursor, line
+        cursor += 1
+    return len(source), line
+
+
+def skip_string(source: str, index: int, quote: str, line: int) -> Tuple[int, int]:
+    cursor = index + 1
+    while cursor < len(source):
+        char = source[cursor]
+        if char == "\\":
+            cursor += 2
+            continue
+        if char == quote:
+            return cursor + 1, line
+        if char == "\n":
+            line += 1
+        cursor += 1
+    return len(source), line
+
+
+def legacy_tokenize(source: str) -> Iterator[Token]:
+    index = 0
+    line = 1
+    length = len(source)
+
+    while index < length:
+        char = source[index]
+
+        if char == "\n":
+            line += 1
+            index += 1
+            continue
+
+        if char in "\r\t\v\f ":
+            index += 1
+            continue
+
+        if char == "-" and index + 1 < length and source[index + 1] == "-":
+            index += 2
+            if index < length and source[index] == "[":
+                depth = match_long_bracket(source, index)
+                if depth >= 0:
+                    index, line = skip_long_bracket(source, index, depth, line)
+                    continue
+            while index < length and source[index] != "\n":
+                index += 1
+            continue
+
+        if char in {'"', "'"}:
+            start_line = line
+            index, line = skip_string(source, index, char, line)
+            yield "string", "", start_line
+            continue
+
+        if char == "[":
+            depth = match_long_bracket(source, index)
+            if depth >= 0:
+                start_line = line
+                index, line = skip_long_bracket(source, index, depth, line)
+                yield "string", "", start_line
+                continue
+            yield "[", "[", line
+            index += 1
+            continue
+
+        if char.isdigit():
+            cursor = index + 1
+            while cursor < length and (source[cursor].isalnum() or source[cursor] in {".", "_", "x", "X"}):
+                cursor += 1
+            yield "number", source[index:cursor], line
+            index = cursor
+            continue
+
+        if char.isalpha() or char == "_":
+            cursor = index + 1
+            while cursor < length and (source[cursor].isalnum() or source[cursor] == "_"):
+                cursor += 1
+            value = source[index:cursor]
+            kind = value if value in KEYWORDS else "name"
+            yield kind, value, line
+            index = cursor
+            continue
+
+        if char == ".":
+            if source.startswith("...", index):
+                yield "ellipsis", "...", line
+                index += 3
+                continue
+            if source.startswith("..", index):
+                yield "concat", "..", line
+                index += 2
+                continue
+            yield ".", ".", line
+            index += 1
+            continue
+
+        single = {
+            "(": "(",
+            ")": ")",
+            "{": "{",
+            "}": "}",
+            ",": ",",
+            ";": ";",
+            ":": ":",
+            "=": "=",
+            "<": "<",
+            ">": ">",
+            "[": "[",
+            "]": "]",
+            "+": "+",
+            "-": "-",
+            "*": "*",
+            "/": "/",
+            "%": "%",
+            "^": "^",
+            "#": "#",
+            "?": "?",
+            "~": "~",
+        }
+        if char in single:
+            yield single[char], single[char], line
+            index += 1
+            continue
+
+        # Unknown character, skip it conservatively.
+        index += 1
+
+
+def measure(
+    tokenizer: Callable[[str], Iterator[Token]], source: str, repeat: int
+) -> Tuple[int, float]:
+    """Return the token count and best-of-``repeat`` wall time for one full scan."""
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = sum(1 for _ in tokenizer(source))
+        best = min(best, time.perf_counter() - start)
+    return count, best
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", type=Path, default=[DEFAULT_TARGET])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per tokenizer; the best time is reported.")
+    args = parser.parse_args(argv)
+
+    exit_code = 0
+    for path in args.paths:
+        resolved = path if path.is_absolute() else ROOT / path
+        source = resolved.read_text(encoding="utf-8")
+        label = resolved.relative_to(ROOT) if resolved.is_relative_to(ROOT) else resolved
+
+        expected: List[Token] = list(legacy_tokenize(source))
+        actual: List[Token] = list(tokenize(source))
+        if expected != actual:
+            mismatch = next(
+                (index for index, pair in enumerate(zip(expected, actual)) if pair[0] != pair[1]),
+                min(len(expected), len(actual)),
+            )
+            print(
+                f"[bench-tokenizer] {label}: token streams diverge at index {mismatch} "
+                f"(legacy {expected[mismatch:mismatch + 1]}, regex {actual[mismatch:mismatch + 1]})"
+            )
+            exit_code = 1
+            continue
+
+        legacy_count, legacy_time = measure(legacy_tokenize, source, args.repeat)
+        regex_count, regex_time = measure(tokenize, source, args.repeat)
+        legacy_rate = legacy_count / legacy_time if legacy_time > 0 else float("inf")
+        regex_rate = regex_count / regex_time if regex_time > 0 else float("inf")
+        print(f"[bench-tokenizer] {label}: {regex_count} tokens, {source.count(chr(10)) + 1} lines")
+        print(f"  - legacy char scanner: {legacy_time * 1000:8.2f} ms  ({legacy_rate:,.0f} tokens/s)")
+        print(f"  - compiled regex:      {regex_time * 1000:8.2f} ms  ({regex_rate:,.0f} tokens/s)")
+        print(f"  - speed-up:            {legacy_time / regex_time if regex_time > 0 else float('inf'):.2f}x")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Find the first simulated step where a scenario diverges between two commits.
+
+Both commits are checked out into temporary git worktrees and the scenario is
+run through the Lune engine worker (``tests/tools/run_specs.luau``) with
+``ENGINE_CHECKPOINTS`` set, which records a state digest (scheduler queue,
+world agents and projectiles, AutoParry telemetry counters, parry and remote
+counts) at each checkpoint time and stops the run at the last one. The first
+window whose digests disagree is re-run with a finer checkpoint interval until
+it is a single fixed step (1/240 s) wide.
+
+Runs cannot resume across processes, so every pass replays the scenario from
+t = 0, but each stops at the end of the current window instead of running the
+full scenario. Both commits must include the checkpoint worker mode.
+
+Example usage:
+    python tests/tools/bisect_scenario.py --scenario telemetry.roblox --good v1.4.0
+    python tests/tools/bisect_scenario.py --scenario telemetry.roblox --good HEAD~5 --bad HEAD --until 45
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[2]
+FIXED_STEP = 1 / 240
+REFINE_FACTOR = 16
+ARTIFACT_NAME = "engine_checkpoints"
+
+
+class BisectError(RuntimeError):
+    pass
+
+
+def _run(command: Sequence[str], *, cwd: Path, env: Optional[Dict[str, str]] = None) -> str:
+    completed = subprocess.run(
+        list(command), cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    if completed.returncode != 0:
+        tail = "".join(completed.stdout.splitlines(keepends=True)[-20:])
+        raise BisectError(f"{' '.join(command)} failed (exit {completed.returncode}):\n{tail}")
+    return completed.stdout
+
+
+class Checkout:
+    """A prepared worktree for one commit: source map and scenarios compiled."""
+
+    def __init__(self, label: str, commit: str, path: Path, lune: str) -> None:
+        self.label = label
+        self.commit = commit
+        self.path = path
+        self.lune = lune
+
+    def prepare(self) -> None:
+        _run(["git", "worktree", "add", "--detach", str(self.path), self.commit], cwd=ROOT)
+        fixtures = self.path / "tests" / "fixtures"
+        _run(
+            [
+                sys.executable,
+                str(self.path / "tests" / "tools" / "generate_source_map.py"),
+                str(self.path),
+                str(fixtures / "AutoParrySourceMap.lua"),
+                "--chunks",
+                str(fixtures / "AutoParrySourceMapChunks"),
+            ],
+            cwd=self.path,
+        )
+        _run(
+            [self.lune, "run", str(self.path / "tests" / "tools" / "compile_scenarios.lua"), "--root", str(self.path)],
+            cwd=self.path,
+        )
+
+    def checkpoints(self, scenario: str, start: float, stop: float, interval: float) -> List[Dict[str, Any]]:
+        env = os.environ.copy()
+        env["ENGINE_SCENARIOS"] = scenario
+        env["ENGINE_CHECKPOINTS"] = f"{start!r}:{stop!r}:{interval!r}"
+        env["ENGINE_CHECKPOINT_ARTIFACT"] = ARTIFACT_NAME
+        output = _run(
+            [self.lune, "run", str(self.path / "tests" / "tools" / "run_specs.luau"), "--root", str(self.path)],
+            cwd=self.path,
+            env=env,
+        )
+
+        prefix = f"[ARTIFACT] {ARTIFACT_NAME} "
+        for line in output.splitlines():
+            if line.startswith(prefix):
+                entries = json.loads(line[len(prefix) :])
+                if not entries:
+                    raise BisectError(f"{self.label} ({self.commit}) has no scenario module named {scenario}")
+                return entries[0].get("checkpoints") or []
+        raise BisectError(
+            f"{self.label} ({self.commit}) did not emit checkpoints; does it predate ENGINE_CHECKPOINTS?"
+        )
+
+    def remove(self) -> None:
+        subprocess.run(["git", "worktree", "remove", "--force", str(self.path)], cwd=ROOT, check=False)
+
+
+def diff_digests(left: Any, right: Any, tolerance: float, path: str = "") -> List[str]:
+    """Field paths where two digests differ; mirrors ``Runner.compareCheckpoints``."""
+    if isinstance(left, (int, float)) and isinstance(right, (int, float)) and not isinstance(left, bool):
+        return [path] if abs(left - right) > tolerance else []
+    if isinstance(left, list) and isinstance(right, list):
+        left = dict(enumerate(left, start=1))
+        right = dict(enumerate(right, start=1))
+    if isinstance(left, dict) and isinstance(right, dict):
+        fields: List[str] = []
+        for key in sorted(set(left) | set(right), key=str):
+            child = f"{path}.{key}" if path else str(key)
+            fields.extend(diff_digests(left.get(key), right.get(key), tolerance, child))
+        return fields
+    return [] if left == right else [path]
+
+
+def first_divergence(
+    good: List[Dict[str, Any]], bad: List[Dict[str, Any]], tolerance: float
+) -> Optional[Tuple[int, List[str]]]:
+    for index in range(max(len(good), len(bad))):
+        left = good[index] if index < len(good) else None
+        right = bad[index] if index < len(bad) else None
+        fields = diff_digests(left, right, tolerance)
+        if fields:
+            return index, fields
+    return None
+
+
+def bisect(
+    good: Checkout,
+    bad: Checkout,
+    scenario: str,
+    *,
+    until: float,
+    interval: float,
+    tolerance: float,
+) -> Optional[Tuple[float, float, List[str]]]:
+    """Return ``(last_agreeing_time, first_divergent_time, fields)`` or None."""
+    start = 0.0
+    stop = until
+    last_good = 0.0
+    while True:
+        print(f"[bisect-scenario] checking {start:.4f}s..{stop:.4f}s every {interval:.5f}s")
+        left = good.checkpoints(scenario, start, stop, interval)
+        right = bad.checkpoints(scenario, start, stop, interval)
+        found = first_divergence(left, right, tolerance)
+        if found is None:
+            return None
+
+        index, fields = found
+        divergent = (left[index] if index < len(left) else right[index]).get("time", start + index * interval)
+        if index > 0:
+            last_good = left[index - 1].get("time", start + (index - 1) * interval)
+        if interval <= FIXED_STEP + 1e-12:
+            return last_good, divergent, fields
+
+        start = last_good
+        stop = divergent
+        interval = max((stop - start) / REFINE_FACTOR, FIXED_STEP)
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", required=True, help="Compiled scenario module name (e.g. telemetry.roblox)")
+    parser.add_argument("--good", required=True, help="Commit whose run is treated as the reference")
+    parser.add_argument("--bad", default="HEAD", help="Commit suspected of diverging (default: HEAD)")
+    parser.add_argument("--until", type=float, default=60.0, help="Latest simulated time to check (seconds)")
+    parser.add_argument("--interval", type=float, default=1.0, help="Initial checkpoint interval (seconds)")
+    parser.add_argument("--tolerance", type=float, default=1e-6, help="Allowed absolute difference per number")
+    parser.add_argument("--lune", default="lune", help="Lune executable (default: lune on PATH)")
+    parser.add_argument("--keep-worktrees", action="store_true", help="Leave the temporary worktrees in place")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    lune = shutil.which(args.lune) or (args.lune if Path(args.lune).is_file() else None)
+    if lune is None:
+        print(f"[bisect-scenario] Lune executable {args.lune!r} was not found", file=sys.stderr)
+        return 1
+    if not (math.isfinite(args.until) and args.until > 0 and args.interval > 0):
+        print("[bisect-scenario] --until and --interval must be positive", file=sys.stderr)
+        return 1
+
+    workspace = Path(tempfile.mkdtemp(prefix="bisect-scenario-"))
+    good = Checkout("good", args.good, workspace / "good", lune)
+    bad = Checkout("bad", args.bad, workspace / "bad", lune)
+    try:
+        for checkout in (good, bad):
+            print(f"[bisect-scenario] preparing {checkout.label} worktree at {checkout.commit}")
+            checkout.prepare()
+
+        result = bisect(
+            good,
+            bad,
+            args.scenario,
+            until=args.until,
+            interval=max(args.interval, FIXED_STEP),
+            tolerance=args.tolerance,
+        )
+    except BisectError as exc:
+        print(f"[bisect-scenario] {exc}", file=sys.stderr)
+        return 1
+    finally:
+        if not args.keep_worktrees:
+            for checkout in (good, bad):
+                checkout.remove()
+            shutil.rmtree(workspace, ignore_errors=True)
+
+    if result is None:
+        print(f"[bisect-scenario] {args.scenario}: no divergence up to {args.until:.3f}s")
+        return 0
+
+    last_good, divergent, fields = result
+    print(
+        f"[bisect-scenario] {args.scenario}: first divergent step at {divergent:.6f}s "
+        f"(runs agree at {last_good:.6f}s)"
+    )
+    for field in fields[:20]:
+        print(f"  {field}")
+    if len(fields) > 20:
+        print(f"  … {len(fields) - 20} more field(s)")
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,12 +3,23 @@
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_TARGETS = [ROOT / "loader.lua", ROOT / "src"]
+DEFAULT_CACHE_PATH = ROOT / "tests" / "artifacts" / "cache" / "register-pressure.json"
+
+# Bump whenever tokenisation or the per-function metrics change so cached
+# FunctionReport lists from an older analyser are discarded.
+ANALYSER_VERSION = 2
 
 Token = Tuple[str, str, int]
 KEYWORDS = {
@@ -67,6 +78,15 @@ class FunctionReport:
     def display_name(self) -> str:
         return self.name or "<anonymous>"
 
+    def to_cache(self) -> Dict[str, Any]:
+        payload = asdict(self)
+        payload.pop("path")
+        return payload
+
+    @classmethod
+    def from_cache(cls, path: Path, payload: Dict[str, Any]) -> "FunctionReport":
+        return cls(path=path, **payload)
+
 
 @dataclass
 class FileReport:
@@ -194,167 +214,99 @@ class FunctionScope:
         )
 
 
-def match_long_bracket(source: str, index: int) -> int:
-    if source[index] != "[":
-        return -1
-    depth = 0
-    cursor = index + 1
-    while cursor < len(source) and source[cursor] == "=":
-        depth += 1
-        cursor += 1
-    if cursor < len(source) and source[cursor] == "[":
-        return depth
-    return -1
-
-
-def skip_long_bracket(source: str, index: int, eq_count: int, line: int) -> Tuple[int, int]:
-    closing = "]" + ("=" * eq_count) + "]"
-    cursor = index + 1 + eq_count + 1
-    while cursor < len(source):
-        char = source[cursor]
-        if char == "\n":
-            line += 1
-            cursor += 1
-            continue
-        if source.startswith(closing, cursor):
-            cursor += len(closing)
-            return cursor, line
-        cursor += 1
-    return len(source), line
-
-
-def skip_string(source: str, index: int, quote: str, line: int) -> Tuple[int, int]:
-    cursor = index + 1
-    while cursor < len(source):
-        char = source[cursor]
-        if char == "\\":
-            cursor += 2
-            continue
-        if char == quote:
-            return cursor + 1, line
-        if char == "\n":
-            line += 1
-        cursor += 1
-    return len(source), line
+TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<space>[ \t\r\v\f\n]+)
+    | (?P<word>[^\W\d]\w*)
+    | (?P<long_comment>--\[(?P<comment_eq>=*)\[.*?(?:\](?P=comment_eq)\]|\Z))
+    | (?P<comment>--[^\n]*)
+    | (?P<long_string>\[(?P<string_eq>=*)\[.*?(?:\](?P=string_eq)\]|\Z))
+    | (?P<string>"(?:\\.|\\\Z|[^"\\])*(?:"|\Z)|'(?:\\.|\\\Z|[^'\\])*(?:'|\Z))
+    | (?P<number>\d[^\W_]*(?:[._xX][^\W_]*)*)
+    | (?P<ellipsis>\.\.\.)
+    | (?P<concat>\.\.)
+    | (?P<symbol>[(){},;:=<>\[\]+\-*/%^#?~.])
+    | (?P<unknown>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
 
 
 def tokenize(source: str) -> Iterator[Token]:
-    index = 0
-    line = 1
-    length = len(source)
-
-    while index < length:
-        char = source[index]
-
-        if char == "\n":
-            line += 1
-            index += 1
-            continue
-
-        if char in "\r\t\v\f ":
-            index += 1
-            continue
+    """Scan ``source`` with a single compiled master regex.
 
-        if char == "-" and index + 1 < length and source[index + 1] == "-":
-            index += 2
-            if index < length and source[index] == "[":
-                depth = match_long_bracket(source, index)
-                if depth >= 0:
-                    index, line = skip_long_bracket(source, index, depth, line)
-                    continue
-            while index < length and source[index] != "\n":
-                index += 1
-            continue
-
-        if char in {'"', "'"}:
-            start_line = line
-            index, line = skip_string(source, index, char, line)
-            yield "string", "", start_line
-            continue
-
-        if char == "[":
-            depth = match_long_bracket(source, index)
-            if depth >= 0:
-                start_line = line
-                index, line = skip_long_bracket(source, index, depth, line)
-                yield "string", "", start_line
-                continue
-            yield "[", "[", line
-            index += 1
-            continue
-
-        if char.isdigit():
-            cursor = index + 1
-            while cursor < length and (source[cursor].isalnum() or source[cursor] in {".", "_", "x", "X"}):
-                cursor += 1
-            yield "number", source[index:cursor], line
-            index = cursor
-            continue
-
-        if char.isalpha() or char == "_":
-            cursor = index + 1
-            while cursor < length and (source[cursor].isalnum() or source[cursor] == "_"):
-                cursor += 1
-            value = source[index:cursor]
-            kind = value if value in KEYWORDS else "name"
-            yield kind, value, line
-            index = cursor
-            continue
-
-        if char == ".":
-            if source.startswith("...", index):
-                yield "ellipsis", "...", line
-                index += 3
-                continue
-            if source.startswith("..", index):
-                yield "concat", "..", line
-                index += 2
-                continue
-            yield ".", ".", line
-            index += 1
-            continue
-
-        single = {
-            "(": "(",
-            ")": ")",
-            "{": "{",
-            "}": "}",
-            ",": ",",
-            ";": ";",
-            ":": ":",
-            "=": "=",
-            "<": "<",
-            ">": ">",
-            "[": "[",
-            "]": "]",
-            "+": "+",
-            "-": "-",
-            "*": "*",
-            "/": "/",
-            "%": "%",
-            "^": "^",
-            "#": "#",
-            "?": "?",
-            "~": "~",
-        }
-        if char in single:
-            yield single[char], single[char], line
-            index += 1
+    Yields ``(kind, value, line)`` tuples: keywords use their own text as the
+    kind, identifiers are ``name``, and strings (quoted or long-bracket) are
+    ``string`` with an empty value. Comments and whitespace are dropped, and
+    multi-line tokens are attributed to the line they start on.
+    """
+    line = 1
+    keywords = KEYWORDS
+    for match in TOKEN_PATTERN.finditer(source):
+        group = match.lastgroup
+        if group == "space":
+            line += match.group().count("\n")
+        elif group == "word":
+            value = match.group()
+            yield (value if value in keywords else "name"), value, line
+        elif group == "symbol":
+            value = match.group()
+            yield value, value, line
+        elif group == "comment" or group == "unknown":
             continue
-
-        # Unknown character, skip it conservatively.
-        index += 1
-
-
-def gather_name(tokens: Sequence[Token], start: int) -> Tuple[List[Token], int]:
+        elif group == "number":
+            yield "number", match.group(), line
+        elif group == "string" or group == "long_string":
+            yield "string", "", line
+            line += match.group().count("\n")
+        elif group == "long_comment":
+            line += match.group().count("\n")
+        elif group == "ellipsis":
+            yield "ellipsis", "...", line
+        elif group == "concat":
+            yield "concat", "..", line
+
+
+class TokenStream:
+    """Lazily buffered view over a token iterator with arbitrary lookahead.
+
+    The analyser only needs to peek a bounded distance past the current token
+    (function names, parameter lists, ``local`` name lists), so tokens are pulled
+    from the scanner on demand instead of materialising the whole file.
+    """
+
+    def __init__(self, tokens: Iterable[Token]) -> None:
+        self._tokens = iter(tokens)
+        self._buffer: Deque[Token] = deque()
+
+    def peek(self, offset: int = 0) -> Optional[Token]:
+        buffer = self._buffer
+        while len(buffer) <= offset:
+            token = next(self._tokens, None)
+            if token is None:
+                return None
+            buffer.append(token)
+        return buffer[offset]
+
+    def advance(self, count: int = 1) -> None:
+        buffer = self._buffer
+        for _ in range(count):
+            if buffer:
+                buffer.popleft()
+            elif next(self._tokens, None) is None:
+                return
+
+
+def gather_name(tokens: TokenStream, start: int) -> Tuple[List[Token], int]:
     collected: List[Token] = []
     cursor = start
-    while cursor < len(tokens):
-        kind, _, _ = tokens[cursor]
-        if kind == "(":
+    token = tokens.peek(cursor)
+    while token is not None:
+        if token[0] == "(":
             break
-        collected.append(tokens[cursor])
+        collected.append(token)
         cursor += 1
+        token = tokens.peek(cursor)
     return collected, cursor
 
 
@@ -375,16 +327,17 @@ def format_name(tokens: Sequence[Token]) -> str:
     return result or "<anonymous>"
 
 
-def parse_parameters(tokens: Sequence[Token], start: int) -> Tuple[int, int]:
-    if start >= len(tokens) or tokens[start][0] != "(":
+def parse_parameters(tokens: TokenStream, start: int) -> Tuple[int, int]:
+    token = tokens.peek(start)
+    if token is None or token[0] != "(":
         return 0, start
     depth = 0
     count = 0
     cursor = start
     prev_kind: Optional[str] = None
 
-    while cursor < len(tokens):
-        kind, _, _ = tokens[cursor]
+    while token is not None:
+        kind = token[0]
         if kind == "(":
             depth += 1
             if depth == 1:
@@ -393,91 +346,81 @@ def parse_parameters(tokens: Sequence[Token], start: int) -> Tuple[int, int]:
             depth -= 1
             if depth == 0:
                 return count, cursor
-        else:
-            if depth == 1:
-                if kind == "name" and prev_kind in {"(", ",", "<"}:
-                    count += 1
-                    prev_kind = "name"
-                    cursor += 1
-                    continue
-                if kind == "ellipsis":
-                    prev_kind = "ellipsis"
-                    cursor += 1
-                    continue
-                if kind in {",", ";"}:
-                    prev_kind = ","
-                    cursor += 1
-                    continue
-                if kind == ":":
-                    prev_kind = ":"
-                    cursor += 1
-                    continue
-                if kind == "<":
-                    prev_kind = "<"
-                    cursor += 1
-                    continue
+        elif depth == 1:
+            if kind == "name" and prev_kind in {"(", ",", "<"}:
+                count += 1
+                prev_kind = "name"
+            elif kind == "ellipsis":
+                prev_kind = "ellipsis"
+            elif kind in {",", ";"}:
+                prev_kind = ","
+            elif kind == ":":
+                prev_kind = ":"
+            elif kind == "<":
+                prev_kind = "<"
         cursor += 1
+        token = tokens.peek(cursor)
 
     return count, cursor
 
 
-def count_local_names(tokens: Sequence[Token], start: int) -> int:
+def count_local_names(tokens: TokenStream, start: int) -> int:
     count = 0
     expecting_name = True
     cursor = start
-    while cursor < len(tokens):
-        kind, _, _ = tokens[cursor]
+    token = tokens.peek(cursor)
+    while token is not None:
+        kind = token[0]
         if kind == "=":
             break
         if kind == ",":
             expecting_name = True
-            cursor += 1
-            continue
-        if kind == "name" and expecting_name:
+        elif kind == "name" and expecting_name:
             count += 1
             expecting_name = False
         elif kind in {"function", "end", "if", "for", "while", "repeat", "return", "local", "do"}:
             break
         cursor += 1
+        token = tokens.peek(cursor)
     return count
 
 
-def count_for_variables(tokens: Sequence[Token], start: int) -> int:
+def count_for_variables(tokens: TokenStream, start: int) -> int:
     count = 0
     expecting_name = True
     cursor = start
-    while cursor < len(tokens):
-        kind, _, _ = tokens[cursor]
+    token = tokens.peek(cursor)
+    while token is not None:
+        kind = token[0]
         if kind == "=" or kind == "in":
             break
         if kind == ",":
             expecting_name = True
-            cursor += 1
-            continue
-        if kind == "name" and expecting_name:
+        elif kind == "name" and expecting_name:
             count += 1
             expecting_name = False
         cursor += 1
+        token = tokens.peek(cursor)
     return count
 
 
 def analyse_file(path: Path) -> List[FunctionReport]:
     source = path.read_text(encoding="utf-8")
-    tokens = list(tokenize(source))
+    tokens = TokenStream(tokenize(source))
     reports: List[FunctionReport] = []
     scope_stack: List[FunctionScope] = []
     block_stack: List[str] = []
 
-    index = 0
-    while index < len(tokens):
-        kind, _, line = tokens[index]
+    token = tokens.peek()
+    while token is not None:
+        kind, _, line = token
 
         if scope_stack:
             scope_stack[-1].record_token(kind, line)
 
         if kind == "function":
             block_stack.append("function")
-            name_tokens, param_start = gather_name(tokens, index + 1)
+            name_tokens, param_start = gather_name(tokens, 1)
             name = format_name(name_tokens)
             param_count, param_end = parse_parameters(tokens, param_start)
             scope = FunctionScope(
@@ -491,21 +434,23 @@ def analyse_file(path: Path) -> List[FunctionReport]:
                 for idx, ancestor in enumerate(scope_stack[:-1]):
                     depth = len(scope_stack) - 1 - idx
                     ancestor.max_closure_depth = max(ancestor.max_closure_depth, depth)
-            index = param_end + 1
+            tokens.advance(param_end + 1)
+            token = tokens.peek()
             continue
 
         if kind == "local":
             if scope_stack:
-                next_kind = tokens[index + 1][0] if index + 1 < len(tokens) else None
+                next_token = tokens.peek(1)
+                next_kind = next_token[0] if next_token is not None else None
                 if next_kind == "function":
                     scope_stack[-1].local_count += 1
                 else:
-                    scope_stack[-1].local_count += count_local_names(tokens, index + 1)
+                    scope_stack[-1].local_count += count_local_names(tokens, 1)
 
         elif kind == "for":
             block_stack.append("for")
             if scope_stack:
-                scope_stack[-1].local_count += count_for_variables(tokens, index + 1)
+                scope_stack[-1].local_count += count_for_variables(tokens, 1)
 
         elif kind in {"if", "while"}:
             block_stack.append(kind)
@@ -527,7 +472,8 @@ def analyse_file(path: Path) -> List[FunctionReport]:
                     scope = scope_stack.pop()
                     reports.append(scope.finalise())
 
-        index += 1
+        tokens.advance()
+        token = tokens.peek()
 
     while scope_stack:
         reports.append(scope_stack.pop().finalise())
@@ -548,13 +494,133 @@ def iter_lua_files(paths: Iterable[Path]) -> Iterator[Path]:
     yield from sorted(seen.keys())
 
 
-def run(limit: int, targets: Sequence[Path]) -> int:
+def _cache_key(path: Path) -> str:
+    try:
+        return path.relative_to(ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+class ReportCache:
+    """On-disk FunctionReport cache keyed by file digest and analyser version."""
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if path is None:
+            return
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(payload, dict) and payload.get("analyser_version") == ANALYSER_VERSION:
+            entries = payload.get("files")
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    def lookup(self, path: Path, digest: str) -> Optional[List[FunctionReport]]:
+        entry = self._entries.get(_cache_key(path))
+        if not isinstance(entry, dict) or entry.get("sha1") != digest:
+            return None
+        try:
+            return [FunctionReport.from_cache(path, item) for item in entry.get("reports", [])]
+        except TypeError:
+            return None
+
+    def store(self, path: Path, digest: str, reports: Sequence[FunctionReport]) -> None:
+        self._entries[_cache_key(path)] = {
+            "sha1": digest,
+            "reports": [report.to_cache() for report in reports],
+        }
+        self._dirty = True
+
+    def prune_missing(self) -> None:
+        for key in list(self._entries):
+            candidate = Path(key)
+            if not candidate.is_absolute():
+                candidate = ROOT / candidate
+            if not candidate.exists():
+                del self._entries[key]
+                self._dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("w", encoding="utf-8") as handle:
+                json.dump(
+                    {"analyser_version": ANALYSER_VERSION, "files": self._entries},
+                    handle,
+                    sort_keys=True,
+                )
+                handle.write("\n")
+        except OSError as err:
+            print(f"[register-pressure] Failed to write cache {self.path}: {err}")
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def analyse_files(
+    files: Sequence[Path], *, jobs: int = 1, cache: Optional[ReportCache] = None
+) -> Tuple[Dict[Path, List[FunctionReport]], int]:
+    """Analyse ``files``, reusing cached reports and fanning the rest out to ``jobs`` processes.
+
+    Returns the reports per file and how many files were served from the cache.
+    """
+    results: Dict[Path, List[FunctionReport]] = {}
+    pending: List[Tuple[Path, str]] = []
+    for path in files:
+        digest = file_digest(path)
+        cached = cache.lookup(path, digest) if cache is not None else None
+        if cached is not None:
+            results[path] = cached
+        else:
+            pending.append((path, digest))
+
+    hits = len(files) - len(pending)
+    if len(pending) > 1 and jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as executor:
+            analysed = list(executor.map(analyse_file, [path for path, _ in pending]))
+    else:
+        analysed = [analyse_file(path) for path, _ in pending]
+
+    for (path, digest), reports in zip(pending, analysed):
+        results[path] = reports
+        if cache is not None:
+            cache.store(path, digest, reports)
+
+    if cache is not None:
+        cache.prune_missing()
+        cache.save()
+
+    return results, hits
+
+
+def run(
+    limit: int,
+    targets: Sequence[Path],
+    *,
+    jobs: int = 1,
+    cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+) -> int:
     files = list(iter_lua_files(targets))
     reports: List[FunctionReport] = []
     file_reports: List[FileReport] = []
 
+    cache = ReportCache(cache_path) if cache_path is not None else None
+    analysed, cache_hits = analyse_files(files, jobs=jobs, cache=cache)
+    if cache is not None:
+        print(
+            f"[register-pressure] Reused cached reports for {cache_hits}/{len(files)} file(s)."
+        )
+
     for path in files:
-        per_file_reports = analyse_file(path)
+        per_file_reports = analysed[path]
         if not per_file_reports:
             continue
         reports.extend(per_file_reports)
@@ -738,6 +804,24 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default=DEFAULT_TARGETS,
         help="Files or directories to inspect (default: loader.lua and src/).",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Analyse changed files on N worker processes (default: 1, 0 uses every CPU core).",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE_PATH,
+        help="Report cache keyed by file digest and analyser version (default: tests/artifacts/cache/register-pressure.json).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Analyse every file from scratch without reading or writing the cache.",
+    )
     return parser
 
 
@@ -747,7 +831,11 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     resolved_targets = [
         path if path.is_absolute() else ROOT / path for path in args.paths
     ]
-    return run(args.limit, resolved_targets)
+    if args.jobs < 0:
+        parser.error("--jobs expects a value >= 0")
+    jobs = args.jobs or (os.cpu_count() or 1)
+    cache_path = None if args.no_cache else args.cache
+    return run(args.limit, resolved_targets, jobs=jobs, cache_path=cache_path)
 
 
 if __name__ == "__main__":
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import argparse
 import hashlib
+import json
+import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 ROOT_RELATIVE_PATHS: Tuple[Tuple[str, str], ...] = (
     ("loader.lua", "loader.lua"),
@@ -13,6 +16,38 @@ ROOT_RELATIVE_PATHS: Tuple[Tuple[str, str], ...] = (
     ("tests/fixtures/ui_snapshot.json", "tests/fixtures/ui_snapshot.json"),
 )
 
+MAP_PREAMBLE = "-- Auto-generated source map for AutoParry tests\nreturn {\n"
+MAP_EPILOGUE = "}\n"
+BLOCK_TERMINATOR = "\n]===],\n"
+BLOCK_HEADER_PATTERN = re.compile(
+    r"^    \['(?P<relative>[^'\n]+)'\] = \[===\[\n"
+    r"-- (?P=relative) \(sha1: (?P<digest>[0-9a-f]{40})\)\n",
+    re.MULTILINE,
+)
+STAT_CACHE_VERSION = 1
+DEFAULT_STAT_CACHE = Path("tests") / "artifacts" / "cache" / "source-map-stats.json"
+
+CHUNK_INDEX_NAME = "index.lua"
+CHUNK_INDEX_VERSION = 1
+CHUNK_INDEX_ENTRY_PATTERN = re.compile(
+    r"^        \['(?P<relative>[^'\n]+)'\] = \{ chunk = '(?P<chunk>[A-Za-z0-9_]+)', "
+    r"sha1 = '(?P<digest>[0-9a-f]{40})' \},$",
+    re.MULTILINE,
+)
+
+
+@dataclass(frozen=True)
+class MapBlock:
+    relative: str
+    digest: str
+    text: str
+
+    @property
+    def value(self) -> str:
+        """The Lua string value of the block (header comment plus source)."""
+        start = self.text.index("[===[\n") + len("[===[\n")
+        return self.text[start : len(self.text) - len(BLOCK_TERMINATOR) + 1]
+
 
 def iter_source_entries(root: Path) -> Iterable[Tuple[str, Path]]:
     src_root = root / "src"
@@ -34,45 +69,299 @@ def compute_digest(contents: str) -> str:
     return hashlib.sha1(contents.encode("utf-8")).hexdigest()
 
 
-def render_source_map(root: Path, output: Path) -> bool:
-    entries = list(iter_source_entries(root))
-    lines = ["-- Auto-generated source map for AutoParry tests", "return {"]
+def render_block(relative: str, source: str, digest: str) -> str:
+    header = f"-- {relative} (sha1: {digest})"
+    return f"    ['{relative}'] = [===[\n{header}\n{source}{BLOCK_TERMINATOR}"
 
-    for relative, path in entries:
+
+def parse_source_map(rendered: str) -> Dict[str, MapBlock]:
+    """Split an existing map into per-module blocks keyed by relative path.
+
+    Returns an empty mapping when the file does not follow the generated layout,
+    which makes the incremental path fall back to a full render.
+    """
+    if not rendered.startswith(MAP_PREAMBLE) or not rendered.endswith(MAP_EPILOGUE):
+        return {}
+
+    blocks: Dict[str, MapBlock] = {}
+    cursor = len(MAP_PREAMBLE)
+    limit = len(rendered) - len(MAP_EPILOGUE)
+    while cursor < limit:
+        match = BLOCK_HEADER_PATTERN.match(rendered, cursor)
+        if not match:
+            return {}
+        end = rendered.find(BLOCK_TERMINATOR, match.end() - 1)
+        if end < 0:
+            return {}
+        end += len(BLOCK_TERMINATOR)
+        relative = match.group("relative")
+        blocks[relative] = MapBlock(relative, match.group("digest"), rendered[cursor:end])
+        cursor = end
+    return blocks
+
+
+def chunk_name(relative: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]", "_", relative)
+
+
+def render_chunk(relative: str, digest: str, value: str) -> str:
+    return (
+        f"-- Auto-generated source map chunk for {relative} (sha1: {digest})\n"
+        f"return [===[\n{value}]===]\n"
+    )
+
+
+def render_chunk_index(entries: Sequence[Tuple[str, str]]) -> str:
+    lines = [
+        "-- Auto-generated source map index for AutoParry tests",
+        "return {",
+        f"    version = {CHUNK_INDEX_VERSION},",
+        "    modules = {",
+    ]
+    for relative, digest in entries:
+        lines.append(
+            f"        ['{relative}'] = {{ chunk = '{chunk_name(relative)}', sha1 = '{digest}' }},"
+        )
+    lines.extend(["    },", "}"])
+    return "\n".join(lines) + "\n"
+
+
+def write_source_chunks(chunk_dir: Path, blocks: Sequence[MapBlock], *, check: bool = False) -> bool:
+    """Emit a compact index plus one ``return [===[...]===]`` chunk per module.
+
+    Chunks whose digest already matches the existing index are left untouched,
+    and chunk files for modules no longer in the map are removed, so the
+    directory is patched rather than rewritten.
+    """
+    index_path = chunk_dir / CHUNK_INDEX_NAME
+    try:
+        existing_index = index_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        existing_index = None
+
+    recorded: Dict[str, str] = {}
+    if existing_index is not None:
+        for match in CHUNK_INDEX_ENTRY_PATTERN.finditer(existing_index):
+            recorded[match.group("relative")] = match.group("digest")
+
+    changed = False
+    expected_files = {CHUNK_INDEX_NAME}
+    for block in blocks:
+        filename = f"{chunk_name(block.relative)}.lua"
+        expected_files.add(filename)
+        chunk_path = chunk_dir / filename
+        if recorded.get(block.relative) == block.digest and chunk_path.exists():
+            continue
+        changed = True
+        if not check:
+            chunk_dir.mkdir(parents=True, exist_ok=True)
+            chunk_path.write_text(
+                render_chunk(block.relative, block.digest, block.value), encoding="utf-8"
+            )
+
+    if chunk_dir.exists():
+        for stale in chunk_dir.glob("*.lua"):
+            if stale.name in expected_files:
+                continue
+            changed = True
+            if not check:
+                stale.unlink()
+
+    rendered_index = render_chunk_index([(block.relative, block.digest) for block in blocks])
+    if rendered_index != existing_index:
+        changed = True
+        if not check:
+            chunk_dir.mkdir(parents=True, exist_ok=True)
+            index_path.write_text(rendered_index, encoding="utf-8")
+
+    return changed
+
+
+def load_stat_cache(path: Optional[Path]) -> Dict[str, Dict[str, object]]:
+    if path is None:
+        return {}
+    try:
         with path.open("r", encoding="utf-8") as handle:
-            source = handle.read()
-        digest = compute_digest(source)
-        header = f"-- {relative} (sha1: {digest})"
-        lines.append(f"    ['{relative}'] = [===[\n{header}\n{source}\n]===],")
+            payload = json.load(handle)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != STAT_CACHE_VERSION:
+        return {}
+    files = payload.get("files")
+    return files if isinstance(files, dict) else {}
 
-    lines.append("}")
-    rendered = "\n".join(lines) + "\n"
 
+def save_stat_cache(path: Optional[Path], files: Dict[str, Dict[str, object]]) -> None:
+    if path is None:
+        return
     try:
-        existing = output.read_text(encoding="utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as handle:
+            json.dump({"version": STAT_CACHE_VERSION, "files": files}, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+    except OSError as err:
+        print(f"[generate-source-map] Failed to write stat cache {path}: {err}")
+
+
+def _read_existing(output: Path) -> Optional[str]:
+    try:
+        return output.read_text(encoding="utf-8")
     except FileNotFoundError:
-        existing = None
+        return None
 
+
+def _write_if_changed(output: Path, rendered: str, existing: Optional[str], check: bool) -> bool:
     if existing == rendered:
         return False
-
-    output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(rendered, encoding="utf-8")
+    if not check:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(rendered, encoding="utf-8")
     return True
 
 
-def main() -> None:
+def render_source_map(
+    root: Path, output: Path, *, check: bool = False, chunk_dir: Optional[Path] = None
+) -> bool:
+    entries = list(iter_source_entries(root))
+    blocks: List[MapBlock] = []
+
+    for relative, path in entries:
+        with path.open("r", encoding="utf-8") as handle:
+            source = handle.read()
+        digest = compute_digest(source)
+        blocks.append(MapBlock(relative, digest, render_block(relative, source, digest)))
+
+    rendered = MAP_PREAMBLE + "".join(block.text for block in blocks) + MAP_EPILOGUE
+    changed = _write_if_changed(output, rendered, _read_existing(output), check)
+    if chunk_dir is not None:
+        changed = write_source_chunks(chunk_dir, blocks, check=check) or changed
+    return changed
+
+
+def render_source_map_incremental(
+    root: Path,
+    output: Path,
+    *,
+    stat_cache: Optional[Path] = None,
+    check: bool = False,
+    chunk_dir: Optional[Path] = None,
+) -> Tuple[bool, List[str]]:
+    """Refresh only the map blocks whose source changed.
+
+    Files whose ``(size, mtime_ns)`` match the stat cache and whose recorded
+    digest still matches the block header are not read at all; everything else
+    is re-hashed, and only blocks with a different digest are re-rendered. The
+    untouched blocks are spliced back verbatim from the existing map.
+
+    Returns whether the map changed and the relative paths that were refreshed.
+    """
+    entries = list(iter_source_entries(root))
+    existing = _read_existing(output)
+    existing_blocks = parse_source_map(existing) if existing is not None else {}
+    cached_stats = load_stat_cache(stat_cache)
+    next_stats: Dict[str, Dict[str, object]] = {}
+
+    blocks: List[MapBlock] = []
+    refreshed: List[str] = []
+    for relative, path in entries:
+        stat = path.stat()
+        previous = existing_blocks.get(relative)
+        cached = cached_stats.get(relative)
+        if (
+            previous is not None
+            and isinstance(cached, dict)
+            and cached.get("size") == stat.st_size
+            and cached.get("mtime_ns") == stat.st_mtime_ns
+            and cached.get("sha1") == previous.digest
+        ):
+            blocks.append(previous)
+            next_stats[relative] = cached
+            continue
+
+        with path.open("r", encoding="utf-8") as handle:
+            source = handle.read()
+        digest = compute_digest(source)
+        next_stats[relative] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha1": digest}
+        if previous is not None and previous.digest == digest:
+            blocks.append(previous)
+            continue
+
+        blocks.append(MapBlock(relative, digest, render_block(relative, source, digest)))
+        refreshed.append(relative)
+
+    chunks_changed = (
+        write_source_chunks(chunk_dir, blocks, check=check) if chunk_dir is not None else False
+    )
+
+    if existing is not None and not refreshed and list(existing_blocks) == [
+        relative for relative, _ in entries
+    ]:
+        if not check:
+            save_stat_cache(stat_cache, next_stats)
+        return chunks_changed, []
+
+    rendered = MAP_PREAMBLE + "".join(block.text for block in blocks) + MAP_EPILOGUE
+    changed = _write_if_changed(output, rendered, existing, check) or chunks_changed
+    if not check:
+        save_stat_cache(stat_cache, next_stats)
+    return changed, refreshed
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("root", type=Path, help="Repository root containing src/")
     parser.add_argument("output", type=Path, help="Destination AutoParrySourceMap.lua path")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse unchanged blocks from the existing map and only re-hash files whose size or mtime moved.",
+    )
+    parser.add_argument(
+        "--stat-cache",
+        type=Path,
+        default=None,
+        help=f"Stat cache used by --incremental (default: <root>/{DEFAULT_STAT_CACHE.as_posix()}).",
+    )
+    parser.add_argument(
+        "--chunks",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Also emit a lazy-loadable index.lua plus one chunk module per source into DIR.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with status 1 when the map is out of date instead of writing it.",
+    )
+    args = parser.parse_args(argv)
+
+    root = args.root.resolve()
+    output = args.output.resolve()
+    chunk_dir = args.chunks.resolve() if args.chunks is not None else None
+    if args.incremental:
+        stat_cache = (args.stat_cache or root / DEFAULT_STAT_CACHE).resolve()
+        changed, refreshed = render_source_map_incremental(
+            root, output, stat_cache=stat_cache, check=args.check, chunk_dir=chunk_dir
+        )
+        detail = f" (refreshed {', '.join(refreshed)})" if refreshed else ""
+    else:
+        changed = render_source_map(root, output, check=args.check, chunk_dir=chunk_dir)
+        detail = ""
+
+    if args.check:
+        if changed:
+            print(f"[generate-source-map] Out of date: {args.output}{detail}")
+            return 1
+        print(f"[generate-source-map] Up to date: {args.output}")
+        return 0
 
-    changed = render_source_map(args.root.resolve(), args.output.resolve())
     if changed:
-        print(f"[generate-source-map] Wrote {args.output}")
+        print(f"[generate-source-map] Wrote {args.output}{detail}")
     else:
         print(f"[generate-source-map] Up to date: {args.output}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""Load binary engine traces written by ``Exporter.encodeBinaryTrace``.
+
+The file is memory-mapped and every varint section is decoded in bulk with
+NumPy, so multi-megabyte traces load without a JSON parse or a Python loop per
+value. Rows come back as flat arrays (one row per entity per step) with a
+``step`` array mapping each row to its step index.
+
+Example usage:
+    python tests/tools/read_binary_trace.py tests/artifacts/engine/telemetry/run-trace.bin
+    python tests/tools/read_binary_trace.py run-trace.bin --json run-trace.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import struct
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+MAGIC = b"APTB"
+SUPPORTED_VERSION = 1
+HEADER = struct.Struct("<4sBddd")
+ROW_WIDTH = 7
+
+
+@dataclass
+class EntityRows:
+    """Kinematic rows for one entity kind (agents or projectiles)."""
+
+    names: List[str]
+    step: "np.ndarray"
+    entity: "np.ndarray"
+    position: "np.ndarray"
+    velocity: "np.ndarray"
+    contact: Optional["np.ndarray"] = None
+
+    def for_entity(self, name: str) -> "EntityRows":
+        """Return the rows recorded for ``name`` only."""
+        index = self.names.index(name) + 1
+        mask = self.entity == index
+        return EntityRows(
+            names=[name],
+            step=self.step[mask],
+            entity=self.entity[mask],
+            position=self.position[mask],
+            velocity=self.velocity[mask],
+            contact=None if self.contact is None else self.contact[mask],
+        )
+
+
+@dataclass
+class BinaryTrace:
+    version: int
+    time: "np.ndarray"
+    agents: EntityRows
+    projectiles: EntityRows
+    rule_names: List[str] = field(default_factory=list)
+    rules: Optional[List[Any]] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+    def to_json_trace(self) -> Dict[str, Any]:
+        """Rebuild the JSON trace layout produced by ``Exporter.buildTrace``."""
+        steps: List[List[Any]] = [[float(t), [], [], []] for t in self.time]
+        for row in range(len(self.agents.step)):
+            steps[self.agents.step[row]][1].append(
+                [int(self.agents.entity[row]), *self.agents.position[row].tolist(), *self.agents.velocity[row].tolist()]
+            )
+        contact = self.projectiles.contact
+        for row in range(len(self.projectiles.step)):
+            steps[self.projectiles.step[row]][2].append(
+                [
+                    int(self.projectiles.entity[row]),
+                    *self.projectiles.position[row].tolist(),
+                    *self.projectiles.velocity[row].tolist(),
+                    int(contact[row]) if contact is not None else 0,
+                ]
+            )
+        if self.rules is not None:
+            for index, entries in enumerate(self.rules):
+                steps[index][3] = entries
+
+        trace: Dict[str, Any] = {"version": 1, "steps": steps}
+        if self.agents.names:
+            trace["agents"] = self.agents.names
+        if self.projectiles.names:
+            trace["projectiles"] = self.projectiles.names
+        if self.rule_names:
+            trace["rules"] = self.rule_names
+        if self.metadata is not None:
+            trace["metadata"] = self.metadata
+        return trace
+
+
+class _Cursor:
+    def __init__(self, data: mmap.mmap, offset: int) -> None:
+        self.data = data
+        self.offset = offset
+
+    def varint(self) -> int:
+        value = 0
+        shift = 0
+        while True:
+            byte = self.data[self.offset]
+            self.offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def span(self) -> Tuple[int, int]:
+        length = self.varint()
+        start = self.offset
+        self.offset += length
+        return start, length
+
+    def text(self) -> str:
+        start, length = self.span()
+        return bytes(self.data[start : start + length]).decode("utf-8")
+
+    def names(self) -> List[str]:
+        return [self.text() for _ in range(self.varint())]
+
+
+def decode_varints(data: "np.ndarray") -> "np.ndarray":
+    """Decode a contiguous run of LEB128 varints into ``uint64`` values."""
+    if data.size == 0:
+        return np.zeros(0, dtype=np.uint64)
+    ends = np.flatnonzero(data < 0x80)
+    if ends.size == 0 or ends[-1] != data.size - 1:
+        raise ValueError("truncated varint section")
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    # Varint groups never overlap bit ranges, so summing the shifted 7-bit
+    # payloads per group is equivalent to OR-ing them together.
+    position = np.arange(data.size) - np.repeat(starts, ends - starts + 1)
+    shifted = (data & 0x7F).astype(np.uint64) << (position * 7).astype(np.uint64)
+    return np.add.reduceat(shifted, starts)
+
+
+def unzigzag(values: "np.ndarray") -> "np.ndarray":
+    return (values >> np.uint64(1)).astype(np.int64) ^ -(values & np.uint64(1)).astype(np.int64)
+
+
+def _section(data: mmap.mmap, cursor: _Cursor) -> "np.ndarray":
+    start, length = cursor.span()
+    return decode_varints(np.frombuffer(data, dtype=np.uint8, count=length, offset=start))
+
+
+def _rows(
+    names: List[str],
+    counts: "np.ndarray",
+    values: "np.ndarray",
+    quanta: Sequence[float],
+    packed_contact: bool,
+) -> EntityRows:
+    rows = values.reshape(-1, ROW_WIDTH)
+    head = rows[:, 0]
+    if packed_contact:
+        entity = (head >> np.uint64(1)).astype(np.int64)
+        contact: Optional["np.ndarray"] = (head & np.uint64(1)).astype(np.bool_)
+    else:
+        entity = head.astype(np.int64)
+        contact = None
+
+    # Kinematics are stored as per-entity deltas; a stable sort groups each
+    # entity's rows in recording order so one running sum restores them once
+    # the total carried in from the previous group is subtracted.
+    deltas = unzigzag(rows[:, 1:])
+    order = np.argsort(entity, kind="stable")
+    totals = np.cumsum(deltas[order], axis=0)
+    quantised = np.empty_like(totals)
+    if totals.size:
+        first_rows = np.concatenate(([True], np.diff(entity[order]) != 0))
+        group = np.cumsum(first_rows) - 1
+        carried = np.vstack((np.zeros((1, totals.shape[1]), dtype=totals.dtype), totals))[np.flatnonzero(first_rows)]
+        quantised[order] = totals - carried[group]
+
+    scale = np.asarray(quanta, dtype=np.float64)
+    kinematics = quantised.astype(np.float64) * scale
+    return EntityRows(
+        names=names,
+        step=np.repeat(np.arange(counts.size), counts.astype(np.int64)),
+        entity=entity,
+        position=kinematics[:, :3],
+        velocity=kinematics[:, 3:],
+        contact=contact,
+    )
+
+
+def load_binary_trace(path: Path) -> BinaryTrace:
+    if np is None:
+        raise RuntimeError("numpy is required to read binary traces (pip install numpy)")
+
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        magic, version, time_quantum, position_quantum, velocity_quantum = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a binary trace")
+        if version != SUPPORTED_VERSION:
+            raise ValueError(f"{path} uses unsupported binary trace version {version}")
+
+        cursor = _Cursor(data, HEADER.size)
+        step_count = cursor.varint()
+        agent_rows = cursor.varint()
+        projectile_rows = cursor.varint()
+        agent_names = cursor.names()
+        projectile_names = cursor.names()
+        rule_names = cursor.names()
+        metadata_text = cursor.text()
+
+        times = _section(data, cursor)
+        agent_counts = _section(data, cursor)
+        agent_values = _section(data, cursor)
+        projectile_counts = _section(data, cursor)
+        projectile_values = _section(data, cursor)
+        rules_text = cursor.text()
+
+    if times.size != step_count or agent_values.size != agent_rows * ROW_WIDTH:
+        raise ValueError(f"{path} is truncated or corrupt")
+    if projectile_values.size != projectile_rows * ROW_WIDTH:
+        raise ValueError(f"{path} is truncated or corrupt")
+
+    quanta = (position_quantum,) * 3 + (velocity_quantum,) * 3
+    return BinaryTrace(
+        version=version,
+        time=np.cumsum(unzigzag(times)).astype(np.float64) * time_quantum,
+        agents=_rows(agent_names, agent_counts, agent_values, quanta, packed_contact=False),
+        projectiles=_rows(projectile_names, projectile_counts, projectile_values, quanta, packed_contact=True),
+        rule_names=rule_names,
+        rules=json.loads(rules_text) if rules_text else None,
+        metadata=json.loads(metadata_text) if metadata_text else None,
+    )
+
+
+def iter_steps(trace: BinaryTrace) -> Iterator[Tuple[float, EntityRows, EntityRows]]:
+    """Yield ``(time, agents, projectiles)`` per step as array views."""
+    agent_bounds = np.searchsorted(trace.agents.step, np.arange(trace.time.size + 1))
+    projectile_bounds = np.searchsorted(trace.projectiles.step, np.arange(trace.time.size + 1))
+
+    def window(rows: EntityRows, start: int, stop: int) -> EntityRows:
+        return EntityRows(
+            names=rows.names,
+            step=rows.step[start:stop],
+            entity=rows.entity[start:stop],
+            position=rows.position[start:stop],
+            velocity=rows.velocity[start:stop],
+            contact=None if rows.contact is None else rows.contact[start:stop],
+        )
+
+    for index, value in enumerate(trace.time):
+        yield (
+            float(value),
+            window(trace.agents, agent_bounds[index], agent_bounds[index + 1]),
+            window(trace.projectiles, projectile_bounds[index], projectile_bounds[index + 1]),
+        )
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path, help="Binary trace (*-trace.bin) to load")
+    parser.add_argument("--json", type=Path, help="Also write the trace back out in the JSON trace layout")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    try:
+        trace = load_binary_trace(args.path)
+    except (OSError, ValueError, RuntimeError) as exc:
+        print(f"[read-binary-trace] {exc}", file=sys.stderr)
+        return 1
+
+    duration = float(trace.time[-1] - trace.time[0]) if trace.time.size else 0.0
+    print(
+        f"[read-binary-trace] {args.path}: {trace.time.size} steps over {duration:.3f}s, "
+        f"{len(trace.agents.names)} agents ({trace.agents.step.size} rows), "
+        f"{len(trace.projectiles.names)} projectiles ({trace.projectiles.step.size} rows)"
+    )
+
+    if args.json:
+        args.json.write_text(json.dumps(trace.to_json_trace()))
+        print(f"[read-binary-trace] wrote {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())